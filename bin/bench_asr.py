@@ -0,0 +1,64 @@
+# bench_asr.py — compare ASR backends over a local corpus
+#
+# Usage: python bin/bench_asr.py <corpus_dir> [--backends whisper-tiny whisper-base google] [--standin]
+#
+# The corpus is a directory of audio/video files; a .txt file with the same
+# stem holds the reference transcript used for WER. With --standin the
+# Google backend talks to a local stand-in server instead of Google, so the
+# whole run works offline.
+
+import os
+import sys
+import json
+import argparse
+
+# === Load from local utils ===
+current_dir = os.path.dirname(os.path.abspath(__file__))
+lib_path = os.path.join(current_dir, "../lib")
+sys.path.append(lib_path)
+
+from video_utils import initialize_logging
+from mimesis.asr import GOOGLE_NAMES
+from mimesis.bench import benchmark_backends, load_corpus
+from mimesis.standin import StandinSpeechServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ASR backends over a local corpus.")
+    parser.add_argument("corpus", help="Directory of media files (+ optional .txt references)")
+    parser.add_argument("--backends", nargs="+", default=["whisper-tiny", "whisper-base", "google"])
+    parser.add_argument("--window", type=float, default=30, help="Seconds of audio per recognizer call")
+    parser.add_argument("--standin", action="store_true", help="Serve Google requests from a local stand-in")
+    parser.add_argument("--standin-latency", type=float, default=0.3, help="Stand-in response time in seconds")
+    parser.add_argument("--json", help="Also write the rows to this file")
+    args = parser.parse_args()
+
+    initialize_logging(log_name="bench_asr")
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        sys.exit(f"No media files found in {args.corpus}")
+
+    # Whisper results must not come from the transcript cache
+    options = {name: {"use_cache": False} for name in args.backends if name not in GOOGLE_NAMES}
+    server = StandinSpeechServer(latency=args.standin_latency).start() if args.standin else None
+    try:
+        if server:
+            options.update({name: {"endpoint": server.url} for name in args.backends if name in GOOGLE_NAMES})
+        rows = benchmark_backends(args.backends, corpus, options, window_seconds=args.window)
+    finally:
+        if server:
+            server.stop()
+
+    print(f"{'backend':<16} {'file':<28} {'RTF':>7} {'1st seg':>8} {'RSS MB':>8} {'WER':>7}")
+    for row in rows:
+        wer = "-" if row["wer"] is None else f"{row['wer']:.2%}"
+        first = "-" if row["first_segment_seconds"] is None else row["first_segment_seconds"]
+        print(f"{row['backend']:<16} {row['file'][:28]:<28} {row['rtf']:>7} {first:>8} {row['peak_rss_mb']:>8} {wer:>7}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
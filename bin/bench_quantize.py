@@ -0,0 +1,47 @@
+# bench_quantize.py — float32 vs int8 Whisper on CPU
+#
+# Usage: python bin/bench_quantize.py <media> [--reference transcript.txt] [--model base]
+#
+# Reports real-time factor for each mode and, given a reference transcript,
+# the word error rate of each against it.
+
+import os
+import sys
+import json
+import argparse
+
+# === Load from local utils ===
+current_dir = os.path.dirname(os.path.abspath(__file__))
+lib_path = os.path.join(current_dir, "../lib")
+sys.path.append(lib_path)
+
+from video_utils import initialize_logging
+from mimesis.audio import load_audio
+from mimesis.bench import benchmark_quantization
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare float32 and int8 Whisper on CPU.")
+    parser.add_argument("media", help="Audio or video sample")
+    parser.add_argument("--reference", help="Text file with the ground-truth transcript")
+    parser.add_argument("--model", default="base", help="Whisper model size (default: base)")
+    parser.add_argument("--language", help="Skip language detection")
+    args = parser.parse_args()
+
+    initialize_logging(log_name="bench_quantize")
+    audio = load_audio(args.media)
+    reference = None
+    if args.reference:
+        with open(args.reference, "r", encoding="utf-8") as f:
+            reference = f.read()
+
+    rows = benchmark_quantization(audio, reference, model_name=args.model, language=args.language)
+    print(f"{'mode':<8} {'seconds':>8} {'RTF':>7} {'WER':>7}")
+    for row in rows:
+        wer = "-" if row["wer"] is None else f"{row['wer']:.2%}"
+        print(f"{row['mode']:<8} {row['seconds']:>8} {row['rtf']:>7} {wer:>7}")
+    print(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
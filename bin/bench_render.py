@@ -0,0 +1,48 @@
+# bench_render.py — moviepy compositing vs. native ffmpeg / GStreamer clip rendering
+#
+# Usage: python bin/bench_render.py [--media talk.mp4] [--clips 8] [--clip 10]
+#
+# Without --media a 10-minute 720p test video is generated once in ./data/.
+# Every renderer writes the same captioned clips; compare the wall times.
+
+import os
+import sys
+import argparse
+
+# === Load from local utils ===
+current_dir = os.path.dirname(os.path.abspath(__file__))
+lib_path = os.path.join(current_dir, "../lib")
+sys.path.append(lib_path)
+
+from video_utils import initialize_logging
+from mimesis.audio import probe_duration
+from mimesis.bench import benchmark_renderers, generate_test_media
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the moviepy and ffmpeg clip renderers.")
+    parser.add_argument("--media", help="Source video (default: generate a 10-minute test file)")
+    parser.add_argument("--clips", type=int, default=8, help="Number of clips")
+    parser.add_argument("--clip", type=float, default=10, help="Clip length in seconds")
+    parser.add_argument("--renderers", nargs="+", default=["moviepy", "ffmpeg", "ffmpeg-batch"],
+                        help="Any of moviepy, ffmpeg, ffmpeg-batch, gstreamer")
+    args = parser.parse_args()
+
+    initialize_logging(log_name="bench_render")
+    media = args.media or generate_test_media(
+        os.path.join(current_dir, "../data/bench_10m_720p.mp4"), seconds=600, size="1280x720", rate=30
+    )
+
+    duration = probe_duration(media)
+    step = max(args.clip, (duration - args.clip) / max(args.clips, 1))
+    clips = [(i * step, i * step + args.clip, f"Caption number {i + 1}") for i in range(args.clips)]
+    clips = [clip for clip in clips if clip[1] <= duration]
+
+    rows = benchmark_renderers(media, clips, args.renderers)
+    print(f"{'renderer':<14} {'seconds':>9} {'clips':>6} {'MB':>7}")
+    for row in rows:
+        print(f"{row['renderer']:<14} {row['seconds']:>9.2f} {row['ok']:>6} {row['output_mb']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
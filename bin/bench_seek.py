@@ -0,0 +1,42 @@
+# bench_seek.py — clip audio extraction cost vs. offset into a long video
+#
+# Usage: python bin/bench_seek.py [--media two_hours.mp4] [--clip 10] [--methods moviepy ffmpeg pyav]
+#
+# Without --media a two-hour test video is generated once in ./data/.
+# With input seeking the time per clip should stay flat as the offset grows;
+# the old moviepy subclip export grows with it.
+
+import os
+import sys
+import argparse
+
+# === Load from local utils ===
+current_dir = os.path.dirname(os.path.abspath(__file__))
+lib_path = os.path.join(current_dir, "../lib")
+sys.path.append(lib_path)
+
+from video_utils import initialize_logging
+from mimesis.bench import benchmark_seek, generate_test_media
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark clip audio extraction at increasing offsets.")
+    parser.add_argument("--media", help="Long media file (default: generate a 2-hour test file)")
+    parser.add_argument("--clip", type=float, default=10, help="Clip length in seconds")
+    parser.add_argument("--offsets", type=float, nargs="+", default=[0, 900, 1800, 3600, 5400, 7000])
+    parser.add_argument("--methods", nargs="+", default=["moviepy", "ffmpeg", "pyav"])
+    args = parser.parse_args()
+
+    initialize_logging(log_name="bench_seek")
+    media = args.media or generate_test_media(os.path.join(current_dir, "../data/bench_2h.mp4"))
+
+    rows = benchmark_seek(media, args.offsets, args.clip, args.methods)
+    methods = [m for m in args.methods if any(row["method"] == m for row in rows)]
+    print(f"{'offset s':>9} " + " ".join(f"{m:>9}" for m in methods))
+    for offset in args.offsets:
+        times = {row["method"]: row["seconds"] for row in rows if row["offset"] == offset}
+        print(f"{offset:>9.0f} " + " ".join(f"{times.get(m, '-'):>9}" for m in methods))
+
+
+if __name__ == "__main__":
+    main()
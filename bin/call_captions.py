@@ -2,7 +2,7 @@ import os
 import sys
 import json
 import logging
-import tempfile
+import argparse
 from datetime import datetime
 from urllib.parse import urlparse
 from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip
@@ -17,8 +17,8 @@ sys.path.append(lib_path)
 from video_utils import (
     initialize_logging,
     load_app_config,
-    extract_audio_from_video,
-    transcribe_audio,
+    transcribe_range,
+    write_video,
 )
 
 
@@ -46,13 +46,14 @@ moviepy_config = {
 # ==================================================
 # MAIN
 # ==================================================
-if len(sys.argv) < 2:
-    print("Usage: python call_captions.py <video_path>")
-    sys.exit(1)
-
+parser = argparse.ArgumentParser(description="Burn transcribed captions into a video's clips.")
+parser.add_argument("video_path")
+parser.add_argument("--renderer", choices=["moviepy", "ffmpeg"], default="moviepy",
+                    help="moviepy compositing or native ffmpeg drawtext (see mimesis.render)")
+args = parser.parse_args()
 
 # Validate video path argument
-video_path = sys.argv[1]
+video_path = args.video_path
 video_name = os.path.basename(video_path).replace(".mp4", "")
 json_path = os.path.join("metadata", f"{video_name}.json")
 
@@ -84,6 +85,7 @@ logger.info(f"🧩 Found {len(clips)} clips in metadata. Starting caption overla
 output_dir = metadata.get("output_dir") or moviepy_config["clips_directory"]
 
 # Process each clip
+caption_jobs = []
 for clip in clips:
     clip_name = clip["name"]
     clip_file = os.path.join(output_dir, f"{clip_name}.mp4")
@@ -95,19 +97,21 @@ for clip in clips:
 
     logger.info(f"🎬 Processing clip: {clip_file}")
 
-    # Create a temporary file for audio extraction
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio:
-        temp_audio_path = temp_audio.name
-
     try:
-        # Extract audio from video and transcribe it
-        extract_audio_from_video(clip_file, 0, None, temp_audio_path)
-        transcription = transcribe_audio(temp_audio_path)
-        os.remove(temp_audio_path)
+        # Slice the clip's range from the source video's audio sidecar when known
+        if "start" in clip and "end" in clip and os.path.exists(video_path):
+            transcription = transcribe_range(video_path, clip["start"], clip["end"])
+        else:
+            transcription = transcribe_range(clip_file)
 
         if not transcription:
             transcription = clip.get("text", "(No transcription)")
 
+        if args.renderer == "ffmpeg":
+            # Rendered together below, under one core budget
+            caption_jobs.append((clip_file, transcription, output_captioned))
+            continue
+
         # Create the video with the caption overlay
         clip_video = VideoFileClip(clip_file)
         txt_clip = TextClip(transcription, fontsize=moviepy_config["font_size"],
@@ -116,10 +120,19 @@ for clip in clips:
         txt_clip = txt_clip.set_duration(clip_video.duration)
 
         final = CompositeVideoClip([clip_video, txt_clip])
-        final.write_videofile(output_captioned, codec="libx264", audio_codec="aac")
+        write_video(final, output_captioned, codec="libx264", audio_codec="aac")
 
         logger.info(f"✅ Captioned clip saved: {output_captioned}")
 
     except Exception as e:
         logger.error(f"❌ Failed to process {clip_file}: {e}")
         continue
+
+if caption_jobs:
+    from mimesis.render import caption_files, caption_style
+
+    for result in caption_files(caption_jobs, caption_style(moviepy_config)):
+        if result["ok"]:
+            logger.info(f"✅ Captioned clip saved: {result['output']} ({result['seconds']:.1f}s)")
+        else:
+            logger.error(f"❌ Failed to process {result['output']}: {result['error']}")
@@ -84,7 +84,8 @@ with open(captions_config_path, "r") as f:
     captions_config = yaml.safe_load(f)
 
 # Call the part that creates clips first
-process_clips_moviepy(app_config, clips, logger, input_video, output_dir, captions_config)
+renderer = app_config.get("clip_render", {}).get("renderer", "moviepy")
+process_clips_moviepy(app_config, clips, logger, input_video, output_dir, captions_config, renderer=renderer)
 
 # THEN do captioning (if needed, or if it's a separate pass)
 process_clips_with_captions(app_config, clips, logger, input_video, output_dir)
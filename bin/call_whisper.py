@@ -2,6 +2,7 @@
 
 import sys
 import json
+import argparse
 import os
 import logging
 import tempfile
@@ -24,10 +25,9 @@ from tasks_lib import get_task_states, find_url_json
 
 
 from transcription_utils import (
-    whisper_transcribe_full_video,
-    whisper_transcribe_video_by_minute,
-   
+    whisper_transcribe_artifacts,
 )
+from mimesis.streaming import stream_transcribe
 
 from video_utils import (
     initialize_logging,
@@ -40,27 +40,44 @@ from video_utils import (
 # Initialize the logger
 logger = initialize_logging()
 
-# === CLI Entry Point ===
-if len(sys.argv) < 2:
-    print("Usage: python call_whisper_transcribe.py <input_video>")
-    sys.exit(1)
-
-input_video = sys.argv[1]
-config = load_app_config()
-
-# === Full Video Transcription (Whisper) ===
-print("\n=== Transcribing full video with Whisper ===")
-full_transcript = whisper_transcribe_full_video(input_video)
-full_outfile = input_video.replace(".mp4", ".full.txt")
-with open(full_outfile, "w") as f:
-    f.write(full_transcript)
-print(f"📝 Full transcript saved to {full_outfile}")
-
-# === Minute-by-Minute Transcription (Whisper) ===
-print("\n=== Transcribing by minute with Whisper ===")
-minute_transcript = whisper_transcribe_video_by_minute(input_video)
-minute_outfile = input_video.replace(".mp4", ".minute.json")
-with open(minute_outfile, "w") as f:
-    json.dump(minute_transcript, f, indent=2)
-print(f"📝 Minute transcript saved to {minute_outfile}")
-
+# === Main ===
+
+def main():
+    # === CLI Entry Point ===
+    # Usage: python call_whisper.py <input_video> [--workers N] [--stream] [--resume]
+    parser = argparse.ArgumentParser(description="Transcribe a video with Whisper.")
+    parser.add_argument("input_video")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for parallel chunk transcription (default: 1)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write SRT/VTT/JSON progressively, window by window")
+    parser.add_argument("--resume", action="store_true",
+                        help="Checkpoint finished chunks and resume an interrupted run")
+    args = parser.parse_args()
+
+    input_video = args.input_video
+    config = load_app_config()
+
+    if args.stream:
+        print("\n=== Streaming transcription with Whisper ===")
+        streamed = stream_transcribe(input_video, checkpoint=args.resume)
+        for kind, path in streamed["paths"].items():
+            print(f"📝 {kind} transcript saved to {path}")
+        return
+
+    # === Single-pass Transcription (Whisper) ===
+    print("\n=== Transcribing video with Whisper ===")
+    artifacts = whisper_transcribe_artifacts(input_video, workers=args.workers, checkpoint=args.resume)
+    full_outfile = input_video.replace(".mp4", ".full.txt")
+    with open(full_outfile, "w") as f:
+        f.write(artifacts["text"])
+    print(f"📝 Full transcript saved to {full_outfile}")
+
+    minute_outfile = input_video.replace(".mp4", ".minute.json")
+    with open(minute_outfile, "w") as f:
+        json.dump(artifacts["minute"], f, indent=2)
+    print(f"📝 Minute transcript saved to {minute_outfile}")
+
+
+if __name__ == "__main__":
+    main()
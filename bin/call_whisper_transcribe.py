@@ -5,6 +5,7 @@
 
 import sys
 import json
+import argparse
 import os
 import logging
 import traceback
@@ -21,11 +22,8 @@ lib_path = os.path.join(current_dir, "../lib")
 sys.path.append(lib_path)
 
 from transcription_utils import (
-    whisper_transcribe_full_video,
-    whisper_transcribe_video_by_minute,
+    whisper_transcribe_artifacts,
     distill_run_snapshot,
-    write_srt,
-    write_vtt,
     extract_editorial_content,
     slugify_url,
     get_text_with_italics,
@@ -46,11 +44,13 @@ logger = initialize_logging()
 # === Main ===
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python call_whisper_transcribe.py <input_video>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Transcribe a video and scrape its source articles.")
+    parser.add_argument("input_video")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for parallel chunk transcription (default: 1)")
+    args = parser.parse_args()
 
-    input_video = sys.argv[1]
+    input_video = args.input_video
     config = load_app_config()
 
     base_output_dir = create_subdir(base_dir="sources", subdir_name="mimesis")
@@ -59,30 +59,14 @@ def main():
     logger.info(f"Base output directory: {base_output_dir}")
     logger.info(f"Article subdir: {article_dir}")
 
-    video_stem = os.path.splitext(os.path.basename(input_video))[0]
-    full_outfile = os.path.join(base_output_dir, f"{video_stem}.full.txt")
-    minute_outfile = os.path.join(base_output_dir, f"{video_stem}.minute.json")
-
-    # === Transcribe full video ===
-    logger.info("Starting full video transcription...")
-    try:
-        full_transcript = whisper_transcribe_full_video(input_video)
-        with open(full_outfile, "w") as f:
-            f.write(full_transcript)
-        logger.info(f"Full transcript saved to {full_outfile}")
-    except Exception:
-        logger.error("Failed full video transcription")
-        logger.debug(traceback.format_exc())
-
-    # === Transcribe by minute ===
-    logger.info("Starting minute-by-minute transcription...")
+    # === Transcribe once, derive full text, minute buckets, SRT, VTT and sentences ===
+    logger.info("Starting single-pass Whisper transcription...")
     try:
-        minute_transcript = whisper_transcribe_video_by_minute(input_video)
-        with open(minute_outfile, "w") as f:
-            json.dump(minute_transcript, f, indent=2)
-        logger.info(f"Minute-by-minute transcript saved to {minute_outfile}")
+        artifacts = whisper_transcribe_artifacts(input_video, base_output_dir, workers=args.workers)
+        for kind, path in artifacts["paths"].items():
+            logger.info(f"{kind} transcript saved to {path}")
     except Exception:
-        logger.error("Failed minute-by-minute transcription")
+        logger.error("Failed Whisper transcription")
         logger.debug(traceback.format_exc())
 
     # === Scrape Articles ===
@@ -119,25 +103,6 @@ def main():
         except Exception:
             logger.error(f"Failed to save output for {slug}")
             logger.debug(traceback.format_exc())
-    # === Generate SRT and VTT from Whisper segments ===
-    logger.info("Generating SRT and VTT subtitle files...")
-    try:
-        import whisper
-        model = whisper.load_model("base")  # or "medium"/"large" if you prefer
-        whisper_result = model.transcribe(input_video)
-        segments = whisper_result['segments']
-
-        srt_outfile = os.path.join(base_output_dir, f"{video_stem}.srt")
-        vtt_outfile = os.path.join(base_output_dir, f"{video_stem}.vtt")
-
-        write_srt(segments, srt_outfile)
-        write_vtt(segments, vtt_outfile)
-
-        logger.info("Subtitle files written successfully.")
-    except Exception:
-        logger.error("Failed to generate SRT/VTT subtitles")
-        logger.debug(traceback.format_exc())
-
     # === Create Snapshot ===
     logger.info("📦 Creating snapshot of run...")
     try:
@@ -6,6 +6,7 @@
 
 import sys
 import json
+import argparse
 import os
 import logging
 import tempfile
@@ -23,9 +24,7 @@ sys.path.append(lib_path)
 
 
 from transcription_utils import (
-    whisper_transcribe_full_video,
-    whisper_transcribe_video_by_minute,
-   
+    whisper_transcribe_artifacts,
 )
 
 from video_utils import (
@@ -40,38 +39,6 @@ from transcription_utils import distill_run_snapshot
 # Initialize the logger
 logger = initialize_logging()
 
-# === CLI Entry Point ===
-if len(sys.argv) < 2:
-    print("Usage: python call_whisper_transcribe.py <input_video>")
-    sys.exit(1)
-
-input_video = sys.argv[1]
-config = load_app_config()
-
-
-
-
-# === Set up output directories ===
-base_output_dir= create_subdir(base_dir="sources", subdir_name="mimesis")
-#base_output_dir = create_output_directory(input_video, config)
-article_dir = create_subdir(base_output_dir, "articles")
-
-# === Full Video Transcription (Whisper) ===
-print("\n=== Transcribing full video with Whisper ===")
-full_transcript = whisper_transcribe_full_video(input_video)
-full_outfile = input_video.replace(".mp4", ".full.txt")
-with open(full_outfile, "w") as f:
-    f.write(full_transcript)
-print(f"📝 Full transcript saved to {full_outfile}")
-
-# === Minute-by-Minute Transcription (Whisper) ===
-print("\n=== Transcribing by minute with Whisper ===")
-minute_transcript = whisper_transcribe_video_by_minute(input_video)
-minute_outfile = input_video.replace(".mp4", ".minute.json")
-with open(minute_outfile, "w") as f:
-    json.dump(minute_transcript, f, indent=2)
-print(f"📝 Minute transcript saved to {minute_outfile}")
-
 # === Editorial Content Scraping ===
 import requests
 from bs4 import BeautifulSoup
@@ -114,36 +81,70 @@ def get_text_with_italics(element):
 def slugify_url(url):
     return re.sub(r'\W+', '-', url.split("//")[-1].split("/")[0].replace("www.", "")).strip("-")
 
-urls = [
-    "https://www.deseret.com/2019/2/4/20664993/tim-ballard-i-ve-fought-sex-trafficking-at-the-border-this-is-why-we-need-a-wall/",
-    "https://www.foxnews.com/opinion/ive-fought-sex-trafficking-as-a-dhs-special-agent-we-need-to-build-the-wall-for-the-children",
-    "https://www.presidency.ucsb.edu/documents/remarks-meeting-human-trafficking-the-mexico-united-states-border-and-exchange-with?utm_source=chatgpt.com"
-]
 
-print("\n=== Scraping Articles ===")
-for url in urls:
-    print(f"→ {url}")
-    element = extract_editorial_content(url)
+# === Main ===
+
+def main():
+    # === CLI Entry Point ===
+    # Usage: python compare_sources.py <input_video> [--workers N]
+    parser = argparse.ArgumentParser(description="Transcribe a video with Whisper.")
+    parser.add_argument("input_video")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for parallel chunk transcription (default: 1)")
+    args = parser.parse_args()
+
+    input_video = args.input_video
+    config = load_app_config()
+
+    # === Set up output directories ===
+    base_output_dir= create_subdir(base_dir="sources", subdir_name="mimesis")
+    #base_output_dir = create_output_directory(input_video, config)
+    article_dir = create_subdir(base_output_dir, "articles")
+
+    # === Single-pass Transcription (Whisper) ===
+    print("\n=== Transcribing video with Whisper ===")
+    artifacts = whisper_transcribe_artifacts(input_video, workers=args.workers)
+    full_outfile = input_video.replace(".mp4", ".full.txt")
+    with open(full_outfile, "w") as f:
+        f.write(artifacts["text"])
+    print(f"📝 Full transcript saved to {full_outfile}")
+
+    minute_outfile = input_video.replace(".mp4", ".minute.json")
+    with open(minute_outfile, "w") as f:
+        json.dump(artifacts["minute"], f, indent=2)
+    print(f"📝 Minute transcript saved to {minute_outfile}")
+
+    urls = [
+        "https://www.deseret.com/2019/2/4/20664993/tim-ballard-i-ve-fought-sex-trafficking-at-the-border-this-is-why-we-need-a-wall/",
+        "https://www.foxnews.com/opinion/ive-fought-sex-trafficking-as-a-dhs-special-agent-we-need-to-build-the-wall-for-the-children",
+        "https://www.presidency.ucsb.edu/documents/remarks-meeting-human-trafficking-the-mexico-united-states-border-and-exchange-with?utm_source=chatgpt.com"
+    ]
+
+    print("\n=== Scraping Articles ===")
+    for url in urls:
+        print(f"→ {url}")
+        element = extract_editorial_content(url)
+
+        if not element:
+            print("❌ Failed to fetch.")
+            continue
+
+        slug = slugify_url(url)
+        plain_text = element.get_text("\n", strip=True)
+        italics = get_text_with_italics(element)
+        raw_html = element.prettify()
 
-    if not element:
-        print("❌ Failed to fetch.")
-        continue
+        with open(os.path.join(article_dir, f"{slug}.txt"), "w", encoding="utf-8") as f:
+            f.write(plain_text)
 
-    slug = slugify_url(url)
-    plain_text = element.get_text("\n", strip=True)
-    italics = get_text_with_italics(element)
-    raw_html = element.prettify()
+        with open(os.path.join(article_dir, f"{slug}-italics.txt"), "w", encoding="utf-8") as f:
+            f.write(italics)
 
-    with open(os.path.join(article_dir, f"{slug}.txt"), "w", encoding="utf-8") as f:
-        f.write(plain_text)
+        with open(os.path.join(article_dir, f"{slug}-html.txt"), "w", encoding="utf-8") as f:
+            f.write(raw_html)
 
-    with open(os.path.join(article_dir, f"{slug}-italics.txt"), "w", encoding="utf-8") as f:
-        f.write(italics)
+        print(f"   ✅ Saved to: {article_dir}/{slug}*.txt")
 
-    with open(os.path.join(article_dir, f"{slug}-html.txt"), "w", encoding="utf-8") as f:
-        f.write(raw_html)
 
-    print(f"   ✅ Saved to: {article_dir}/{slug}*.txt")
-    
 if __name__ == "__main__":
     main()
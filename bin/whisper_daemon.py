@@ -0,0 +1,39 @@
+# whisper_daemon.py — keep Whisper models warm behind a Unix socket
+#
+# Start once:   python bin/whisper_daemon.py --preload base
+# Then every mimesis Whisper helper (call_whisper.py, compare_sources.py,
+# run.sh, ...) routes its jobs here instead of loading a model itself.
+
+import os
+import sys
+import argparse
+
+# === Load from local utils ===
+current_dir = os.path.dirname(os.path.abspath(__file__))
+lib_path = os.path.join(current_dir, "../lib")
+sys.path.append(lib_path)
+
+from video_utils import initialize_logging, load_app_config
+from mimesis.daemon import TranscriptionDaemon, default_socket_path
+from mimesis.model_registry import get_whisper_model
+
+
+def main():
+    config = load_app_config().get("whisper_daemon", {})
+
+    parser = argparse.ArgumentParser(description="Run the warm Whisper transcription daemon.")
+    parser.add_argument("--socket", default=default_socket_path(), help="Unix socket path")
+    parser.add_argument("--workers", type=int, default=config.get("workers", 1), help="Concurrent jobs")
+    parser.add_argument("--preload", nargs="*", default=[], help="Whisper models to load at startup")
+    args = parser.parse_args()
+
+    logger = initialize_logging(log_name="whisper_daemon")
+    for model_name in args.preload:
+        logger.info(f"Preloading Whisper model: {model_name}")
+        get_whisper_model(model_name)
+
+    TranscriptionDaemon(args.socket, workers=args.workers).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
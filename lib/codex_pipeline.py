@@ -3,7 +3,10 @@ import os
 import json
 
 from mimesis.archive import handle_gdrive_tar
-from mimesis.video import extract_audio_from_video, load_app_config
+from mimesis.audio import load_audio
+from mimesis.batch import transcribe_and_translate_batch, transcribe_batch
+from mimesis.transcript_cache import cached_transcribe
+from mimesis.video import load_app_config
 
 try:
     import whisper
@@ -17,26 +20,51 @@ def transcribe_and_translate(audio_path: str, model_size: str = "base") -> str:
     """Return English transcription using Whisper."""
     if whisper is None:
         raise RuntimeError("whisper package not available")
-    model = whisper.load_model(model_size)
-    result = model.transcribe(audio_path, task="translate", language="en")
+    audio = load_audio(audio_path)
+    result = cached_transcribe(audio, model_size, task="translate", language="en")
     return result.get("text", "")
 
 
-def process_drive_tar_and_transcribe(url: str, work_dir: str) -> dict:
-    """Download tar from Google Drive, extract, transcribe, translate."""
+def transcribe_with_translation(audio_path: str, model_size: str = "base", language: str = None) -> dict:
+    """Return the original-language transcript and the English translation.
+
+    The Whisper encoder runs once; both decodes reuse its features and the
+    two transcripts share segment timestamps.
+    """
+    if whisper is None:
+        raise RuntimeError("whisper package not available")
+    audio = load_audio(audio_path)
+    return transcribe_and_translate_batch([audio], model_size, language=language)[0]
+
+
+def process_drive_tar_and_transcribe(url: str, work_dir: str, batch_size: int = None,
+                                     keep_original: bool = False) -> dict:
+    """Download tar from Google Drive, extract, transcribe, translate.
+
+    All extracted files are decoded together in Whisper batches of
+    ``batch_size`` windows (``whisper.batch_size`` in ``app_config`` by default).
+    With ``keep_original`` each entry holds the source-language transcript
+    and the translation (``{"language", "transcript", "translation"}``)
+    from a single encoder pass instead of just the translated text.
+    """
+    if whisper is None:
+        raise RuntimeError("whisper package not available")
     cfg = load_app_config()
     params = {"url": url, "download_path": work_dir}
     logger.info("Starting Google Drive download")
     result = handle_gdrive_tar(params)
-    transcripts = {}
-    for path in result.get("extracted", []):
-        base = os.path.splitext(os.path.basename(path))[0]
-        audio_path = os.path.join(work_dir, base + ".wav")
-        logger.info("Extracting audio: %s", path)
-        extract_audio_from_video(path, 0, None, audio_path)
-        logger.info("Transcribing with Whisper")
-        text = transcribe_and_translate(audio_path)
-        transcripts[path] = text
+    paths = result.get("extracted", [])
+    audios = []
+    for path in paths:
+        logger.info("Decoding audio: %s", path)
+        audios.append(load_audio(path))
+    logger.info("Transcribing %d files with Whisper", len(audios))
+    if keep_original:
+        results = transcribe_and_translate_batch(audios, batch_size=batch_size)
+        transcripts = dict(zip(paths, results))
+    else:
+        results = transcribe_batch(audios, task="translate", language="en", batch_size=batch_size)
+        transcripts = {path: res["text"] for path, res in zip(paths, results)}
     out_path = os.path.join(work_dir, "transcripts.json")
     with open(out_path, "w", encoding="utf-8") as fh:
         json.dump(transcripts, fh, indent=2)
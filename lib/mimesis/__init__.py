@@ -6,11 +6,35 @@ imports occur at package import time.
 
 __all__ = [
     "archive",
+    "asr",
+    "audio",
+    "batch",
+    "bench",
+    "checkpoint",
+    "chunking",
+    "clip_audio",
     "clips",
+    "daemon",
     "downloader",
+    "filtergraph",
+    "gstreamer",
+    "keyframes",
+    "model_registry",
+    "parallel",
+    "ranges",
+    "render",
+    "scratch",
+    "segments",
+    "sidecar",
+    "smartcut",
+    "standin",
+    "streaming",
     "tasks",
+    "throttle",
+    "transcript_cache",
     "transcription",
     "url",
+    "vad",
     "video",
     "watermark",
     "whisper",
@@ -0,0 +1,153 @@
+"""Pluggable speech recognition backends.
+
+Every recognizer takes 16 kHz mono float32 samples and returns the same
+``{"text", "segments", "language"}`` shape Whisper does, so callers (and the
+benchmark harness in :mod:`mimesis.bench`) can swap Whisper sizes and
+Google Speech Recognition without caring how each one wants its input.
+
+Pick a backend by name with :func:`get_backend`; without a name the
+``asr.backend`` entry of ``app_config`` decides.
+"""
+
+import abc
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+DEFAULT_BACKEND = "google"
+GOOGLE_NAMES = ("google", "speech_recognition")
+
+
+class ASRBackend(abc.ABC):
+    """Base class: subclasses implement :meth:`transcribe`."""
+
+    name = "asr"
+
+    @abc.abstractmethod
+    def transcribe(self, audio, **options) -> dict:
+        """Return ``{"text", "segments", "language"}`` for 16 kHz mono float32 samples."""
+
+    def transcribe_file(self, path: str, start: float = 0.0, end: Optional[float] = None, **options) -> dict:
+        from mimesis.audio import load_audio
+
+        return self.transcribe(load_audio(path, start, end), **options)
+
+    def iter_segments(self, audio, window_seconds: float = 30, **options):
+        """Yield segments window by window, offset onto the input timeline."""
+        window = int(window_seconds * SAMPLE_RATE)
+        for first in range(0, len(audio), window):
+            offset = first / SAMPLE_RATE
+            result = self.transcribe(audio[first:first + window], **options)
+            for seg in result.get("segments", []):
+                yield dict(seg, start=round(seg["start"] + offset, 3), end=round(seg["end"] + offset, 3))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class WhisperBackend(ASRBackend):
+    """Local Whisper of any size, loaded through the model registry."""
+
+    def __init__(self, model_name: str = "base", quantize=None, use_cache: bool = True, **decode_options):
+        self.model_name = model_name
+        self.quantize = quantize
+        self.use_cache = use_cache
+        self.decode_options = decode_options
+        self.name = f"whisper-{model_name}" + (f"-{quantize}" if quantize else "")
+
+    def transcribe(self, audio, **options) -> dict:
+        options = dict(self.decode_options, **options)
+        if self.use_cache:
+            from mimesis.transcript_cache import cached_transcribe
+
+            return cached_transcribe(audio, self.model_name, quantize=self.quantize, **options)
+
+        from mimesis.model_registry import get_whisper_model, resolve_quantize
+
+        if resolve_quantize(self.quantize):
+            options.setdefault("fp16", False)
+        model = get_whisper_model(self.model_name, quantize=self.quantize)
+        return model.transcribe(audio, **options)
+
+
+class SpeechRecognitionBackend(ASRBackend):
+    """Google Speech Recognition through the SpeechRecognition package.
+
+    ``endpoint`` overrides the Google URL, e.g. to point at the local
+    stand-in server from :mod:`mimesis.standin`.
+    """
+
+    name = "google"
+
+    def __init__(self, language: str = "en-US", key: Optional[str] = None, endpoint: Optional[str] = None):
+        import speech_recognition as sr
+
+        self.language = language
+        self.key = key
+        self.endpoint = endpoint
+        self.recognizer = sr.Recognizer()
+
+    def recognize(self, audio_data, unintelligible: str = "") -> str:
+        """Recognize an ``sr.AudioData``; unintelligible audio yields ``unintelligible``.
+
+        ``sr.RequestError`` propagates so callers can retry.
+        """
+        import speech_recognition as sr
+
+        options = {"key": self.key, "language": self.language}
+        if self.endpoint:
+            options["endpoint"] = self.endpoint
+        try:
+            return self.recognizer.recognize_google(audio_data, **options)
+        except sr.UnknownValueError:
+            return unintelligible
+
+    def transcribe(self, audio, **options) -> dict:
+        from mimesis.audio import samples_to_audio_data
+
+        text = self.recognize(samples_to_audio_data(audio, SAMPLE_RATE))
+        duration = round(len(audio) / SAMPLE_RATE, 3)
+        segments = [{"start": 0.0, "end": duration, "text": text}] if text else []
+        return {"text": text, "segments": segments, "language": self.language}
+
+
+def _asr_config() -> dict:
+    try:
+        from mimesis.video import load_app_config
+
+        return load_app_config().get("asr", {})
+    except Exception:
+        return {}
+
+
+def configured_backend_name() -> str:
+    """The ``asr.backend`` entry of ``app_config`` (``google`` when unset)."""
+    return _asr_config().get("backend", DEFAULT_BACKEND)
+
+
+def get_backend(name: Optional[str] = None, **options) -> ASRBackend:
+    """Return a backend by name: "whisper", "whisper-<size>[-int8]" or "google".
+
+    Without ``name``, ``asr.backend`` from ``app_config`` is used; the other
+    ``asr`` settings (``language``, ``google_endpoint``, ``google_key``)
+    fill in any Google options not passed explicitly.
+    """
+    config = _asr_config()
+    name = name or configured_backend_name()
+
+    if name in GOOGLE_NAMES:
+        options.setdefault("language", config.get("language", "en-US"))
+        options.setdefault("endpoint", config.get("google_endpoint"))
+        options.setdefault("key", config.get("google_key"))
+        return SpeechRecognitionBackend(**options)
+
+    if name == "whisper" or name.startswith("whisper-"):
+        model_name = name.partition("-")[2] or "base"
+        if model_name.endswith("-int8"):
+            model_name = model_name[:-len("-int8")]
+            options.setdefault("quantize", "int8")
+        return WhisperBackend(model_name, **options)
+
+    raise ValueError(f"Unknown ASR backend: {name!r}")
@@ -0,0 +1,81 @@
+"""In-memory audio decoding with ffmpeg.
+
+ffmpeg decodes and resamples straight to 16 kHz mono 16-bit PCM on a pipe,
+which lands in a NumPy buffer (for Whisper) or an ``sr.AudioData`` (for
+SpeechRecognition).  No temporary WAV is written and re-read, and moviepy's
+frame reader is never involved.
+"""
+
+import json
+import logging
+import subprocess
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # bytes per s16le sample
+
+
+def ffmpeg_pcm_command(path: str, start: float = 0.0, end: Optional[float] = None,
+                       sample_rate: int = SAMPLE_RATE) -> list:
+    """Return the ffmpeg command that writes mono s16le PCM of ``path`` to stdout.
+
+    ``-ss`` goes before ``-i`` so ffmpeg seeks in the container instead of
+    decoding everything up to ``start``.
+    """
+    cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+    if start:
+        cmd += ["-ss", f"{start:.3f}"]
+    cmd += ["-i", path, "-vn"]
+    if end is not None:
+        cmd += ["-t", f"{max(0.0, end - start):.3f}"]
+    cmd += [
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+        "-loglevel", "error", "-",
+    ]
+    return cmd
+
+
+def load_pcm(path: str, start: float = 0.0, end: Optional[float] = None, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Decode ``path`` (optionally only ``start``-``end`` seconds) to raw mono s16le bytes."""
+    cmd = ffmpeg_pcm_command(path, start, end, sample_rate)
+    try:
+        proc = subprocess.run(cmd, capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio from {path}: {e.stderr.decode(errors='replace')}") from e
+    return proc.stdout
+
+
+def load_audio(path: str, start: float = 0.0, end: Optional[float] = None, sample_rate: int = SAMPLE_RATE):
+    """Return ``path`` as float32 samples in [-1, 1], the input Whisper expects."""
+    import numpy as np
+
+    pcm = load_pcm(path, start, end, sample_rate)
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def load_audio_data(path: str, start: float = 0.0, end: Optional[float] = None, sample_rate: int = SAMPLE_RATE):
+    """Return ``path`` as an ``sr.AudioData`` ready for SpeechRecognition."""
+    import speech_recognition as sr
+
+    return sr.AudioData(load_pcm(path, start, end, sample_rate), sample_rate, SAMPLE_WIDTH)
+
+
+def samples_to_audio_data(samples, sample_rate: int = SAMPLE_RATE):
+    """Wrap float samples in [-1, 1] as an ``sr.AudioData``."""
+    import numpy as np
+    import speech_recognition as sr
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    return sr.AudioData(pcm, sample_rate, SAMPLE_WIDTH)
+
+
+def probe_duration(path: str) -> float:
+    """Return the container duration of ``path`` in seconds using ffprobe."""
+    cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", path]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, check=True, text=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffprobe failed for {path}: {e.stderr}") from e
+    return float(json.loads(proc.stdout)["format"]["duration"])
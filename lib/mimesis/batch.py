@@ -0,0 +1,266 @@
+"""Batched Whisper decoding across many short clips.
+
+``model.transcribe`` handles one input at a time, so dozens of short reels
+(or the 60-second windows of one video) each pay for their own encoder and
+decoder calls.  :func:`transcribe_batch` cuts every input into 30-second
+windows, stacks their log-mel spectrograms and runs the encoder and decoder
+over whole batches, then maps the decoded windows back to their inputs.
+Windows that decode repetitively or with low confidence are re-decoded at
+rising temperatures, as ``model.transcribe`` does; the windows themselves
+carry no inner timestamps, so long recordings should prefer
+``model.transcribe`` per chunk.
+
+:func:`transcribe_and_translate_batch` runs the encoder once per window and
+feeds the cached audio features to both a ``transcribe`` and a ``translate``
+decode, so multilingual sources get the original-language transcript and
+the English translation for roughly the price of one.
+"""
+
+import logging
+from typing import Optional
+
+from mimesis.model_registry import get_whisper_model, resolve_quantize
+from mimesis.transcript_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 8
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+
+# Same silence and fallback heuristics as whisper.transcribe
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+def configured_batch_size() -> int:
+    try:
+        from mimesis.video import load_app_config
+
+        return load_app_config().get("whisper", {}).get("batch_size", DEFAULT_BATCH_SIZE)
+    except Exception:
+        return DEFAULT_BATCH_SIZE
+
+
+def split_windows(audios, window_samples: int = SAMPLE_RATE * WINDOW_SECONDS) -> list:
+    """Return ``(input_index, offset_samples, samples)`` for every window of every input."""
+    windows = []
+    for index, audio in enumerate(audios):
+        for offset in range(0, max(len(audio), 1), window_samples):
+            windows.append((index, offset, audio[offset:offset + window_samples]))
+    return windows
+
+
+def _log_mel(model, samples):
+    import whisper
+
+    padded = whisper.pad_or_trim(samples)
+    n_mels = getattr(model.dims, "n_mels", 80)
+    if n_mels != 80:
+        return whisper.log_mel_spectrogram(padded, n_mels)
+    return whisper.log_mel_spectrogram(padded)
+
+
+def _is_silent(output) -> bool:
+    return output.no_speech_prob > NO_SPEECH_THRESHOLD and output.avg_logprob < LOGPROB_THRESHOLD
+
+
+def _needs_fallback(output) -> bool:
+    if _is_silent(output):
+        return False
+    return output.compression_ratio > COMPRESSION_RATIO_THRESHOLD or output.avg_logprob < LOGPROB_THRESHOLD
+
+
+def _decode_with_fallback(model, inputs, options) -> list:
+    """``whisper.decode`` a batch, re-decoding repetitive or low-confidence windows at rising temperatures.
+
+    ``inputs`` may be log-mel spectrograms or encoder features.
+    """
+    import dataclasses
+    import whisper
+
+    outputs = list(whisper.decode(model, inputs, options))
+    for i, output in enumerate(outputs):
+        for temperature in FALLBACK_TEMPERATURES:
+            if not _needs_fallback(output):
+                break
+            output = whisper.decode(model, inputs[i:i + 1], dataclasses.replace(options, temperature=temperature))[0]
+        outputs[i] = output
+    return outputs
+
+
+def transcribe_batch(
+    audios,
+    model_name: str = "base",
+    batch_size: Optional[int] = None,
+    task: str = "transcribe",
+    language: Optional[str] = None,
+    cache=None,
+    quantize=None,
+) -> list:
+    """Transcribe many audio arrays with batched encoder/decoder passes.
+
+    Args:
+        audios (list): 16 kHz mono float32 arrays (as from ``whisper.load_audio``).
+        model_name (str): Whisper model size.
+        batch_size (int): Windows decoded together; lower it to save CPU memory.
+            Defaults to ``whisper.batch_size`` in ``app_config``.
+        task (str): "transcribe" or "translate".
+        language (str): Source language, detected per window when None.
+        cache (TranscriptCache): Cache to consult; defaults to the configured one.
+        quantize (str): "int8" for a quantized CPU model, False for float32;
+            defaults to ``whisper.quantize`` in ``app_config``.
+
+    Returns:
+        list[dict]: One ``{"text", "segments", "language"}`` per input, in input order.
+    """
+    batch_size = batch_size or configured_batch_size()
+    quantize = resolve_quantize(quantize)
+    key_options = {"quantize": quantize} if quantize else {}
+    cache = cache if cache is not None else get_cache()
+    results = [None] * len(audios)
+    keys = [None] * len(audios)
+
+    pending = []
+    for index, audio in enumerate(audios):
+        if cache is not None:
+            keys[index] = cache.make_key(audio, model_name, task=task, language=language, batched=True, **key_options)
+            results[index] = cache.get(keys[index])
+        if results[index] is None:
+            pending.append(index)
+    if not pending:
+        return results
+
+    import torch
+    import whisper
+
+    model = get_whisper_model(model_name, quantize=quantize)
+    options = whisper.DecodingOptions(
+        task=task,
+        language=language,
+        without_timestamps=True,
+        fp16=model.device.type == "cuda",
+    )
+
+    windows = split_windows([audios[i] for i in pending])
+    decoded = {}
+    logger.info("Decoding %d windows from %d inputs in batches of %d", len(windows), len(pending), batch_size)
+    for start in range(0, len(windows), batch_size):
+        batch = windows[start:start + batch_size]
+        mel = torch.stack([_log_mel(model, samples) for _, _, samples in batch]).to(model.device)
+        with torch.no_grad():
+            outputs = _decode_with_fallback(model, mel, options)
+        for (position, offset, samples), output in zip(batch, outputs):
+            silent = _is_silent(output)
+            decoded.setdefault(position, []).append({
+                "start": round(offset / SAMPLE_RATE, 2),
+                "end": round((offset + len(samples)) / SAMPLE_RATE, 2),
+                "text": "" if silent else output.text,
+                "language": output.language,
+            })
+
+    for position, index in enumerate(pending):
+        segments = [seg for seg in decoded.get(position, []) if seg["text"].strip()]
+        languages = [seg["language"] for seg in decoded.get(position, [])]
+        results[index] = {
+            "text": " ".join(seg["text"].strip() for seg in segments),
+            "segments": segments,
+            "language": languages[0] if languages else language,
+        }
+        if cache is not None:
+            cache.put(keys[index], results[index])
+    return results
+
+
+def transcribe_and_translate_batch(
+    audios,
+    model_name: str = "base",
+    batch_size: Optional[int] = None,
+    language: Optional[str] = None,
+    cache=None,
+    quantize=None,
+) -> list:
+    """Transcribe and translate many audio arrays from one encoder pass per window.
+
+    Each 30-second window is encoded once; ``whisper.decode`` skips the
+    encoder when given audio features, so the ``transcribe`` and
+    ``translate`` decodes share them. Segments are whole windows, so the two
+    transcripts line up segment for segment with identical timestamps.
+
+    Args:
+        audios (list): 16 kHz mono float32 arrays.
+        model_name (str): Whisper model size.
+        batch_size (int): Windows encoded together.
+        language (str): Source language, detected per window when None.
+        cache (TranscriptCache): Cache to consult; defaults to the configured one.
+        quantize (str): "int8" for a quantized CPU model, False for float32.
+
+    Returns:
+        list[dict]: Per input, ``{"language", "transcript", "translation"}`` where
+        the last two are ``{"text", "segments"}``.
+    """
+    batch_size = batch_size or configured_batch_size()
+    cache = cache if cache is not None else get_cache()
+    quantize = resolve_quantize(quantize)
+    key_options = {"quantize": quantize} if quantize else {}
+    results = [None] * len(audios)
+    keys = [None] * len(audios)
+
+    pending = []
+    for index, audio in enumerate(audios):
+        if cache is not None:
+            keys[index] = cache.make_key(audio, model_name, task="transcribe+translate", language=language,
+                                         batched=True, **key_options)
+            results[index] = cache.get(keys[index])
+        if results[index] is None:
+            pending.append(index)
+    if not pending:
+        return results
+
+    import torch
+    import whisper
+
+    model = get_whisper_model(model_name, quantize=quantize)
+    fp16 = model.device.type == "cuda"
+    tasks = {
+        task: whisper.DecodingOptions(task=task, language=language, without_timestamps=True, fp16=fp16)
+        for task in ("transcribe", "translate")
+    }
+
+    windows = split_windows([audios[i] for i in pending])
+    decoded = {"transcribe": {}, "translate": {}}
+    logger.info("Encoding %d windows once for transcription and translation", len(windows))
+    for start in range(0, len(windows), batch_size):
+        batch = windows[start:start + batch_size]
+        mel = torch.stack([_log_mel(model, samples) for _, _, samples in batch]).to(model.device)
+        with torch.no_grad():
+            features = model.embed_audio(mel.half() if fp16 else mel)
+            outputs = {task: _decode_with_fallback(model, features, options) for task, options in tasks.items()}
+
+        for i, (position, offset, samples) in enumerate(batch):
+            heard = outputs["transcribe"][i]
+            silent = _is_silent(heard)
+            for task in tasks:
+                decoded[task].setdefault(position, []).append({
+                    "start": round(offset / SAMPLE_RATE, 2),
+                    "end": round((offset + len(samples)) / SAMPLE_RATE, 2),
+                    "text": "" if silent else outputs[task][i].text,
+                    "language": heard.language,
+                })
+
+    for position, index in enumerate(pending):
+        heard = decoded["transcribe"].get(position, [])
+        # Keep the same windows in both transcripts so their segments stay paired
+        kept = [i for i, seg in enumerate(heard) if seg["text"].strip()]
+        results[index] = {"language": heard[0]["language"] if heard else language}
+        for task, label in (("transcribe", "transcript"), ("translate", "translation")):
+            segments = [decoded[task][position][i] for i in kept]
+            results[index][label] = {
+                "text": " ".join(seg["text"].strip() for seg in segments),
+                "segments": segments,
+            }
+        if cache is not None:
+            cache.put(keys[index], results[index])
+    return results
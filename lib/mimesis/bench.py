@@ -0,0 +1,299 @@
+"""Speed and accuracy measurements for the transcription backends.
+
+Word error rate and real-time factor helpers, a float32 vs. int8
+comparison of the Whisper loader, and a harness that runs every
+:mod:`mimesis.asr` backend over a local corpus and reports real-time
+factor, peak RSS and latency to the first segment.  :func:`benchmark_seek`
+times clip audio extraction at increasing offsets into a long file, and
+:func:`benchmark_renderers` compares the moviepy and ffmpeg clip renderers.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+MEDIA_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".mp4", ".mov", ".mkv", ".webm")
+
+
+def normalize_words(text: str) -> list:
+    """Lowercase ``text`` and split it into words without punctuation."""
+    return re.findall(r"[\w']+", text.lower())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Return (substitutions + deletions + insertions) / reference words."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return float(bool(hyp))
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def real_time_factor(elapsed: float, audio_seconds: float) -> float:
+    """Processing time per second of audio (below 1.0 is faster than real time)."""
+    return elapsed / audio_seconds if audio_seconds else float("inf")
+
+
+def benchmark_quantization(audio, reference=None, model_name="base", modes=(False, "int8"), **decode_options):
+    """Transcribe ``audio`` once per quantization mode and compare the runs.
+
+    Model loading is excluded from the timings and the transcript cache is
+    bypassed.
+
+    Args:
+        audio: 16 kHz mono float32 samples.
+        reference (str): Ground-truth transcript; WER is reported when given.
+        model_name (str): Whisper model size.
+        modes (tuple): Quantization modes to compare; False is float32.
+        **decode_options: Passed to ``model.transcribe``.
+
+    Returns:
+        list[dict]: ``mode``, ``seconds``, ``rtf``, ``wer`` and ``text`` per mode.
+    """
+    from mimesis.model_registry import get_whisper_model
+
+    duration = len(audio) / SAMPLE_RATE
+    rows = []
+    for mode in modes:
+        model = get_whisper_model(model_name, device="cpu", quantize=mode)
+        started = time.perf_counter()
+        result = model.transcribe(audio, fp16=False, **decode_options)
+        elapsed = time.perf_counter() - started
+        row = {
+            "mode": mode or "float32",
+            "seconds": round(elapsed, 2),
+            "rtf": round(real_time_factor(elapsed, duration), 3),
+            "wer": round(word_error_rate(reference, result["text"]), 4) if reference is not None else None,
+            "text": result["text"],
+        }
+        logger.info("%s: RTF %.3f, WER %s", row["mode"], row["rtf"], row["wer"])
+        rows.append(row)
+    return rows
+
+
+def load_corpus(directory: str) -> list:
+    """Return ``(media_path, reference)`` for every media file in ``directory``.
+
+    The reference is read from a ``.txt`` file with the same stem, or None.
+    """
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in MEDIA_EXTENSIONS:
+            continue
+        reference = None
+        txt_path = os.path.join(directory, stem + ".txt")
+        if os.path.exists(txt_path):
+            with open(txt_path, "r", encoding="utf-8") as f:
+                reference = f.read()
+        corpus.append((os.path.join(directory, name), reference))
+    return corpus
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def measure_backend(backend, corpus, window_seconds: float = 30, warmup: bool = True) -> list:
+    """Run ``backend`` over ``corpus`` in this process, one row per file.
+
+    Segments come from ``backend.iter_segments`` so the time to the first
+    segment is what a streaming caller would see. A one-second warm-up call
+    keeps model loading out of the first file's numbers.
+    """
+    from mimesis.audio import load_audio
+
+    if warmup:
+        import numpy as np
+
+        backend.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32))
+
+    rows = []
+    for path, reference in corpus:
+        audio = load_audio(path)
+        duration = len(audio) / SAMPLE_RATE
+        first_segment = None
+        segments = []
+        started = time.perf_counter()
+        for seg in backend.iter_segments(audio, window_seconds):
+            if first_segment is None:
+                first_segment = time.perf_counter() - started
+            segments.append(seg)
+        elapsed = time.perf_counter() - started
+
+        text = " ".join(seg["text"].strip() for seg in segments)
+        row = {
+            "backend": backend.name,
+            "file": os.path.basename(path),
+            "audio_seconds": round(duration, 2),
+            "seconds": round(elapsed, 2),
+            "rtf": round(real_time_factor(elapsed, duration), 3),
+            "first_segment_seconds": None if first_segment is None else round(first_segment, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "wer": round(word_error_rate(reference, text), 4) if reference is not None else None,
+        }
+        logger.info("%s on %s: RTF %.3f, first segment %ss", row["backend"], row["file"], row["rtf"],
+                    row["first_segment_seconds"])
+        rows.append(row)
+    return rows
+
+
+def _measure_in_worker(name, options, corpus, window_seconds):
+    from mimesis.asr import get_backend
+
+    return measure_backend(get_backend(name, **options), corpus, window_seconds)
+
+
+def benchmark_backends(names, corpus, backend_options=None, window_seconds: float = 30) -> list:
+    """Benchmark each named backend over ``corpus`` in its own fresh process.
+
+    A separate process per backend keeps one model's memory out of the next
+    one's peak RSS figure.
+
+    Args:
+        names (list): Backend names understood by ``mimesis.asr.get_backend``.
+        corpus (list): ``(media_path, reference)`` pairs, e.g. from :func:`load_corpus`.
+        backend_options (dict): Extra ``get_backend`` options per backend name.
+        window_seconds (float): Audio per recognizer call.
+
+    Returns:
+        list[dict]: One row per backend and file.
+    """
+    backend_options = backend_options or {}
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            future = pool.submit(_measure_in_worker, name, backend_options.get(name, {}), corpus, window_seconds)
+            rows.extend(future.result())
+    return rows
+
+
+def generate_test_media(path: str, seconds: float = 7200, force: bool = False, size: str = "160x90",
+                        rate: int = 10) -> str:
+    """Write a ``size`` test video of ``seconds`` with a tone track (skipped if present)."""
+    if os.path.exists(path) and not force:
+        return path
+    cmd = [
+        "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc=size={size}:rate={rate}:duration={seconds}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=48000:duration={seconds}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-g", "50",
+        "-c:a", "aac", "-b:a", "64k", "-shortest", path,
+    ]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    logger.info("Generating %.0fs test media at %s", seconds, path)
+    subprocess.run(cmd, check=True)
+    return path
+
+
+def _extract_moviepy(path, start, end, wav_path):
+    from moviepy.editor import VideoFileClip
+
+    with VideoFileClip(path) as video:
+        video.subclip(start, end).audio.write_audiofile(wav_path, logger=None)
+
+
+def benchmark_seek(path: str, offsets, clip_seconds: float = 10, methods=("ffmpeg", "pyav")) -> list:
+    """Time extracting ``clip_seconds`` of audio at each offset with each method.
+
+    Methods: "moviepy" (the old ``VideoFileClip.subclip`` export), "ffmpeg"
+    (input-seeking WAV export) and "pyav" (one reused demuxer).
+
+    Returns:
+        list[dict]: ``method``, ``offset``, ``seconds`` per extraction.
+    """
+    from mimesis.ranges import RangeExtractor, av, extract_range_to_wav
+
+    rows = []
+    from mimesis.scratch import scratch_dir
+
+    with scratch_dir() as tmp_dir:
+        wav_path = os.path.join(tmp_dir, "clip.wav")
+        extractor = RangeExtractor(path, use_pyav=True) if "pyav" in methods and av is not None else None
+        for method in methods:
+            if method == "pyav" and extractor is None:
+                logger.warning("PyAV not installed; skipping the pyav method")
+                continue
+            for offset in offsets:
+                started = time.perf_counter()
+                if method == "moviepy":
+                    _extract_moviepy(path, offset, offset + clip_seconds, wav_path)
+                elif method == "ffmpeg":
+                    extract_range_to_wav(path, offset, offset + clip_seconds, wav_path)
+                elif method == "pyav":
+                    extractor.extract(offset, offset + clip_seconds)
+                else:
+                    raise ValueError(f"Unknown extraction method: {method!r}")
+                elapsed = time.perf_counter() - started
+                rows.append({"method": method, "offset": offset, "seconds": round(elapsed, 3)})
+                logger.info("%s at %ss: %.3fs", method, offset, elapsed)
+        if extractor is not None:
+            extractor.close()
+    return rows
+
+
+def benchmark_renderers(path: str, clips, renderers=("moviepy", "ffmpeg"), style=None) -> list:
+    """Render the same captioned clips with each renderer and time them.
+
+    Args:
+        path (str): Source video (e.g. from :func:`generate_test_media`).
+        clips (list): ``(start, end, text)`` tuples.
+        renderers (tuple): Any of "moviepy", "ffmpeg", "ffmpeg-batch"
+            (ffmpeg with decodes shared through one filtergraph per group)
+            and "gstreamer".
+        style (dict): Caption style (default: mimesis.render.DEFAULT_STYLE).
+
+    Returns:
+        list[dict]: ``renderer``, ``seconds`` (wall time for all clips),
+        ``ok`` (clips written) and ``output_mb`` per renderer.
+    """
+    from mimesis.render import caption_style, render_clips, render_clips_gstreamer, render_clips_moviepy
+    from mimesis.scratch import scratch_dir
+
+    style = style or caption_style()
+    rows = []
+    for renderer in renderers:
+        with scratch_dir() as out_dir:
+            jobs = [(start, end, text, os.path.join(out_dir, f"clip_{i}.mp4")) for i, (start, end, text) in enumerate(clips)]
+            started = time.perf_counter()
+            if renderer == "moviepy":
+                results = render_clips_moviepy(path, jobs, style)
+            elif renderer in ("ffmpeg", "ffmpeg-batch"):
+                results = render_clips(path, jobs, style, filtergraph=renderer == "ffmpeg-batch")
+            elif renderer == "gstreamer":
+                results = render_clips_gstreamer(path, jobs, style)
+            else:
+                raise ValueError(f"Unknown renderer: {renderer!r}")
+            elapsed = time.perf_counter() - started
+            size = sum(os.path.getsize(r["output"]) for r in results if r["ok"] and os.path.exists(r["output"]))
+        rows.append({
+            "renderer": renderer,
+            "seconds": round(elapsed, 3),
+            "ok": sum(r["ok"] for r in results),
+            "output_mb": round(size / 1024 / 1024, 2),
+        })
+        logger.info("%s: %d/%d clips in %.2fs", renderer, rows[-1]["ok"], len(clips), elapsed)
+    return rows
@@ -0,0 +1,137 @@
+"""Per-video checkpoints for resumable Whisper transcription.
+
+Each completed window is written to its own JSON file inside a checkpoint
+directory under ``~/.cache/mimesis/checkpoints`` (``checkpoint.dir`` in
+``app_config``), never next to the video, which may sit on read-only or
+removable media.  A manifest records which windows are done.
+All writes are atomic (temp file + rename), so a crash, a Ctrl-C or an
+unplugged USB target leaves the checkpoint usable and the next run resumes
+after the last completed window.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+DEFAULT_ROOT = "~/.cache/mimesis/checkpoints"
+
+
+def checkpoint_root():
+    """Return the directory holding every checkpoint, from ``checkpoint.dir`` in ``app_config``."""
+    try:
+        from mimesis.video import load_app_config
+
+        root = load_app_config().get("checkpoint", {}).get("dir")
+    except Exception:
+        root = None
+    return os.path.expanduser(root or DEFAULT_ROOT)
+
+
+def default_checkpoint_dir(video_path, kind=None, root=None):
+    """``<root>/<video>-<hash>.whisper_ckpt``, with ``.<kind>`` before the suffix for a named transcription mode.
+
+    The hash of the absolute path keeps same-named videos from different
+    folders apart.
+    """
+    path = os.path.abspath(video_path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+    name = f"{stem}-{digest}.{kind}.whisper_ckpt" if kind else f"{stem}-{digest}.whisper_ckpt"
+    return os.path.join(root or checkpoint_root(), name)
+
+
+def _write_json(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class TranscriptCheckpoint:
+    """Completed-window store for one video and one set of decode parameters.
+
+    A checkpoint written with different ``params`` (model, window size, ...)
+    or for a different source file is discarded rather than mixed in.
+    """
+
+    def __init__(self, directory, video_path, params=None):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST)
+        stat = os.stat(video_path)
+        self.source = {
+            "path": os.path.abspath(video_path),
+            "size": stat.st_size,
+            "mtime": int(stat.st_mtime),
+        }
+        self.params = json.loads(json.dumps(params or {}, default=str))
+        os.makedirs(directory, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        fresh = {"source": self.source, "params": self.params, "windows": {}}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return fresh
+        if manifest.get("source") != self.source or manifest.get("params") != self.params:
+            logger.warning("Checkpoint in %s does not match this run; starting over", self.directory)
+            self.clear()
+            return fresh
+        logger.info("Resuming from checkpoint with %d completed windows", len(manifest["windows"]))
+        return manifest
+
+    def _window_path(self, index):
+        return os.path.join(self.directory, f"window_{int(index):05d}.json")
+
+    def done(self, index):
+        return str(index) in self.manifest["windows"]
+
+    def save(self, index, start, end, result):
+        """Persist one completed window, then record it in the manifest."""
+        _write_json(self._window_path(index), result)
+        self.manifest["windows"][str(index)] = {"start": start, "end": end}
+        _write_json(self.manifest_path, self.manifest)
+
+    def load(self, index):
+        with open(self._window_path(index), "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def completed(self):
+        """Return ``(index, start, end, result)`` for completed windows in order."""
+        return [
+            (int(index), info["start"], info["end"], self.load(index))
+            for index, info in sorted(self.manifest["windows"].items(), key=lambda item: int(item[0]))
+        ]
+
+    def resume_time(self):
+        """End time of the last contiguous completed window (0.0 when none)."""
+        end = 0.0
+        for expected, (index, _, window_end, _) in enumerate(self.completed()):
+            if index != expected:
+                break
+            end = window_end
+        return end
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name == MANIFEST or (name.startswith("window_") and name.endswith(".json")):
+                os.remove(os.path.join(self.directory, name))
+        self.manifest = {"source": self.source, "params": self.params, "windows": {}}
+
+    def discard(self):
+        """Remove the checkpoint directory once its transcript is complete."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,115 @@
+"""Pause-aligned chunk planning for long recordings.
+
+Fixed 60-second windows cut words in half and spend decode time on silence
+at their edges.  :func:`plan_chunks` instead places every cut at the
+quietest point (smoothed frame energy) between ``min_len`` and ``max_len``
+seconds into the chunk, with a small penalty for straying from ``target``.
+Both transcription paths consume the resulting ``[(start, end), ...]``
+list; per-minute views are rebuilt afterwards with
+:func:`mimesis.segments.minute_buckets`.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+DEFAULT_MIN_SECONDS = 30
+DEFAULT_TARGET_SECONDS = 60
+DEFAULT_MAX_SECONDS = 90
+FRAME_MS = 30
+SMOOTH_FRAMES = 7  # ~200 ms, long enough to tell a pause from a plosive
+DISTANCE_PENALTY_DB = 0.3  # per second away from the target length
+
+
+def _smooth(values, width):
+    if width <= 1 or not values:
+        return list(values)
+    prefix = [0.0]
+    for value in values:
+        prefix.append(prefix[-1] + value)
+    half = width // 2
+    smoothed = []
+    for i in range(len(values)):
+        lo, hi = max(0, i - half), min(len(values), i + half + 1)
+        smoothed.append((prefix[hi] - prefix[lo]) / (hi - lo))
+    return smoothed
+
+
+def plan_from_energy(energy_db, frame_seconds, duration, target=DEFAULT_TARGET_SECONDS,
+                     min_len=DEFAULT_MIN_SECONDS, max_len=DEFAULT_MAX_SECONDS,
+                     distance_penalty=DISTANCE_PENALTY_DB, smooth=SMOOTH_FRAMES):
+    """Return ``[(start, end), ...]`` seconds covering ``duration`` from per-frame energy.
+
+    Every chunk except the last is between ``min_len`` and ``max_len`` long;
+    the last one is whatever remains (at most ``max_len``).
+    """
+    if not 0 < min_len <= target <= max_len:
+        raise ValueError(f"Chunk lengths must satisfy 0 < min <= target <= max, got {min_len}/{target}/{max_len}")
+
+    energy = _smooth(list(energy_db), smooth)
+    chunks = []
+    start = 0.0
+    while duration - start > max_len:
+        lo = int((start + min_len) / frame_seconds)
+        hi = min(int((start + max_len) / frame_seconds), len(energy) - 1)
+        if lo > hi:
+            cut = start + target
+        else:
+            goal = start + target
+            best = min(
+                range(lo, hi + 1),
+                key=lambda i: energy[i] + distance_penalty * abs((i + 0.5) * frame_seconds - goal),
+            )
+            cut = (best + 0.5) * frame_seconds
+        cut = round(cut, 3)
+        chunks.append((start, cut))
+        start = cut
+    if duration - start > 0:
+        chunks.append((start, round(duration, 3)))
+    return chunks
+
+
+def plan_chunks(audio, sample_rate=SAMPLE_RATE, frame_ms=FRAME_MS, **options):
+    """Plan pause-aligned chunks for 16 kHz mono samples (see :func:`plan_from_energy`)."""
+    import numpy as np
+
+    audio = np.asarray(audio, dtype=np.float32)
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    chunks = plan_from_energy(energy_db.tolist(), frame / sample_rate, len(audio) / sample_rate, **options)
+    logger.info("Planned %d pause-aligned chunks over %.0fs", len(chunks), len(audio) / sample_rate)
+    return chunks
+
+
+def configured_chunk_options() -> dict:
+    """Return ``min_len``/``target``/``max_len`` from ``chunking`` in ``app_config``."""
+    try:
+        from mimesis.video import load_app_config
+
+        settings = load_app_config().get("chunking", {})
+    except Exception:
+        settings = {}
+    return {
+        "min_len": settings.get("min_seconds", DEFAULT_MIN_SECONDS),
+        "target": settings.get("target_seconds", DEFAULT_TARGET_SECONDS),
+        "max_len": settings.get("max_seconds", DEFAULT_MAX_SECONDS),
+    }
+
+
+def fit_to_window(options: dict, window: float) -> dict:
+    """Scale ``min_len``/``target``/``max_len`` down so no chunk is longer than ``window`` seconds.
+
+    Decoders that read fixed windows (see mimesis.batch) would otherwise
+    split a longer chunk again at an arbitrary sample.
+    """
+    if options["max_len"] <= window:
+        return dict(options)
+    scale = window / options["max_len"]
+    return {
+        "min_len": options["min_len"] * scale,
+        "target": options["target"] * scale,
+        "max_len": window,
+    }
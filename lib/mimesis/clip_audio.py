@@ -0,0 +1,87 @@
+"""Batch audio slicing and transcription for whole clip sets.
+
+A clip dict (as returned by ``load_clips_from_file``) maps clip names to
+lists of ``{"start", "end", ...}`` entries.  :func:`slice_clip_audio`
+decodes the source audio once and returns every clip's samples as views
+into it; :func:`transcribe_clips` then recognizes them together, so a
+40-clip session costs one decode instead of forty.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+def iter_clip_ranges(clips):
+    """Yield ``(clip_name, index, start, end)`` for every entry of a clip dict, in source order."""
+    entries = [
+        (clip_name, index, clip["start"], clip["end"])
+        for clip_name, clip_list in clips.items()
+        for index, clip in enumerate(clip_list)
+    ]
+    return sorted(entries, key=lambda entry: entry[2])
+
+
+def slice_clip_audio(video_path, clips) -> dict:
+    """Decode ``video_path``'s audio once and return ``{(clip_name, index): samples}``."""
+    from mimesis.sidecar import get_store
+
+    store = get_store()
+    if store is not None:
+        audio = store.get(video_path)
+    else:
+        from mimesis.audio import load_audio
+
+        audio = load_audio(video_path)
+    return {
+        (clip_name, index): audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+        for clip_name, index, start, end in iter_clip_ranges(clips)
+    }
+
+
+def transcribe_clips(video_path, clips, backend=None, only=None) -> dict:
+    """Transcribe every clip of a clip dict from a single decode of its audio.
+
+    Args:
+        video_path (str): Source video the clip times refer to.
+        clips (dict): Clip name -> list of ``{"start", "end"}`` entries.
+        backend (str | ASRBackend): Backend or backend name (see mimesis.asr);
+            defaults to ``asr.backend`` in app_config. Whisper backends decode
+            clips of up to 30s in batches; longer clips are transcribed one
+            by one so they keep their segment timing.
+        only (set): Restrict to these ``(clip_name, index)`` keys.
+
+    Returns:
+        dict: ``{(clip_name, index): text}``; clips that fail to recognize map to "".
+    """
+    from mimesis.asr import WhisperBackend, get_backend
+
+    audio = slice_clip_audio(video_path, clips)
+    if only is not None:
+        audio = {key: samples for key, samples in audio.items() if key in only}
+    if backend is None or isinstance(backend, str):
+        backend = get_backend(backend)
+    logger.info("Transcribing %d clips with %s", len(audio), backend.name)
+
+    texts = {}
+    if isinstance(backend, WhisperBackend):
+        from mimesis.batch import WINDOW_SECONDS, transcribe_batch
+
+        # A batch decodes fixed 30s windows without timestamps, so only clips
+        # that fit one window go there; longer ones use model.transcribe below
+        keys = [key for key, samples in audio.items() if len(samples) <= WINDOW_SECONDS * SAMPLE_RATE]
+        if keys:
+            results = transcribe_batch([audio[key] for key in keys], backend.model_name, quantize=backend.quantize)
+            texts.update((key, result["text"].strip()) for key, result in zip(keys, results))
+
+    for key, samples in audio.items():
+        if key in texts:
+            continue
+        try:
+            texts[key] = backend.transcribe(samples)["text"].strip()
+        except Exception as e:
+            logger.warning(f"⚠️ Recognition failed for {key[0]}: {e}")
+            texts[key] = ""
+    return {key: texts[key] for key in audio}
@@ -1,6 +1,7 @@
 # Moved from make_clips.py
 
 import os
+import time
 import logging
 import traceback
 import subprocess
@@ -19,7 +20,162 @@ def get_codecs_by_extension(extension):
     }
     return codecs.get(extension, {"video_codec": "libx264", "audio_codec": "aac"})
 
+def _render_settings():
+    try:
+        from mimesis.video import load_app_config
+
+        return load_app_config().get("clip_render", {})
+    except Exception:
+        return {}
+
+
+def thread_budget(n_jobs, total_threads=None, max_jobs=None, min_threads=2):
+    """Split a core budget over concurrent encodes.
+
+    Args:
+        n_jobs (int): Clips waiting to be rendered.
+        total_threads (int): Threads all encodes may use together (default: CPU count).
+        max_jobs (int): Upper bound on concurrent encodes.
+        min_threads (int): Threads each encode gets at least, while the budget allows.
+
+    Returns:
+        tuple: ``(concurrent_jobs, threads_per_job)``.
+    """
+    total = max(1, total_threads or os.cpu_count() or 1)
+    jobs = max(1, min(n_jobs or 1, max_jobs or total, total // max(1, min_threads) or 1))
+    return jobs, max(1, total // jobs)
+
+
+def escape_drawtext(text):
+    """Escape text for use inside a single-quoted drawtext ``text=`` value."""
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace("'", "\u2019")
+        .replace(":", "\\:")
+        .replace("%", "\\%")
+    )
+
+
+_X_POSITIONS = {"left": "10", "center": "(w-text_w)/2", "right": "w-text_w-10"}
+_Y_POSITIONS = {"top": "10", "center": "(h-text_h)/2", "bottom": "h-text_h-10"}
+
+
+def drawtext_options(font="Arial", font_size=48, text_color="white", text_halign="center",
+                     text_valign="bottom", font_file=None):
+    """drawtext options matching a TextClip placed at ``(text_halign, text_valign)``.
+
+    ``font_file`` selects the font by path; otherwise drawtext asks
+    fontconfig for ``font`` by name.
+    """
+    x = _X_POSITIONS.get(text_halign, _X_POSITIONS["center"])
+    y = _Y_POSITIONS.get(text_valign, _Y_POSITIONS["bottom"])
+    face = f"fontfile='{font_file}'" if font_file else f"font='{font}'"
+    return f"{face}:fontsize={font_size}:fontcolor={text_color}:x={x}:y={y}"
+
+
+def ffmpeg_clip_command(input_video_path, start, end, output_video_path, codecs, text=None,
+                        drawtext=None, threads=None):
+    """Build the ffmpeg argument list that renders one clip.
+
+    The input is opened at the keyframe preceding ``start`` and trimmed from
+    there (see mimesis.keyframes), so only the clip itself is decoded.
+    ``drawtext`` overrides the default top-left yellow overlay with a full
+    drawtext option string (without the ``text=`` part).
+    """
+    from mimesis.keyframes import seek_args
+
+    command = [
+        "ffmpeg", "-nostdin", "-y",
+        *seek_args(input_video_path, start, end),
+        "-c:v", codecs["video_codec"],
+        "-c:a", codecs["audio_codec"],
+        "-strict", "experimental",
+    ]
+    if threads:
+        command.extend(["-threads", str(threads)])
+    if text:
+        options = drawtext or "x=10:y=10:fontsize=24:fontcolor=yellow"
+        command.extend(["-vf", f"drawtext=text='{escape_drawtext(text)}':{options}"])
+    command.append(output_video_path)
+    return command
+
+
+def render_parallel(commands, total_threads=None, max_jobs=None, min_threads=None, runner=None):
+    """Run ffmpeg commands concurrently under a shared thread budget.
+
+    Each command gets ``-threads`` set to its share of the budget (unless it
+    already names one) and runs on a worker thread; a failing clip is
+    recorded and the rest of the batch carries on.
+
+    Args:
+        commands (list): ``(argv, output_path)`` pairs; argv's last item is the
+            output. ``argv`` may instead be a callable, which is called with
+            the per-job thread count (e.g. a multi-step smart cut).
+        total_threads, max_jobs, min_threads: See :func:`thread_budget`;
+            default to ``clip_render`` in app_config.
+        runner (callable): ``subprocess.run`` replacement, mainly for tests.
+
+    Returns:
+        list[dict]: Per command, in input order: ``output``, ``ok``,
+        ``error`` (None on success) and ``seconds``.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    settings = _render_settings()
+    runner = runner or subprocess.run
+    jobs, threads = thread_budget(
+        len(commands),
+        total_threads or settings.get("threads"),
+        max_jobs or settings.get("max_jobs"),
+        min_threads or settings.get("min_threads_per_job", 2),
+    )
+    logger.info(f"Rendering {len(commands)} clips, {jobs} at a time with {threads} threads each")
+
+    def run(job):
+        argv, output = job
+        started = time.perf_counter()
+        try:
+            if callable(argv):
+                argv(threads)
+            else:
+                argv = list(argv)
+                if "-threads" not in argv:
+                    argv[-1:-1] = ["-threads", str(threads)]
+                runner(argv, check=True, capture_output=True)
+            return {"output": output, "ok": True, "error": None, "seconds": time.perf_counter() - started}
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace").strip() if isinstance(e.stderr, bytes) else (e.stderr or "")
+            error = stderr.splitlines()[-1] if stderr else str(e)
+        except Exception as e:
+            error = str(e)
+        logger.error(f"Error rendering {output}: {error}")
+        return {"output": output, "ok": False, "error": error, "seconds": time.perf_counter() - started}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run, commands))
+
+
+def _smart_cut_job(input_video_path, start, end, output_video_path):
+    from mimesis.smartcut import smart_cut
+
+    return lambda threads: smart_cut(input_video_path, start, end, output_video_path, threads=threads)
+
+
 def process_clips_ffmpeg(params, clips):
+    """Render ``(start, end, text)`` clips with concurrent ffmpeg encodes.
+
+    ``params`` holds ``input_video_path``, ``download_path`` and optionally
+    ``threads``/``max_jobs`` for the core budget (see :func:`render_parallel`).
+    Clips without text are smart-cut (stream-copied except for their edge
+    GOPs, see mimesis.smartcut) unless ``stream_copy`` is False in
+    ``params`` or ``clip_render``, or the source codec cannot be smart-cut
+    or has no keyframe index.
+    With ``filtergraph`` set, the other clips share decodes through one
+    multi-output filtergraph per group (see mimesis.filtergraph).
+    Returns ``output_video_paths`` for the clips that rendered, in clip
+    order, and ``failures`` mapping each failed clip number to its error.
+    """
     try:
         input_video_path = params.get("input_video_path")
         download_path = params.get("download_path", os.getcwd())
@@ -33,45 +189,47 @@ def process_clips_ffmpeg(params, clips):
         # Get file extension to determine appropriate codecs
         file_extension = os.path.splitext(input_video_path)[1]
         codecs = get_codecs_by_extension(file_extension)
-        video_codec = codecs["video_codec"]
-        audio_codec = codecs["audio_codec"]
-        
-        output_video_paths = []
-        
-        # Process each clip
+
+        stream_copy = params.get("stream_copy", _render_settings().get("stream_copy", True))
+        if stream_copy and any(not text for _, _, text in clips):
+            from mimesis.keyframes import get_index
+            from mimesis.smartcut import can_smart_cut
+
+            # Without a keyframe index there is nothing to cut on; re-encode instead
+            stream_copy = can_smart_cut(input_video_path) and get_index(input_video_path) is not None
+
+        filtergraph = params.get("filtergraph", _render_settings().get("filtergraph", False))
+
+        commands, batched = [], []
         for idx, (start, end, text) in enumerate(clips, start=1):
             output_video_path = os.path.join(download_path, f"clip_{idx}.mp4")
-            logger.info(f"Processing clip {idx} from {start}s to {end}s...")
-            
-            # FFmpeg command to extract clips
-            ffmpeg_command = [
-                "ffmpeg", 
-                "-i", input_video_path, 
-                "-ss", str(start), 
-                "-to", str(end), 
-                "-c:v", video_codec, 
-                "-c:a", audio_codec, 
-                "-strict", "experimental"
-            ]
-            
-            if text:
-                # Adding overlay text if present
-                ffmpeg_command.extend([
-                    "-vf", f"drawtext=text='{text}':x=10:y=10:fontsize=24:fontcolor=yellow"
-                ])
-            
-            ffmpeg_command.append(output_video_path)
-
-            try:
-                subprocess.run(ffmpeg_command, check=True)
-                logger.info(f"Clip {idx} created: {output_video_path}")
-                output_video_paths.append(output_video_path)
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Error extracting clip {idx}: {e}")
-                logger.info(traceback.format_exc())
-                raise
-        
-        return {"output_video_paths": output_video_paths}
+            logger.info(f"Queueing clip {idx} from {start}s to {end}s...")
+            if stream_copy and not text:
+                commands.append((_smart_cut_job(input_video_path, start, end, output_video_path), output_video_path))
+            elif filtergraph:
+                batched.append((start, end, text, output_video_path))
+            else:
+                commands.append((
+                    ffmpeg_clip_command(input_video_path, start, end, output_video_path, codecs, text),
+                    output_video_path,
+                ))
+
+        by_output = {}
+        if commands:
+            for result in render_parallel(commands, params.get("threads"), params.get("max_jobs")):
+                by_output[result["output"]] = result
+        if batched:
+            from mimesis.filtergraph import extract_clips
+
+            for result in extract_clips(input_video_path, batched, codecs, total_threads=params.get("threads"),
+                                        max_jobs=params.get("max_jobs")):
+                by_output[result["output"]] = result
+        results = [by_output[os.path.join(download_path, f"clip_{idx}.mp4")] for idx in range(1, len(clips) + 1)]
+        output_video_paths = [result["output"] for result in results if result["ok"]]
+        failures = {idx: result["error"] for idx, result in enumerate(results, start=1) if not result["ok"]}
+        logger.info(f"Created {len(output_video_paths)} clips, {len(failures)} failed")
+
+        return {"output_video_paths": output_video_paths, "failures": failures}
     
     except Exception as e:
         logger.error(f"Error in process_clips_ffmpeg: {e}")
@@ -81,7 +239,19 @@ def process_clips_ffmpeg(params, clips):
 
 
 def process_clips_gstreamer(params, clips):
+    """Render ``(start, end, text)`` clips through one reused GStreamer decoder.
+
+    Opens the source once and segment-seeks it for every clip (see
+    mimesis.gstreamer). ``params`` holds ``input_video_path``,
+    ``download_path`` and optionally ``font_desc``, ``text_color``,
+    ``text_halign``, ``text_valign`` and ``threads``. Returns
+    ``output_video_paths`` in clip order, ``failures`` by clip number and
+    ``timings`` (seconds per rendered clip). Raises RuntimeError when
+    PyGObject/GStreamer is not installed.
+    """
     try:
+        from mimesis.gstreamer import GstClipRenderer
+
         input_video_path = params.get("input_video_path")
         download_path = params.get("download_path", os.getcwd())
 
@@ -91,40 +261,26 @@ def process_clips_gstreamer(params, clips):
         if not os.path.exists(input_video_path):
             raise FileNotFoundError(f"Input video file not found: {input_video_path}")
         
-        output_video_paths = []
-        
-        # Process each clip
-        for idx, (start, end, text) in enumerate(clips, start=1):
-            output_video_path = os.path.join(download_path, f"clip_{idx}.mp4")
-            logger.info(f"Processing clip {idx} from {start}s to {end}s...")
-
-            # GStreamer command to extract clips
-            gstreamer_command = [
-                "gst-launch-1.0", 
-                "filesrc", f"location={input_video_path}", 
-                "decodebin", 
-                "videoconvert", 
-                "x264enc", 
-                "mp4mux", 
-                f"filesink location={output_video_path}"
-            ]
-            
-            if text:
-                # Adding text overlay if present
-                gstreamer_command.extend([
-                    "textoverlay", f"text={text}:font-desc='Arial, 24':halign=left:valign=top"
-                ])
-            
-            try:
-                subprocess.run(gstreamer_command, check=True)
-                logger.info(f"Clip {idx} created: {output_video_path}")
-                output_video_paths.append(output_video_path)
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Error extracting clip {idx}: {e}")
-                logger.info(traceback.format_exc())
-                raise
-
-        return {"output_video_paths": output_video_paths}
+        jobs = [
+            (start, end, text, os.path.join(download_path, f"clip_{idx}.mp4"))
+            for idx, (start, end, text) in enumerate(clips, start=1)
+        ]
+        with GstClipRenderer(
+            input_video_path,
+            font_desc=params.get("font_desc", "Arial 24"),
+            text_color=params.get("text_color", "white"),
+            halign=params.get("text_halign", "left"),
+            valign=params.get("text_valign", "top"),
+            threads=params.get("threads", 0),
+        ) as renderer:
+            results = renderer.render_many(jobs)
+
+        output_video_paths = [result["output"] for result in results if result["ok"]]
+        failures = {idx: result["error"] for idx, result in enumerate(results, start=1) if not result["ok"]}
+        timings = {idx: result["seconds"] for idx, result in enumerate(results, start=1) if result["ok"]}
+        logger.info(f"Created {len(output_video_paths)} clips, {len(failures)} failed")
+
+        return {"output_video_paths": output_video_paths, "failures": failures, "timings": timings}
 
     except Exception as e:
         logger.error(f"Error in process_clips_gstreamer: {e}")
@@ -0,0 +1,338 @@
+"""Long-lived transcription service reachable over a Unix domain socket.
+
+The daemon keeps Whisper models resident (through
+:mod:`mimesis.model_registry`) and works through a priority queue of jobs so
+scripts and the dispatcher can submit many videos without paying for a
+Python start, a torch import and a model load each time.
+
+Protocol: one JSON object per line.  Requests carry an ``op``:
+
+* ``{"op": "ping"}``
+* ``{"op": "submit", "job": {"path": ..., "model": ..., "task": ..., "formats": [...], "priority": 0}}``
+* ``{"op": "status", "job_id": ...}``
+* ``{"op": "wait", "job_id": ...}`` - streams ``progress`` events until ``done``/``error``
+"""
+
+import itertools
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/mimesis-whisper.sock"
+TASKS = ("transcribe", "translate")
+# Seconds a finished job stays queryable when nobody waits for its result
+FINISHED_JOB_TTL = 3600.0
+
+
+def default_socket_path() -> str:
+    """Return the socket path from the environment or ``app_config``."""
+    env_path = os.environ.get("MIMESIS_WHISPER_SOCKET")
+    if env_path:
+        return env_path
+    try:
+        from mimesis.video import load_app_config
+
+        return load_app_config().get("whisper_daemon", {}).get("socket_path", DEFAULT_SOCKET_PATH)
+    except Exception:
+        return DEFAULT_SOCKET_PATH
+
+
+def run_whisper_job(job: dict, progress: Callable) -> dict:
+    """Default job runner: one Whisper pass producing the requested artifacts."""
+    from mimesis.whisper import whisper_transcribe_artifacts
+
+    decode_options = {"task": job.get("task", "transcribe")}
+    if job.get("language"):
+        decode_options["language"] = job["language"]
+    artifacts = whisper_transcribe_artifacts(
+        job["path"],
+        output_dir=job.get("output_dir"),
+        model_name=job.get("model", "base"),
+        formats=tuple(job.get("formats", ("txt",))),
+        progress=progress,
+        vad=job.get("vad", False),
+        use_daemon=False,
+        **decode_options,
+    )
+    return {
+        "text": artifacts["text"],
+        "minute": artifacts["minute"],
+        "segments": artifacts["segments"],
+        "sentences": artifacts["sentences"],
+        "skipped_fraction": artifacts["skipped_fraction"],
+        "paths": artifacts["paths"],
+    }
+
+
+class _Job:
+    def __init__(self, job_id: str, spec: dict):
+        self.id = job_id
+        self.spec = spec
+        self.state = "queued"
+        self.stage = "queued"
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+        self.changed = threading.Condition()
+
+    def update(self, **fields):
+        with self.changed:
+            for name, value in fields.items():
+                setattr(self, name, value)
+            self.changed.notify_all()
+
+    def snapshot(self) -> dict:
+        return {
+            "job_id": self.id,
+            "state": self.state,
+            "stage": self.stage,
+            "progress": self.progress,
+            "priority": self.spec.get("priority", 0),
+            "path": self.spec.get("path"),
+        }
+
+
+class TranscriptionDaemon:
+    """Priority job queue served over a Unix socket.
+
+    Lower ``priority`` values run first; equal priorities run in submission
+    order.  A finished job is dropped once its result has been sent to a
+    waiting client, or ``finished_ttl`` seconds after it finished otherwise.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        runner: Callable = run_whisper_job,
+        workers: int = 1,
+        finished_ttl: float = FINISHED_JOB_TTL,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self.runner = runner
+        self.workers = workers
+        self.finished_ttl = finished_ttl
+        self.jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._server = None
+        self._threads = []
+
+    # --- job handling -------------------------------------------------
+    def submit(self, spec: dict) -> str:
+        if not spec.get("path"):
+            raise ValueError("job requires a 'path'")
+        if spec.get("task", "transcribe") not in TASKS:
+            raise ValueError(f"task must be one of {TASKS}")
+        job = _Job(uuid.uuid4().hex[:12], spec)
+        self._expire_finished()
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+        self._queue.put((spec.get("priority", 0), next(self._counter), job.id))
+        logger.info("Queued job %s for %s (priority %s)", job.id, spec["path"], spec.get("priority", 0))
+        return job.id
+
+    def _work(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            if job_id is None:
+                return
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            job.update(state="running", stage="starting")
+            logger.info("Running job %s", job_id)
+            try:
+                result = self.runner(
+                    job.spec,
+                    lambda stage, fraction: job.update(stage=stage, progress=round(fraction, 3)),
+                )
+                job.update(state="done", stage="done", progress=1.0, result=result, finished=time.time())
+            except Exception as exc:
+                logger.error("Job %s failed: %s", job_id, exc)
+                job.update(state="error", stage="error", error=str(exc), finished=time.time())
+
+    def _forget(self, job_id: str):
+        with self._jobs_lock:
+            self.jobs.pop(job_id, None)
+
+    def _expire_finished(self):
+        cutoff = time.time() - self.finished_ttl
+        with self._jobs_lock:
+            for job_id in [i for i, job in self.jobs.items() if job.finished is not None and job.finished <= cutoff]:
+                del self.jobs[job_id]
+
+    # --- socket server ------------------------------------------------
+    def _handle(self, request: dict, send: Callable):
+        op = request.get("op")
+        if op == "ping":
+            send({"ok": True, "queued": self._queue.qsize()})
+        elif op == "submit":
+            send({"ok": True, "job_id": self.submit(request.get("job", {}))})
+        elif op == "status":
+            self._expire_finished()
+            job = self.jobs.get(request.get("job_id"))
+            if job is None:
+                send({"ok": False, "error": "unknown job"})
+            else:
+                send({"ok": True, "job": job.snapshot()})
+        elif op == "wait":
+            job = self.jobs.get(request.get("job_id"))
+            if job is None:
+                send({"ok": False, "error": "unknown job"})
+                return
+            last = None
+            while True:
+                with job.changed:
+                    while (job.state, job.stage, job.progress) == last:
+                        job.changed.wait()
+                    last = (job.state, job.stage, job.progress)
+                    snapshot, result, error = job.snapshot(), job.result, job.error
+                send({"ok": True, "event": "progress", "job": snapshot})
+                if snapshot["state"] == "done":
+                    self._forget(job.id)
+                    send({"ok": True, "event": "done", "result": result})
+                    return
+                if snapshot["state"] == "error":
+                    self._forget(job.id)
+                    send({"ok": False, "event": "error", "error": error})
+                    return
+        else:
+            send({"ok": False, "error": f"unknown op {op!r}"})
+
+    def start(self):
+        """Start worker threads and the socket server in the background."""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                def send(message):
+                    self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+
+                for line in self.rfile:
+                    try:
+                        daemon._handle(json.loads(line), send)
+                    except Exception as exc:
+                        send({"ok": False, "error": str(exc)})
+
+        if os.path.exists(self.socket_path):
+            if daemon_running(self.socket_path):
+                raise RuntimeError(f"A transcription daemon is already listening on {self.socket_path}")
+            os.remove(self.socket_path)
+
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self._server.daemon_threads = True
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        logger.info("Transcription daemon listening on %s", self.socket_path)
+        return self
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            logger.info("Stopping transcription daemon")
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for _ in self._threads:
+            self._queue.put((float("inf"), next(self._counter), None))
+        self._threads = []
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+# --- client side --------------------------------------------------------
+def _connect(socket_path: str, timeout: Optional[float] = None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(socket_path)
+    return sock
+
+
+def daemon_running(socket_path: Optional[str] = None) -> bool:
+    """Return True when a daemon answers ``ping`` on ``socket_path``."""
+    socket_path = socket_path or default_socket_path()
+    if not os.path.exists(socket_path):
+        return False
+    try:
+        with _connect(socket_path, timeout=1.0) as sock:
+            sock.sendall(b'{"op": "ping"}\n')
+            return json.loads(sock.makefile("r").readline()).get("ok", False)
+    except (OSError, ValueError):
+        return False
+
+
+def submit_job(
+    path: str,
+    socket_path: Optional[str] = None,
+    wait: bool = True,
+    on_progress: Optional[Callable] = None,
+    **job,
+):
+    """Submit a job to the daemon.
+
+    Returns the job id when ``wait`` is False, otherwise blocks until the job
+    finishes and returns its result.  ``on_progress`` receives each status
+    snapshot while waiting.
+    """
+    socket_path = socket_path or default_socket_path()
+    with _connect(socket_path) as sock:
+        reader = sock.makefile("r")
+
+        def request(message):
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            return json.loads(reader.readline())
+
+        reply = request({"op": "submit", "job": dict(job, path=os.path.abspath(path))})
+        if not reply.get("ok"):
+            raise RuntimeError(f"Daemon rejected job: {reply.get('error')}")
+        job_id = reply["job_id"]
+        if not wait:
+            return job_id
+
+        sock.sendall((json.dumps({"op": "wait", "job_id": job_id}) + "\n").encode("utf-8"))
+        for line in reader:
+            message = json.loads(line)
+            event = message.get("event")
+            if event == "progress" and on_progress:
+                on_progress(message["job"])
+            elif event == "done":
+                return message["result"]
+            elif not message.get("ok"):
+                raise RuntimeError(f"Daemon job {job_id} failed: {message.get('error')}")
+    raise RuntimeError(f"Daemon closed the connection before job {job_id} finished")
+
+
+def job_status(job_id: str, socket_path: Optional[str] = None) -> dict:
+    """Return the status snapshot of a submitted job."""
+    with _connect(socket_path or default_socket_path()) as sock:
+        sock.sendall((json.dumps({"op": "status", "job_id": job_id}) + "\n").encode("utf-8"))
+        reply = json.loads(sock.makefile("r").readline())
+    if not reply.get("ok"):
+        raise RuntimeError(reply.get("error"))
+    return reply["job"]
@@ -0,0 +1,187 @@
+"""One-decode, many-outputs clip extraction through a single filtergraph.
+
+Rendering N clips as N ffmpeg runs decodes the source N times.  Here a
+group of clips shares one run: the decoded video and audio are ``split``
+into one branch per clip, each branch is cut with ``trim``/``atrim`` (plus
+an optional ``drawtext``) and every branch is encoded to its own output::
+
+    [0:v]split=2[v0][v1];[0:a]asplit=2[a0][a1];
+    [v0]trim=start=3:end=9,setpts=PTS-STARTPTS[vo0];[a0]atrim=...[ao0];
+    [v1]trim=start=40:end=52,setpts=PTS-STARTPTS,drawtext=...[vo1];...
+
+Each group's input is opened at the keyframe before its first clip, and
+decoding stops at its last clip's end.  :func:`plan_groups` keeps groups
+small enough to bound encoder memory, and it starts a new group (a new
+invocation with its own seek) when the next clip is too far away to be
+worth decoding through.
+"""
+
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_OUTPUTS = 8
+DEFAULT_MAX_GAP = 120.0
+DEFAULT_MEMORY_MB = 2048
+ENCODER_BUFFER_FRAMES = 60  # lookahead and reference frames an x264 encoder holds
+
+
+def outputs_for_memory(width, height, memory_mb=DEFAULT_MEMORY_MB, frames=ENCODER_BUFFER_FRAMES) -> int:
+    """How many concurrent encoders of ``width``x``height`` YUV420 frames fit in ``memory_mb``."""
+    per_output = width * height * 3 // 2 * frames
+    return max(1, int(memory_mb * 1024 * 1024 // max(per_output, 1)))
+
+
+def plan_groups(clips, max_outputs=DEFAULT_MAX_OUTPUTS, max_gap=DEFAULT_MAX_GAP) -> list:
+    """Group clip indices for shared decodes.
+
+    Args:
+        clips (list): ``(start, end, ...)`` tuples.
+        max_outputs (int): Clips per invocation at most.
+        max_gap (float): Seconds of unused video between two clips beyond
+            which seeking (a new invocation) beats decoding through.
+
+    Returns:
+        list[list[int]]: Indices into ``clips``, each group sorted by start time.
+    """
+    order = sorted(range(len(clips)), key=lambda i: (clips[i][0], clips[i][1]))
+    groups = []
+    group_end = None
+    for i in order:
+        start, end = clips[i][0], clips[i][1]
+        if groups and len(groups[-1]) < max_outputs and start - group_end <= max_gap:
+            groups[-1].append(i)
+            group_end = max(group_end, end)
+        else:
+            groups.append([i])
+            group_end = end
+    return groups
+
+
+def build_command(input_path, clips, codecs, seek_to=0.0, drawtext=None, threads=None, audio=True) -> list:
+    """ffmpeg argv writing every ``(start, end, text, output_path)`` clip from one decode.
+
+    Args:
+        input_path (str): Source video.
+        clips (list): ``(start, end, text, output_path)`` tuples; ``text`` may be empty.
+        codecs (dict): ``video_codec`` and ``audio_codec`` (see get_codecs_by_extension).
+        seek_to (float): Keyframe time the input is opened at; clip times stay absolute.
+        drawtext (str): drawtext options (without ``text=``) for clips with text.
+        threads (int): Encoder threads per output.
+        audio (bool): Whether the source has an audio stream to cut as well.
+    """
+    from mimesis.clips import escape_drawtext
+
+    n = len(clips)
+    graph = [f"[0:v]split={n}" + "".join(f"[v{i}]" for i in range(n))]
+    if audio:
+        graph.append(f"[0:a]asplit={n}" + "".join(f"[a{i}]" for i in range(n)))
+    for i, (start, end, text, _) in enumerate(clips):
+        # Input seeking rebases timestamps to the keyframe, so trim relative to it
+        video = f"[v{i}]trim=start={start - seek_to:.6f}:end={end - seek_to:.6f},setpts=PTS-STARTPTS"
+        if text:
+            options = drawtext or "x=10:y=10:fontsize=24:fontcolor=yellow"
+            video += f",drawtext=text='{escape_drawtext(text)}':{options}"
+        graph.append(f"{video}[vo{i}]")
+        if audio:
+            graph.append(
+                f"[a{i}]atrim=start={start - seek_to:.6f}:end={end - seek_to:.6f},asetpts=PTS-STARTPTS[ao{i}]"
+            )
+
+    last_end = max(end for _, end, _, _ in clips)
+    command = ["ffmpeg", "-nostdin", "-y", "-loglevel", "error"]
+    if seek_to > 0:
+        command += ["-ss", f"{seek_to:.6f}"]
+    command += ["-t", f"{last_end - seek_to:.6f}", "-i", input_path, "-filter_complex", ";".join(graph)]
+    for i, (_, _, _, output_path) in enumerate(clips):
+        command += ["-map", f"[vo{i}]"]
+        if audio:
+            command += ["-map", f"[ao{i}]", "-c:a", codecs["audio_codec"]]
+        command += ["-c:v", codecs["video_codec"]]
+        if threads:
+            command += ["-threads", str(threads)]
+        command.append(output_path)
+    return command
+
+
+def has_audio_stream(input_path) -> bool:
+    cmd = ["ffprobe", "-v", "error", "-select_streams", "a", "-show_entries", "stream=index", "-of", "csv=p=0",
+           input_path]
+    try:
+        return bool(subprocess.run(cmd, capture_output=True, check=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return True
+
+
+def probe_frame_size(input_path):
+    """``(width, height)`` of the first video stream, or None when it cannot be probed."""
+    from mimesis.smartcut import probe_video_stream
+
+    try:
+        stream = probe_video_stream(input_path)
+    except (OSError, RuntimeError):
+        return None
+    if stream.get("width") and stream.get("height"):
+        return int(stream["width"]), int(stream["height"])
+    return None
+
+
+def extract_clips(input_path, clips, codecs, drawtext=None, max_outputs=None, max_gap=None,
+                  memory_mb=None, frame_size=None, runner=None, **render_options) -> list:
+    """Write ``(start, end, text, output_path)`` clips with one decode per group.
+
+    Args:
+        input_path (str): Source video.
+        clips (list): ``(start, end, text, output_path)`` tuples.
+        codecs (dict): ``video_codec`` and ``audio_codec``.
+        drawtext (str): drawtext options for clips with text.
+        max_outputs, max_gap: See :func:`plan_groups`; default to ``clip_render``
+            in app_config (``batch_max_outputs``, ``batch_max_gap``).
+        memory_mb (float): Encoder memory budget per invocation, which caps
+            ``max_outputs`` for ``frame_size`` (``(width, height)``) frames;
+            defaults to ``clip_render.batch_memory_mb``.
+        frame_size (tuple): Source ``(width, height)``; probed when omitted.
+        runner (callable): ``subprocess.run`` replacement, mainly for tests.
+        **render_options: ``total_threads``/``max_jobs``/``min_threads`` for
+            mimesis.clips.render_parallel, which runs the groups.
+
+    Returns:
+        list[dict]: Per clip, in input order: ``output``, ``ok``, ``error`` and
+        ``seconds`` (the wall time of the clip's group).
+    """
+    from mimesis.clips import _render_settings, render_parallel
+    from mimesis.keyframes import get_index
+
+    settings = _render_settings()
+    max_outputs = max_outputs or settings.get("batch_max_outputs", DEFAULT_MAX_OUTPUTS)
+    max_gap = max_gap if max_gap is not None else settings.get("batch_max_gap", DEFAULT_MAX_GAP)
+    frame_size = frame_size or probe_frame_size(input_path)
+    if frame_size:
+        limit = outputs_for_memory(*frame_size, memory_mb or settings.get("batch_memory_mb", DEFAULT_MEMORY_MB))
+        max_outputs = min(max_outputs, limit)
+    runner = runner or subprocess.run
+
+    groups = plan_groups(clips, max_outputs, max_gap)
+    index = get_index(input_path)
+    audio = has_audio_stream(input_path)
+    logger.info(f"Extracting {len(clips)} clips in {len(groups)} decodes")
+
+    def job(group):
+        members = [clips[i] for i in group]
+        seek_to = index.previous(members[0][0])[0] if index else members[0][0]
+
+        def run(threads):
+            per_output = max(1, threads // len(members))
+            runner(build_command(input_path, members, codecs, seek_to, drawtext, per_output, audio),
+                   check=True, capture_output=True)
+
+        return run, ", ".join(member[3] for member in members)
+
+    group_results = render_parallel([job(group) for group in groups], runner=runner, **render_options)
+
+    results = [None] * len(clips)
+    for group, result in zip(groups, group_results):
+        for i in group:
+            results[i] = dict(result, output=clips[i][3])
+    return results
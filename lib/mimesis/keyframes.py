@@ -0,0 +1,203 @@
+"""Per-video keyframe index for fast, exact seeking.
+
+Putting ``-ss`` after ``-i`` makes ffmpeg decode everything before the clip,
+so a clip near the end of a two-hour video costs a two-hour decode.  A
+:class:`KeyframeIndex` records the time and byte offset of every video
+keyframe (one ffprobe packet scan per video, cached as JSON next to the
+video) so a cutter can jump straight to the keyframe at or before the clip
+and decode only the few seconds up to its first frame::
+
+    index = get_index("talk.mp4")
+    argv = ["ffmpeg", *index.seek_args("talk.mp4", 5400.0, 5412.5), "out.mp4"]
+"""
+
+import bisect
+import json
+import logging
+import os
+import subprocess
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".keyframe_index"
+# Bumped when cached indexes must be rebuilt (2: times relative to format.start_time)
+INDEX_VERSION = 2
+
+
+def parse_packets(csv_text: str, start_time: float = 0.0):
+    """Return ``(times, offsets)`` of keyframe packets from ffprobe's ``pts_time,pos,flags`` CSV.
+
+    ``start_time`` (the container's ``format.start_time``) is subtracted so
+    times are relative to the start of the file, as ``-ss`` and clip times are.
+    """
+    keyframes = []
+    for line in csv_text.splitlines():
+        parts = line.strip().split(",")
+        if len(parts) < 3 or "K" not in parts[2]:
+            continue
+        try:
+            time = float(parts[0]) - start_time
+        except ValueError:
+            continue
+        offset = int(parts[1]) if parts[1].isdigit() else -1
+        keyframes.append((round(time, 6), offset))
+    keyframes.sort()
+    return [time for time, _ in keyframes], [offset for _, offset in keyframes]
+
+
+def probe_start_time(video_path: str) -> float:
+    """The container's ``format.start_time`` in seconds (non-zero for MPEG-TS and many remuxes)."""
+    cmd = ["ffprobe", "-v", "error", "-show_entries", "format=start_time", "-of", "csv=p=0", video_path]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True, text=True).stdout.strip()
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffprobe failed to read the start time of {video_path}: {e.stderr}") from e
+    try:
+        return float(out)
+    except ValueError:
+        return 0.0
+
+
+def probe_keyframes(video_path: str):
+    """Scan the first video stream's packets (no decoding) and return file-relative ``(times, offsets)``."""
+    cmd = [
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,pos,flags",
+        "-of", "csv=p=0", video_path,
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffprobe failed to index {video_path}: {e.stderr.decode(errors='replace')}") from e
+    return parse_packets(out.decode(errors="replace"), probe_start_time(video_path))
+
+
+class KeyframeIndex:
+    """Sorted keyframe times (seconds) and byte offsets of one video."""
+
+    def __init__(self, times, offsets=None):
+        self.times = list(times)
+        self.offsets = list(offsets) if offsets is not None else [-1] * len(self.times)
+
+    def previous(self, t: float):
+        """Return ``(time, offset)`` of the last keyframe at or before ``t`` (the first one when none is)."""
+        if not self.times:
+            return 0.0, 0
+        i = max(0, bisect.bisect_right(self.times, t + 1e-6) - 1)
+        return self.times[i], self.offsets[i]
+
+    def next(self, t: float):
+        """Return ``(time, offset)`` of the first keyframe at or after ``t``, or None."""
+        i = bisect.bisect_left(self.times, t - 1e-6)
+        return (self.times[i], self.offsets[i]) if i < len(self.times) else None
+
+    def seek_args(self, video_path: str, start: float, end: Optional[float] = None) -> list:
+        """ffmpeg input arguments that jump to the preceding keyframe, then trim to ``start``-``end``.
+
+        The first ``-ss`` lands on a keyframe, so ffmpeg seeks without
+        decoding; the output-side ``-ss`` then discards the frames between
+        that keyframe and ``start``.
+        """
+        keyframe, _ = self.previous(start)
+        args = []
+        if keyframe > 0:
+            args += ["-ss", f"{keyframe:.6f}"]
+        args += ["-i", video_path]
+        if start - keyframe > 1e-6:
+            args += ["-ss", f"{start - keyframe:.6f}"]
+        if end is not None:
+            args += ["-t", f"{max(0.0, end - start):.6f}"]
+        return args
+
+    def to_dict(self) -> dict:
+        return {"version": INDEX_VERSION, "times": self.times, "offsets": self.offsets}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KeyframeIndex":
+        return cls(data["times"], data.get("offsets"))
+
+
+class KeyframeIndexStore:
+    """Probe-once cache of keyframe indexes, keyed by video content.
+
+    Args:
+        directory (str): Where index files live; None puts them next to each video.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(directory) if directory else None
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, video_path: str) -> str:
+        from mimesis.sidecar import content_key
+
+        directory = self.directory or os.path.join(os.path.dirname(os.path.abspath(video_path)), INDEX_DIRNAME)
+        return os.path.join(directory, f"{content_key(video_path)}.json")
+
+    def get(self, video_path: str) -> KeyframeIndex:
+        path = self.path_for(video_path)
+        with self._lock:
+            if path in self._memory:
+                return self._memory[path]
+            data = None
+            if os.path.exists(path):
+                with open(path, "r") as f:
+                    data = json.load(f)
+            if data is not None and data.get("version") == INDEX_VERSION:
+                index = KeyframeIndex.from_dict(data)
+            else:
+                logger.info(f"🔑 Indexing keyframes of {video_path}")
+                index = KeyframeIndex(*probe_keyframes(video_path))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(index.to_dict(), f)
+                os.replace(tmp_path, path)
+                logger.info(f"🔑 Indexed {len(index.times)} keyframes")
+            self._memory[path] = index
+            return index
+
+
+_store = None
+
+
+def get_store() -> Optional[KeyframeIndexStore]:
+    """Return the store configured under ``keyframe_index`` in ``app_config``, or None when disabled."""
+    global _store
+    if _store is None:
+        try:
+            from mimesis.video import load_app_config
+
+            settings = load_app_config().get("keyframe_index", {})
+        except Exception:
+            settings = {}
+        if not settings.get("enabled", True):
+            return None
+        _store = KeyframeIndexStore(settings.get("dir"))
+    return _store
+
+
+def get_index(video_path: str) -> Optional[KeyframeIndex]:
+    """Return the keyframe index of ``video_path``, or None when disabled or unavailable."""
+    store = get_store()
+    if store is None:
+        return None
+    try:
+        return store.get(video_path)
+    except Exception as e:
+        logger.warning(f"⚠️ No keyframe index for {video_path}: {e}")
+        return None
+
+
+def seek_args(video_path: str, start: float, end: Optional[float] = None) -> list:
+    """Keyframe-aligned ffmpeg input arguments for a clip, falling back to plain input seeking."""
+    index = get_index(video_path)
+    if index is not None:
+        return index.seek_args(video_path, start, end)
+    args = (["-ss", f"{start:.6f}"] if start else []) + ["-i", video_path]
+    if end is not None:
+        args += ["-t", f"{max(0.0, end - start):.6f}"]
+    return args
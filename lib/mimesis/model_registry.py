@@ -0,0 +1,216 @@
+"""Process-wide registry of loaded Whisper models.
+
+Loading Whisper weights costs seconds to minutes, so every transcription
+helper asks this registry for its model instead of calling
+``whisper.load_model`` directly.  Models are keyed by size, device and
+compute options and evicted least-recently-used once the configured memory
+budget is exceeded.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "base"
+DEFAULT_MEMORY_BUDGET_MB = 4096
+
+# Approximate float32 footprint used when a model cannot report its own size.
+WHISPER_MODEL_SIZES_MB = {
+    "tiny": 151,
+    "base": 290,
+    "small": 967,
+    "medium": 3055,
+    "large": 6174,
+}
+
+
+QUANTIZE_MODES = ("int8",)
+
+
+def quantize_model(model, mode: str = "int8"):
+    """Apply dynamic quantization to the linear layers of a CPU Whisper model.
+
+    Whisper wraps its projections in a ``nn.Linear`` subclass that torch's
+    dynamic quantizer does not recognise, so they are swapped for plain
+    ``nn.Linear`` modules (sharing the same weights) first.
+    """
+    import torch
+
+    if mode not in QUANTIZE_MODES:
+        raise ValueError(f"Unsupported Whisper quantization mode: {mode!r}")
+
+    def plain_linears(module):
+        for child_name, child in module.named_children():
+            if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                linear = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+                linear.weight = child.weight
+                linear.bias = child.bias
+                setattr(module, child_name, linear)
+            else:
+                plain_linears(child)
+
+    plain_linears(model)
+    return torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_whisper(name: str, device: Optional[str] = None, quantize: Optional[str] = None, **options):
+    """Load a Whisper model with the upstream loader, optionally quantized for CPU."""
+    import whisper
+
+    if quantize:
+        # Quantized kernels only exist on CPU
+        return quantize_model(whisper.load_model(name, device="cpu", **options), quantize)
+    return whisper.load_model(name, device=device, **options)
+
+
+def _tensors(value):
+    """Yield the tensors in a ``state_dict`` value; packed quantized params are ``(weight, bias)`` tuples."""
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _tensors(item)
+    elif hasattr(value, "numel") and hasattr(value, "element_size"):
+        yield value
+
+
+def _estimate_nbytes(model, name: str) -> int:
+    """Return the in-memory size of ``model`` in bytes.
+
+    Counts ``state_dict()`` rather than ``parameters()``: after
+    ``quantize_dynamic`` the int8 weights live in packed params, which
+    ``parameters()`` does not list.
+    """
+    try:
+        sizes = {}
+        for tensor in list(_tensors(list(model.state_dict().values()))) + list(model.buffers()):
+            try:
+                key = (tensor.data_ptr(), tensor.numel())
+            except Exception:
+                key = id(tensor)
+            sizes[key] = tensor.numel() * tensor.element_size()
+        nbytes = sum(sizes.values())
+        if nbytes:
+            return nbytes
+    except Exception:
+        pass
+    base_name = name.split(".")[0].split("-")[0]
+    return WHISPER_MODEL_SIZES_MB.get(base_name, WHISPER_MODEL_SIZES_MB["large"]) * 1024 * 1024
+
+
+class ModelRegistry:
+    """LRU cache of loaded models bounded by a memory budget.
+
+    The most recently requested model is always kept, even when it alone
+    exceeds the budget.
+    """
+
+    def __init__(
+        self,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        loader: Callable = _load_whisper,
+        sizer: Callable = _estimate_nbytes,
+    ):
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self._loader = loader
+        self._sizer = sizer
+        self._models = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(name: str, device: Optional[str] = None, **options) -> tuple:
+        return (name, device, tuple(sorted(options.items())))
+
+    def get(self, name: str = DEFAULT_MODEL, device: Optional[str] = None, **options):
+        """Return the model for ``name``/``device``/``options``, loading it on a miss."""
+        key = self.make_key(name, device, **options)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key][0]
+
+            logger.info("Loading Whisper model %s (device=%s, options=%s)", name, device, options)
+            model = self._loader(name, device=device, **options)
+            nbytes = self._sizer(model, name)
+            self._models[key] = (model, nbytes)
+            self._evict()
+            return model
+
+    def _evict(self):
+        while len(self._models) > 1 and self.memory_in_use > self.memory_budget:
+            key, (_, nbytes) = self._models.popitem(last=False)
+            logger.info("Evicting Whisper model %s (%.0f MB)", key[0], nbytes / 1024 / 1024)
+
+    @property
+    def memory_in_use(self) -> int:
+        return sum(nbytes for _, nbytes in self._models.values())
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._models)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def _whisper_config(key: str, default=None):
+    try:
+        from mimesis.video import load_app_config
+
+        return load_app_config().get("whisper", {}).get(key, default)
+    except Exception:
+        return default
+
+
+def _configured_budget_mb() -> float:
+    return _whisper_config("memory_budget_mb", DEFAULT_MEMORY_BUDGET_MB)
+
+
+def configured_quantize() -> Optional[str]:
+    """Return ``whisper.quantize`` from ``app_config`` (None means float32)."""
+    return _whisper_config("quantize") or None
+
+
+def resolve_quantize(quantize=None) -> Optional[str]:
+    """Resolve an explicit ``quantize`` argument, falling back to the configured mode.
+
+    ``False`` forces float32 even when ``app_config`` enables quantization.
+    """
+    if quantize is None:
+        return configured_quantize()
+    return quantize or None
+
+
+def get_registry() -> ModelRegistry:
+    """Return the process-wide registry, creating it from ``app_config`` on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(memory_budget_mb=_configured_budget_mb())
+        return _registry
+
+
+def configure_registry(memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB, **kwargs) -> ModelRegistry:
+    """Replace the process-wide registry, dropping any loaded models."""
+    global _registry
+    with _registry_lock:
+        _registry = ModelRegistry(memory_budget_mb=memory_budget_mb, **kwargs)
+        return _registry
+
+
+def get_whisper_model(name: str = DEFAULT_MODEL, device: Optional[str] = None, quantize=None, **options):
+    """Return a shared Whisper model, loading it at most once per process.
+
+    ``quantize`` ("int8") selects a dynamically quantized CPU model; when
+    omitted, ``whisper.quantize`` from ``app_config`` decides.
+    """
+    quantize = resolve_quantize(quantize)
+    if quantize:
+        options["quantize"] = quantize
+    return get_registry().get(name, device=device, **options)
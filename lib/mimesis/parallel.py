@@ -0,0 +1,95 @@
+"""Multi-process parallel Whisper transcription of audio chunks on CPU.
+
+Each worker process loads its model once (through the model registry) and
+caps its torch thread count so ``workers * threads`` never exceeds the
+available cores.  Chunks are distributed across the pool and results come
+back in input order.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_worker_model = None
+
+
+def threads_per_worker(workers: int, cpu_count: Optional[int] = None) -> int:
+    """Split the machine's cores evenly between ``workers`` processes."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return max(1, cpu_count // max(1, workers))
+
+
+def _init_worker(model_name: str, threads: int):
+    global _worker_model
+    # Must be set before torch spins up its thread pools
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+
+    import torch
+    from mimesis.model_registry import get_whisper_model
+
+    torch.set_num_threads(threads)
+    _worker_model = model_name
+    get_whisper_model(model_name)
+
+
+def _transcribe_chunk(task):
+    from mimesis.transcript_cache import cached_transcribe
+
+    index, samples, decode_options = task
+    result = cached_transcribe(samples, _worker_model, **decode_options)
+    return index, {
+        "text": result["text"],
+        "segments": result.get("segments", []),
+        "language": result.get("language"),
+    }
+
+
+def transcribe_chunks_parallel(
+    chunks,
+    model_name: str = "base",
+    workers: Optional[int] = None,
+    threads: Optional[int] = None,
+    on_result=None,
+    **decode_options,
+) -> list:
+    """Transcribe audio chunks across a process pool.
+
+    Args:
+        chunks (list): 16 kHz mono float32 arrays.
+        model_name (str): Whisper model size, loaded once per worker.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        threads (int): Torch threads per worker (defaults to cores / workers).
+        on_result (callable): Called as ``on_result(index, result)`` as soon as
+            each chunk (in order) is available.
+        **decode_options: Passed to ``model.transcribe``.
+
+    Returns:
+        list[dict]: ``{"text", "segments", "language"}`` per chunk, in input order.
+    """
+    if not chunks:
+        return []
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunks)))
+    threads = threads or threads_per_worker(workers)
+    logger.info("Transcribing %d chunks with %d workers x %d threads", len(chunks), workers, threads)
+
+    results = [None] * len(chunks)
+    # spawn: forking a process that already holds torch thread pools can deadlock
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(model_name, threads),
+    ) as pool:
+        tasks = [(index, chunk, decode_options) for index, chunk in enumerate(chunks)]
+        for index, result in pool.map(_transcribe_chunk, tasks):
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+    return results
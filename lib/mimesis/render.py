@@ -0,0 +1,161 @@
+"""Clip renderer backends: moviepy compositing, native ffmpeg filters or GStreamer.
+
+The moviepy path decodes every frame into NumPy, composites a ``TextClip``
+over it in Python and pipes it back out to an encoder.  The ``ffmpeg``
+backend turns the same clip dict and captions config (``font``,
+``font_size``, ``text_color``, ``text_halign``, ``text_valign``) into
+``drawtext`` filtergraphs, so frames never leave ffmpeg.  Clips are cut
+through the keyframe index, and several of them share one decode when
+``clip_render.filtergraph`` is on (see mimesis.filtergraph).  The encodes
+run under the render_parallel core budget.  ``gstreamer`` renders the same
+jobs through one reused GStreamer decoder (see mimesis.gstreamer).
+"""
+
+import functools
+import logging
+import os
+import subprocess
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+RENDERERS = ("moviepy", "ffmpeg", "gstreamer")
+DEFAULT_STYLE = {
+    "font": "Arial",
+    "font_size": 48,
+    "text_color": "white",
+    "text_halign": "center",
+    "text_valign": "bottom",
+}
+CODECS = {"video_codec": "libx264", "audio_codec": "aac"}
+
+
+def caption_style(*configs) -> dict:
+    """Merge the caption keys of ``configs``; earlier configs win, then the defaults."""
+    style = {}
+    for key, default in DEFAULT_STYLE.items():
+        style[key] = next((config[key] for config in configs if config and key in config), default)
+    return style
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_font_file(font: str) -> Optional[str]:
+    """Font file fontconfig picks for ``font`` (e.g. "Arial Bold"), or None without fc-match."""
+    try:
+        proc = subprocess.run(["fc-match", "-f", "%{file}", font], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip() or None
+
+
+def drawtext_for(style: dict) -> str:
+    """drawtext options for a caption ``style`` (see :func:`caption_style`)."""
+    from mimesis.clips import drawtext_options
+
+    return drawtext_options(
+        style["font"], style["font_size"], style["text_color"], style["text_halign"], style["text_valign"],
+        font_file=resolve_font_file(style["font"]),
+    )
+
+
+def render_clips(input_video, jobs, style, codecs=None, filtergraph=None, **render_options) -> list:
+    """Cut and caption ``(start, end, text, output_path)`` jobs with ffmpeg.
+
+    Args:
+        input_video (str): Source video.
+        jobs (list): ``(start, end, text, output_path)``; empty text renders no caption.
+        style (dict): Caption style (see :func:`caption_style`).
+        codecs (dict): ``video_codec``/``audio_codec`` (default libx264/aac, like the moviepy path).
+        filtergraph (bool): Share decodes between clips (default: ``clip_render.filtergraph``).
+        **render_options: ``total_threads``/``max_jobs``/``min_threads`` for render_parallel.
+
+    Returns:
+        list[dict]: Per job, in input order: ``output``, ``ok``, ``error``, ``seconds``.
+    """
+    from mimesis.clips import _render_settings, ffmpeg_clip_command, render_parallel
+
+    codecs = codecs or CODECS
+    drawtext = drawtext_for(style)
+    if filtergraph is None:
+        filtergraph = _render_settings().get("filtergraph", False)
+    if filtergraph:
+        from mimesis.filtergraph import extract_clips
+
+        return extract_clips(input_video, jobs, codecs, drawtext, **render_options)
+    commands = [
+        (ffmpeg_clip_command(input_video, start, end, output, codecs, text, drawtext), output)
+        for start, end, text, output in jobs
+    ]
+    return render_parallel(commands, **render_options)
+
+
+def caption_files(jobs, style, **render_options) -> list:
+    """Burn captions into whole files: ``(input_path, text, output_path)`` jobs.
+
+    The audio is copied and only the video is re-encoded.
+    """
+    from mimesis.clips import escape_drawtext, render_parallel
+
+    drawtext = drawtext_for(style)
+    commands = []
+    for input_path, text, output in jobs:
+        command = ["ffmpeg", "-nostdin", "-y", "-i", input_path]
+        if text:
+            command += ["-vf", f"drawtext=text='{escape_drawtext(text)}':{drawtext}"]
+        commands.append((command + ["-c:v", CODECS["video_codec"], "-c:a", "copy", output], output))
+    return render_parallel(commands, **render_options)
+
+
+def render_clips_gstreamer(input_video, jobs, style, threads=0) -> list:
+    """The GStreamer equivalent of :func:`render_clips`: one decoder, a segment seek per job."""
+    from mimesis.gstreamer import GstClipRenderer
+
+    with GstClipRenderer(
+        input_video,
+        font_desc=f"{style['font']} {style['font_size']}",
+        text_color=style["text_color"],
+        halign=style["text_halign"],
+        valign=style["text_valign"],
+        threads=threads,
+    ) as renderer:
+        return renderer.render_many(jobs)
+
+
+def render_clips_moviepy(input_video, jobs, style) -> list:
+    """The moviepy compositing equivalent of :func:`render_clips` (kept for comparison and fallback)."""
+    import time
+    from moviepy.editor import CompositeVideoClip, TextClip, VideoFileClip
+    from mimesis.video import write_video
+
+    results = []
+    with VideoFileClip(input_video) as video:
+        for start, end, text, output in jobs:
+            started = time.perf_counter()
+            try:
+                segment = video.subclip(start, end)
+                if text:
+                    txt_clip = (
+                        TextClip(text, fontsize=style["font_size"], font=style["font"], color=style["text_color"])
+                        .set_position((style["text_halign"], style["text_valign"]))
+                        .set_duration(segment.duration)
+                    )
+                    segment = CompositeVideoClip([segment, txt_clip])
+                write_video(segment, output, codec=CODECS["video_codec"], audio_codec=CODECS["audio_codec"],
+                            logger=None)
+                results.append({"output": output, "ok": True, "error": None,
+                                "seconds": time.perf_counter() - started})
+            except Exception as e:
+                logger.error(f"Error rendering {output}: {e}")
+                results.append({"output": output, "ok": False, "error": str(e),
+                                "seconds": time.perf_counter() - started})
+    return results
+
+
+def clip_jobs(clips, texts, output_dir) -> list:
+    """``(start, end, text, output_path)`` jobs for a clip dict, with ``texts[(clip_name, index)]``."""
+    return [
+        (clip["start"], clip["end"], texts.get((clip_name, index), "").strip(),
+         os.path.join(output_dir, f"{clip_name}.mp4"))
+        for clip_name, clip_list in clips.items()
+        for index, clip in enumerate(clip_list)
+    ]
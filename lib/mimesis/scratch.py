@@ -0,0 +1,218 @@
+"""RAM-backed scratch space for intermediate files.
+
+Temporary WAVs, moviepy's temp audio tracks and other intermediates go to a
+tmpfs (``/dev/shm`` by default) while their ``size_hint`` fits under a byte
+quota, and to a disk directory once it is used up or when no hint is given.  Every file or directory is handed out by
+a context manager that removes it on exit, even when the body raises, and
+each process keeps its files in its own ``<pid>-<token>`` session directory
+so a startup sweep can delete whatever a killed process left behind.
+Scratch roots are per user (``mimesis-scratch-<uid>``, mode 0700), and a
+tmpfs root that cannot be used falls back to the disk directory.
+
+Usage::
+
+    with scratch_file(".wav", size_hint=60 * 16000 * 2) as wav_path:
+        extract_range_to_wav(video, 0, 60, wav_path)
+        ...
+"""
+
+import atexit
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RAM_DIR = "/dev/shm"
+DEFAULT_QUOTA_MB = 512
+SCRATCH_DIRNAME = "mimesis-scratch"
+
+
+def _user_dirname() -> str:
+    """``mimesis-scratch-<uid>``, so users sharing a machine never share a root."""
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return f"{SCRATCH_DIRNAME}-{user}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ScratchSpace:
+    """Quota-limited tmpfs scratch with disk fallback and guaranteed cleanup.
+
+    Args:
+        ram_dir (str): tmpfs mount to prefer; None or a missing path disables it.
+        quota_mb (float): Bytes this process may keep in ``ram_dir`` at once.
+        disk_dir (str): Fallback directory (defaults to the system temp dir).
+    """
+
+    def __init__(self, ram_dir: Optional[str] = DEFAULT_RAM_DIR, quota_mb: float = DEFAULT_QUOTA_MB,
+                 disk_dir: Optional[str] = None):
+        self.ram_root = None
+        if ram_dir and os.path.isdir(ram_dir) and os.access(ram_dir, os.W_OK):
+            self.ram_root = os.path.join(ram_dir, _user_dirname())
+        self.disk_root = os.path.join(disk_dir or tempfile.gettempdir(), _user_dirname())
+        self.quota = int(quota_mb * 1024 * 1024)
+        self.session = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._reserved = 0
+        self._lock = threading.Lock()
+
+    def _session_dir(self, root: str) -> str:
+        os.makedirs(root, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid") and os.stat(root).st_uid != os.getuid():
+            raise PermissionError(f"Scratch root {root} belongs to another user")
+        path = os.path.join(root, self.session)
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        return path
+
+    def _make(self, ram_root: Optional[str], make):
+        """Return ``(make(session_dir), used_ram)``, falling back to disk when the tmpfs root fails."""
+        if ram_root:
+            try:
+                return make(self._session_dir(ram_root)), True
+            except OSError as e:
+                logger.warning("Scratch root %s is unusable (%s); using %s", ram_root, e, self.disk_root)
+                self.ram_root = None
+        return make(self._session_dir(self.disk_root)), False
+
+    def _reserve(self, size_hint: int) -> Optional[str]:
+        """Return the root to use, reserving ``size_hint`` bytes of RAM quota when it fits.
+
+        Requests without a hint go to disk: their size cannot be checked
+        against the quota, and a full-length WAV would fill the tmpfs.
+        """
+        with self._lock:
+            if self.ram_root is not None and size_hint > 0:
+                used = max(self._reserved, _tree_size(os.path.join(self.ram_root, self.session)))
+                free = shutil.disk_usage(os.path.dirname(self.ram_root)).free
+                if used + size_hint <= self.quota and size_hint < free:
+                    self._reserved += size_hint
+                    return self.ram_root
+            return None
+
+    def _release(self, size_hint: int):
+        with self._lock:
+            self._reserved = max(0, self._reserved - size_hint)
+
+    @contextlib.contextmanager
+    def file(self, suffix: str = "", size_hint: int = 0):
+        """Yield a fresh scratch file path; the file is removed on exit."""
+        ram_root = self._reserve(size_hint)
+        used_ram = False
+        try:
+            (fd, path), used_ram = self._make(ram_root, lambda root: tempfile.mkstemp(suffix=suffix, dir=root))
+        finally:
+            if ram_root and not used_ram:
+                self._release(size_hint)
+        os.close(fd)
+        try:
+            yield path
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+            if used_ram:
+                self._release(size_hint)
+
+    @contextlib.contextmanager
+    def directory(self, size_hint: int = 0):
+        """Yield a fresh scratch directory; it is removed with its contents on exit."""
+        ram_root = self._reserve(size_hint)
+        used_ram = False
+        try:
+            path, used_ram = self._make(ram_root, lambda root: tempfile.mkdtemp(dir=root))
+        finally:
+            if ram_root and not used_ram:
+                self._release(size_hint)
+        try:
+            yield path
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+            if used_ram:
+                self._release(size_hint)
+
+    def roots(self) -> list:
+        return [root for root in (self.ram_root, self.disk_root) if root]
+
+    def sweep_orphans(self) -> list:
+        """Delete session directories whose owning process is gone; return them."""
+        removed = []
+        for root in self.roots():
+            if not os.path.isdir(root):
+                continue
+            for name in os.listdir(root):
+                pid = name.split("-", 1)[0]
+                if name == self.session or not pid.isdigit() or _pid_alive(int(pid)):
+                    continue
+                path = os.path.join(root, name)
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+        if removed:
+            logger.info("Removed %d orphaned scratch directories", len(removed))
+        return removed
+
+    def cleanup(self):
+        """Remove this process's session directories."""
+        for root in self.roots():
+            shutil.rmtree(os.path.join(root, self.session), ignore_errors=True)
+
+
+_scratch = None
+_scratch_lock = threading.Lock()
+
+
+def get_scratch() -> ScratchSpace:
+    """Return the process-wide scratch space from ``scratch`` in ``app_config``.
+
+    The first call sweeps orphans left by dead processes and registers
+    cleanup of this process's files at exit.
+    """
+    global _scratch
+    with _scratch_lock:
+        if _scratch is None:
+            try:
+                from mimesis.video import load_app_config
+
+                settings = load_app_config().get("scratch", {})
+            except Exception:
+                settings = {}
+            _scratch = ScratchSpace(
+                settings.get("ram_dir", DEFAULT_RAM_DIR),
+                settings.get("quota_mb", DEFAULT_QUOTA_MB),
+                settings.get("disk_dir"),
+            )
+            _scratch.sweep_orphans()
+            atexit.register(_scratch.cleanup)
+        return _scratch
+
+
+def scratch_file(suffix: str = "", size_hint: int = 0):
+    """Context manager yielding a path in the process-wide scratch space."""
+    return get_scratch().file(suffix, size_hint)
+
+
+def scratch_dir(size_hint: int = 0):
+    """Context manager yielding a directory in the process-wide scratch space."""
+    return get_scratch().directory(size_hint)
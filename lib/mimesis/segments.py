@@ -0,0 +1,139 @@
+"""Derive transcript artifacts from Whisper segments.
+
+Every artifact the pipeline writes (full text, per-minute buckets, SRT,
+VTT and sentence chunks) can be built from the timestamped ``segments`` of
+a single ``model.transcribe`` result, so the audio only has to be decoded
+once.
+"""
+
+import json
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_PATTERN = r'(?<=[.!?])\s+'
+
+
+def format_timestamp(seconds, decimal_marker=","):
+    h = int(seconds // 3600)
+    m = int((seconds % 3600) // 60)
+    s = int(seconds % 60)
+    ms = int((seconds - int(seconds)) * 1000)
+    return f"{h:02}:{m:02}:{s:02}{decimal_marker}{ms:03}"
+
+
+def srt_entry(index, seg):
+    start = format_timestamp(seg['start'])
+    end = format_timestamp(seg['end'])
+    text = seg['text'].strip()
+    return f"{index}\n{start} --> {end}\n{text}\n\n"
+
+
+def vtt_entry(seg):
+    start = format_timestamp(seg['start'], ".")
+    end = format_timestamp(seg['end'], ".")
+    text = seg['text'].strip()
+    return f"{start} --> {end}\n{text}\n\n"
+
+
+VTT_HEADER = "WEBVTT\n\n"
+
+
+def write_srt(segments, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        for i, seg in enumerate(segments, start=1):
+            f.write(srt_entry(i, seg))
+    print(f"🎬 SRT saved to {output_path}")
+
+
+def write_vtt(segments, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(VTT_HEADER)
+        for seg in segments:
+            f.write(vtt_entry(seg))
+    print(f"🌍 VTT saved to {output_path}")
+
+
+def merge_results(results, offsets):
+    """Stitch chunk-level Whisper results into one result on the source timeline.
+
+    Args:
+        results (list): Whisper results (``text``, ``segments``) per chunk.
+        offsets (list): Start time in seconds of each chunk.
+    """
+    segments = []
+    for result, offset in zip(results, offsets):
+        for seg in result.get("segments", []):
+            seg = dict(seg, start=seg['start'] + offset, end=seg['end'] + offset)
+            seg['id'] = len(segments)
+            segments.append(seg)
+    languages = [r.get("language") for r in results if r.get("language")]
+    return {
+        "text": "".join(r["text"] for r in results),
+        "segments": segments,
+        "language": languages[0] if languages else None,
+    }
+
+
+def minute_buckets(segments, duration, window=60):
+    """Group segment text into ``"start-ends"`` windows keyed like the per-minute transcript.
+
+    Each segment is assigned to the window containing its start time, so the
+    buckets reproduce ``whisper_transcribe_video_by_minute`` without cutting
+    the audio.
+    """
+    duration = int(duration)
+    last_start = max(duration - 1, 0) // window * window
+    texts = {start: [] for start in range(0, duration, window)}
+    for seg in segments:
+        start = min(int(seg['start'] // window) * window, last_start)
+        texts.setdefault(start, []).append(seg['text'].strip())
+
+    return {
+        f"{start}-{min(start + window, duration)}s": " ".join(parts)
+        for start, parts in sorted(texts.items())
+    }
+
+
+def sentence_chunks(segments):
+    """Split segment text into sentences with approximate start/end times."""
+    all_text = ""
+    for seg in segments:
+        all_text += seg['text'].strip() + " "
+
+    sentences = re.split(SENTENCE_PATTERN, all_text.strip())
+
+    chunks = []
+    seg_idx = 0
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        start_time = None
+        end_time = None
+
+        # Get approximate start and end from segments
+        acc_text = ""
+        while seg_idx < len(segments) and len(acc_text) < len(sentence):
+            seg = segments[seg_idx]
+            if start_time is None:
+                start_time = seg['start']
+            end_time = seg['end']
+            acc_text += seg['text'].strip() + " "
+            seg_idx += 1
+
+        chunks.append({
+            "text": sentence,
+            "start": round(start_time, 2) if start_time else None,
+            "end": round(end_time, 2) if end_time else None
+        })
+    return chunks
+
+
+def write_sentences(segments, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(sentence_chunks(segments), f, indent=2)
+    print(f"Saved sentence chunks to {output_path}")
+    return output_path
@@ -0,0 +1,163 @@
+"""Memory-mapped audio sidecars shared by every stage.
+
+A video's audio is decoded once to 16 kHz mono float32 and saved as an
+``.npy`` file in one shared cache directory (``~/.cache/mimesis/audio_sidecars``
+unless ``audio_sidecar.dir`` names another).  Full-transcript, per-minute and per-clip stages then
+memory-map that file and slice the ranges they need without copying or
+running ffmpeg again.
+
+Sidecars are named by a fingerprint of the video's content, so renamed or
+copied videos reuse them and edited ones do not.  The shared directory is
+capped in size, so the cap bounds total disk use; the least recently used
+files are evicted first.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+SIDECAR_DIRNAME = ".audio_sidecars"
+DEFAULT_DIR = "~/.cache/mimesis/audio_sidecars"
+DEFAULT_MAX_MB = 4096
+FINGERPRINT_BLOCK = 1024 * 1024
+
+_fingerprints = {}
+
+
+def content_key(video_path: str) -> str:
+    """Return a SHA-256 fingerprint of the file's size and sampled content.
+
+    Hashing multi-gigabyte videos in full costs more than decoding their
+    audio, so the size plus 1 MB from the start, middle and end are hashed.
+    Results are memoized per path, size and mtime.
+    """
+    stat = os.stat(video_path)
+    memo = (os.path.abspath(video_path), stat.st_size, stat.st_mtime_ns)
+    if memo in _fingerprints:
+        return _fingerprints[memo]
+
+    digest = hashlib.sha256(str(stat.st_size).encode("ascii"))
+    with open(video_path, "rb") as fh:
+        for offset in (0, stat.st_size // 2, max(0, stat.st_size - FINGERPRINT_BLOCK)):
+            fh.seek(offset)
+            digest.update(fh.read(FINGERPRINT_BLOCK))
+    _fingerprints[memo] = digest.hexdigest()
+    return _fingerprints[memo]
+
+
+class AudioSidecarStore:
+    """Decode-once store of memory-mapped float32 audio, capped at ``max_mb`` per directory.
+
+    Args:
+        directory (str): Where sidecars live; None puts them next to each video
+            (in which case the cap applies to each of those directories).
+        max_mb (float): Size cap for a sidecar directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_mb: float = DEFAULT_MAX_MB):
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+
+    def sidecar_dir(self, video_path: str) -> str:
+        return self.directory or os.path.join(os.path.dirname(os.path.abspath(video_path)), SIDECAR_DIRNAME)
+
+    def path_for(self, video_path: str) -> str:
+        return os.path.join(self.sidecar_dir(video_path), f"{content_key(video_path)}.npy")
+
+    def get(self, video_path: str):
+        """Return the whole audio track as a read-only memory-mapped array."""
+        import numpy as np
+
+        path = self.path_for(video_path)
+        with self._lock:
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                self._decode(video_path, path)
+                self.evict(os.path.dirname(path), keep=path)
+        return np.load(path, mmap_mode="r")
+
+    def slice(self, video_path: str, start: float = 0.0, end: Optional[float] = None):
+        """Return ``start``-``end`` seconds as a zero-copy view of the sidecar."""
+        audio = self.get(video_path)
+        first = int(max(0.0, start) * SAMPLE_RATE)
+        last = None if end is None else int(end * SAMPLE_RATE)
+        return audio[first:last]
+
+    def _decode(self, video_path, path):
+        import numpy as np
+        from mimesis.audio import load_audio
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        logger.info("Decoding audio sidecar for %s", video_path)
+        audio = load_audio(video_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, audio)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def entries(self, directory: str) -> list:
+        """Return ``(path, size, mtime)`` for every sidecar in ``directory``, oldest first."""
+        found = []
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith(".npy"):
+                    path = os.path.join(directory, name)
+                    stat = os.stat(path)
+                    found.append((path, stat.st_size, stat.st_mtime))
+        return sorted(found, key=lambda entry: entry[2])
+
+    def evict(self, directory: str, keep: Optional[str] = None):
+        """Remove least recently used sidecars until ``directory`` fits the cap."""
+        entries = self.entries(directory)
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            logger.info("Evicting audio sidecar %s (%.0f MB)", path, size / 1024 / 1024)
+            os.remove(path)
+            total -= size
+
+
+_store = None
+
+
+def get_store() -> Optional[AudioSidecarStore]:
+    """Return the store configured under ``audio_sidecar`` in ``app_config``, or None when disabled."""
+    global _store
+    if _store is None:
+        try:
+            from mimesis.video import load_app_config
+
+            settings = load_app_config().get("audio_sidecar", {})
+        except Exception:
+            settings = {}
+        if not settings.get("enabled", True):
+            return None
+        # One shared directory, so max_mb caps the total rather than each video's folder
+        _store = AudioSidecarStore(settings.get("dir") or DEFAULT_DIR, settings.get("max_mb", DEFAULT_MAX_MB))
+    return _store
+
+
+def load_range(video_path: str, start: float = 0.0, end: Optional[float] = None):
+    """Return ``start``-``end`` seconds of audio, from the sidecar when enabled."""
+    store = get_store()
+    if store is None:
+        from mimesis.audio import load_audio
+
+        return load_audio(video_path, start, end)
+    return store.slice(video_path, start or 0.0, end)
@@ -0,0 +1,100 @@
+"""Local stand-in for the Google Speech Recognition HTTP endpoint.
+
+Speaks the same legacy ``speech-api/v2/recognize`` protocol that
+``recognize_google`` uses, so the SpeechRecognition backend can be tested
+and benchmarked offline with a fixed, configurable response time.
+
+Usage::
+
+    with StandinSpeechServer(transcript="hello world", latency=0.2) as server:
+        backend = SpeechRecognitionBackend(endpoint=server.url)
+"""
+
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server.standin
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = server.record(body, self.path)
+        if server.latency:
+            time.sleep(server.latency)
+
+        if status != 200:
+            self.send_response(status)
+            self.end_headers()
+            return
+
+        if server.transcript:
+            result = [{"alternative": [{"transcript": server.transcript, "confidence": 0.9}], "final": True}]
+        else:
+            result = []
+        payload = json.dumps({"result": []}) + "\n" + json.dumps({"result": result, "result_index": 0}) + "\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(payload.encode("utf-8"))
+
+    def log_message(self, format, *args):
+        logger.debug("stand-in: " + format, *args)
+
+
+class StandinSpeechServer:
+    """Threaded HTTP server answering every recognition request the same way.
+
+    Args:
+        transcript (str): Text returned for every request ("" means unintelligible).
+        latency (float): Seconds to wait before answering.
+        fail_first (int): Answer the first N requests with ``fail_status``.
+        fail_status (int): HTTP status used for the failing requests.
+        host (str), port (int): Bind address; port 0 picks a free one.
+    """
+
+    def __init__(self, transcript="stand-in transcript", latency=0.0, fail_first=0, fail_status=503,
+                 host="127.0.0.1", port=0):
+        self.transcript = transcript
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/speech-api/v2/recognize"
+
+    def record(self, body, path):
+        """Log one request and return the HTTP status to answer it with."""
+        with self._lock:
+            self.requests.append({"time": time.monotonic(), "path": path, "bytes": len(body)})
+            return self.fail_status if len(self.requests) <= self.fail_first else 200
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Speech recognition stand-in listening on %s", self.url)
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
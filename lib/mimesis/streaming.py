@@ -0,0 +1,218 @@
+"""Streaming Whisper transcription with progressive SRT/VTT/JSON output.
+
+Audio is read from ffmpeg window by window and every finished segment is
+appended to the subtitle files (and flushed to disk) as soon as it is
+decoded, so long recordings produce usable output early and a crash only
+loses the window in flight.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import tempfile
+
+from mimesis import segments as seg_utils
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+STREAM_FORMATS = ("srt", "vtt", "json")
+
+
+class StreamingTranscriptWriter:
+    """Append segments to SRT, VTT and JSON Lines files as they arrive.
+
+    ``close()`` additionally writes the complete segment list to
+    ``<stem>.json``.
+    """
+
+    def __init__(self, stem, formats=STREAM_FORMATS, fsync=True):
+        self.stem = stem
+        self.formats = tuple(formats)
+        self.fsync = fsync
+        self.segments = []
+        self.paths = {}
+        self._files = {}
+        if "srt" in self.formats:
+            self._open("srt", f"{stem}.srt")
+        if "vtt" in self.formats:
+            self._open("vtt", f"{stem}.vtt").write(seg_utils.VTT_HEADER)
+        if "json" in self.formats:
+            self._open("jsonl", f"{stem}.segments.jsonl")
+        self._flush()
+
+    def _open(self, kind, path):
+        self.paths[kind] = path
+        self._files[kind] = open(path, "w", encoding="utf-8")
+        return self._files[kind]
+
+    def _flush(self):
+        for fh in self._files.values():
+            fh.flush()
+            if self.fsync:
+                os.fsync(fh.fileno())
+
+    def add(self, segment):
+        self.segments.append(segment)
+        if "srt" in self._files:
+            self._files["srt"].write(seg_utils.srt_entry(len(self.segments), segment))
+        if "vtt" in self._files:
+            self._files["vtt"].write(seg_utils.vtt_entry(segment))
+        if "jsonl" in self._files:
+            self._files["jsonl"].write(json.dumps(segment) + "\n")
+        self._flush()
+
+    def close(self):
+        self._flush()
+        for fh in self._files.values():
+            fh.close()
+        self._files = {}
+        if "json" in self.formats:
+            self.paths["json"] = f"{self.stem}.json"
+            with open(self.paths["json"], "w", encoding="utf-8") as fh:
+                json.dump(self.segments, fh, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_pcm_blocks(path, block_seconds, sample_rate=SAMPLE_RATE, start=0.0):
+    """Yield float32 mono blocks of ``block_seconds`` decoded by ffmpeg as they arrive.
+
+    Raises RuntimeError when ffmpeg exits with an error (a missing or corrupt
+    input) instead of ending the stream as if the audio were silent.
+    """
+    import numpy as np
+    from mimesis.audio import ffmpeg_pcm_command
+
+    cmd = ffmpeg_pcm_command(path, start, sample_rate=sample_rate)
+    block_bytes = int(block_seconds * sample_rate) * 2
+    # A file rather than a pipe: nobody drains stderr while stdout is read
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        finished = False
+        try:
+            while True:
+                data = proc.stdout.read(block_bytes)
+                if not data:
+                    break
+                yield np.frombuffer(data[:len(data) // 2 * 2], np.int16).astype(np.float32) / 32768.0
+            finished = True
+        finally:
+            proc.stdout.close()
+            if not finished:
+                proc.kill()
+            returncode = proc.wait()
+        if returncode != 0:
+            stderr.seek(0)
+            lines = stderr.read().decode(errors="replace").strip().splitlines()
+            raise RuntimeError(f"ffmpeg failed to decode {path} (exit {returncode}): {lines[-1] if lines else ''}")
+
+
+def _offset(segments, offset):
+    return [
+        dict(seg, start=round(seg['start'] + offset, 3), end=round(seg['end'] + offset, 3))
+        for seg in segments
+    ]
+
+
+def stream_transcribe(
+    video_path,
+    output_stem=None,
+    model_name="base",
+    window_seconds=30,
+    formats=STREAM_FORMATS,
+    on_segment=None,
+    checkpoint=False,
+    **decode_options,
+):
+    """
+    Transcribes media window by window, writing each segment as it finishes.
+
+    The last segment of a full window may be cut mid-word, so it is held
+    back and the next window starts where the last complete segment ended.
+
+    Args:
+        video_path (str): Path to input media.
+        output_stem (str): Output path without extension; defaults to the input stem.
+        model_name (str): Whisper model size.
+        window_seconds (float): Audio decoded per Whisper call.
+        formats (tuple): Any of "srt", "vtt", "json".
+        on_segment (callable): Called with every finished segment.
+        checkpoint (bool | str): Save every finished window and, on the next
+            run, replay the saved segments and resume decoding after them; the
+            checkpoint is removed once the stream is complete. True uses a
+            directory under ``checkpoint.dir``; a string names the directory.
+        **decode_options: Passed to ``model.transcribe``.
+
+    Returns:
+        dict: ``segments``, ``text`` and ``paths`` of the files written.
+    """
+    import numpy as np
+    from mimesis.transcript_cache import cached_transcribe
+
+    output_stem = output_stem or os.path.splitext(video_path)[0]
+    window = int(window_seconds * SAMPLE_RATE)
+    buffer = np.zeros(0, dtype=np.float32)
+    offset = 0.0
+
+    store = None
+    if checkpoint:
+        from mimesis.checkpoint import TranscriptCheckpoint, default_checkpoint_dir
+
+        directory = checkpoint if isinstance(checkpoint, str) else default_checkpoint_dir(video_path)
+        params = {"model": model_name, "window": window_seconds, "mode": "stream", "options": decode_options}
+        store = TranscriptCheckpoint(directory, video_path, params)
+
+    def emit(segments, start=None):
+        nonlocal window_index
+        for seg in segments:
+            writer.add(seg)
+            if on_segment:
+                on_segment(seg)
+        if store and start is not None:
+            store.save(window_index, start, offset, {"segments": segments})
+        window_index += 1
+
+    window_index = 0
+    with StreamingTranscriptWriter(output_stem, formats) as writer:
+        if store:
+            offset = store.resume_time()
+            for _, _, _, saved in store.completed():
+                emit(saved["segments"])
+            if offset:
+                logger.info(f"⏯️ Resuming streamed transcript at {offset:.0f}s")
+
+        for block in iter_pcm_blocks(video_path, window_seconds, start=offset):
+            buffer = np.concatenate([buffer, block])
+            while len(buffer) >= window:
+                result = cached_transcribe(buffer[:window], model_name, **decode_options)
+                segments = result.get("segments", [])
+                complete = segments[:-1] if len(segments) > 1 else segments
+                advance = complete[-1]['end'] if len(segments) > 1 else window_seconds
+                advance = min(max(advance, 1.0), window_seconds)
+
+                start = offset
+                cut = int(advance * SAMPLE_RATE)
+                buffer = buffer[cut:]
+                offset += cut / SAMPLE_RATE
+                emit(_offset(complete, start), start)
+                logger.info(f"⏩ Streamed transcript up to {offset:.0f}s")
+
+        if len(buffer):
+            result = cached_transcribe(buffer, model_name, **decode_options)
+            start = offset
+            offset += len(buffer) / SAMPLE_RATE
+            emit(_offset(result.get("segments", []), start), start)
+
+    if store:
+        store.discard()
+    return {
+        "segments": writer.segments,
+        "text": " ".join(seg['text'].strip() for seg in writer.segments),
+        "paths": writer.paths,
+    }
@@ -0,0 +1,112 @@
+"""Concurrency caps, rate limiting and jittered retries for remote requests.
+
+:func:`map_throttled` runs a request function over many inputs on a thread
+pool, never more than ``concurrency`` at once and never faster than a
+:class:`TokenBucket` allows, retrying failures with full-jitter exponential
+backoff so a burst of errors does not turn into a synchronized retry storm.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, at most ``capacity`` banked."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until ``tokens`` are available, then take them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0, rng=random.random) -> float:
+    """Full-jitter backoff: uniform in ``[0, min(cap, base * 2**attempt))``."""
+    return rng() * min(cap, base * 2 ** attempt)
+
+
+def call_with_retry(fn, *args, retries: int = 3, retry_on=(Exception,), base_delay: float = 1.0,
+                    max_delay: float = 30.0, sleep=time.sleep, bucket: Optional[TokenBucket] = None):
+    """Call ``fn(*args)``, retrying ``retry_on`` errors up to ``retries`` times.
+
+    Each attempt (including the first) takes a token from ``bucket`` when given.
+    """
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            return fn(*args)
+        except retry_on as e:
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(f"⚠️ Attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+            sleep(delay)
+
+
+def map_throttled(fn, items, concurrency: int = 4, rate: Optional[float] = None, retries: int = 3,
+                  retry_on=(Exception,), base_delay: float = 1.0, on_result=None,
+                  clock=time.monotonic, sleep=time.sleep) -> list:
+    """Apply ``fn`` to every item concurrently under a rate limit.
+
+    Args:
+        fn (callable): Called as ``fn(item)``; runs on worker threads.
+        items (list): Inputs.
+        concurrency (int): Maximum requests in flight.
+        rate (float): Maximum requests started per second (None for no limit).
+        retries (int): Retries per item for ``retry_on`` errors.
+        retry_on (tuple): Exception types worth retrying.
+        base_delay (float): Backoff scale in seconds.
+        on_result (callable): Called in the calling thread as
+            ``on_result(index, result_or_exception)`` as each item finishes.
+        clock (callable), sleep (callable): Time source and sleep used by the
+            rate limit and the retry backoff; tests pass fakes.
+
+    Returns:
+        list: Results in input order; an item that still fails holds its exception.
+    """
+    items = list(items)
+    bucket = TokenBucket(rate, clock=clock, sleep=sleep) if rate else None
+    results = [None] * len(items)
+    if not items:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as pool:
+        futures = {
+            pool.submit(call_with_retry, fn, item, retries=retries, retry_on=retry_on,
+                        base_delay=base_delay, sleep=sleep, bucket=bucket): index
+            for index, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = e
+            if on_result:
+                on_result(index, results[index])
+    return results
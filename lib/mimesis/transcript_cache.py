@@ -0,0 +1,185 @@
+"""Content-addressed on-disk cache of Whisper transcripts.
+
+Entries are keyed by a hash of the decoded audio samples plus the model
+name, task, language and decode options, so the same media reappearing
+under a different file name is still a cache hit.  The cache directory is
+capped in size and evicted least-recently-used (by file mtime).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "~/.cache/mimesis/transcripts"
+DEFAULT_MAX_MB = 512
+
+# Decode options that do not change the transcript.
+_IGNORED_OPTIONS = {"verbose"}
+
+
+def audio_digest(audio) -> str:
+    """Return a SHA-256 hex digest of an audio buffer (NumPy array, bytes, ...)."""
+    view = memoryview(audio)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return hashlib.sha256(view).hexdigest()
+
+
+class TranscriptCache:
+    """Size-capped directory of JSON transcripts addressed by content hash."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_mb: float = DEFAULT_MAX_MB):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(audio, model_name: str, task: str = "transcribe", language: Optional[str] = None, **options) -> str:
+        params = {
+            "model": model_name,
+            "task": task,
+            "language": language,
+            "options": {k: v for k, v in sorted(options.items()) if k not in _IGNORED_OPTIONS},
+        }
+        digest = hashlib.sha256(audio_digest(audio).encode("ascii"))
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                result = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: dict):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(result, fh, default=_to_json)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def entries(self) -> list:
+        """Return ``(mtime, size, path)`` for every cached transcript, oldest first."""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, stat.st_size, path))
+        return sorted(found)
+
+    def evict(self):
+        with self._lock:
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    logger.info("Evicted cached transcript %s", os.path.basename(path))
+                except OSError:
+                    pass
+
+
+def _to_json(value):
+    """Serialize NumPy scalars/arrays that can appear in Whisper results."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+_cache = None
+
+
+def get_cache() -> Optional[TranscriptCache]:
+    """Return the shared cache configured in ``app_config``, or None when disabled."""
+    global _cache
+    if _cache is None:
+        try:
+            from mimesis.video import load_app_config
+
+            settings = load_app_config().get("transcript_cache", {})
+        except Exception:
+            settings = {}
+        if not settings.get("enabled", True):
+            return None
+        _cache = TranscriptCache(
+            settings.get("dir", DEFAULT_CACHE_DIR),
+            settings.get("max_mb", DEFAULT_MAX_MB),
+        )
+    return _cache
+
+
+def cached_transcribe(
+    audio,
+    model_name: str = "base",
+    cache: Optional[TranscriptCache] = None,
+    quantize=None,
+    **decode_options,
+) -> dict:
+    """Transcribe ``audio`` with Whisper, reusing a cached result for identical audio.
+
+    Args:
+        audio: 16 kHz mono float32 samples (as from ``whisper.load_audio``).
+        model_name (str): Whisper model size.
+        cache (TranscriptCache): Cache to use; defaults to the configured one.
+        quantize (str): "int8" for a quantized CPU model, False for float32;
+            defaults to ``whisper.quantize`` in ``app_config``.
+        **decode_options: Passed to ``model.transcribe`` and part of the key.
+
+    Returns:
+        dict: The Whisper result (``text``, ``segments``, ``language``).
+    """
+    from mimesis.model_registry import get_whisper_model, resolve_quantize
+
+    quantize = resolve_quantize(quantize)
+    if quantize:
+        decode_options.setdefault("fp16", False)
+
+    cache = cache or get_cache()
+    key = None
+    if cache is not None:
+        # Quantized output differs from float32, so it gets its own entries
+        key_options = dict(decode_options, quantize=quantize) if quantize else decode_options
+        key = cache.make_key(audio, model_name, **key_options)
+        hit = cache.get(key)
+        if hit is not None:
+            logger.info("Transcript cache hit for %s audio", model_name)
+            return hit
+
+    model = get_whisper_model(model_name, quantize=quantize)
+    result = model.transcribe(audio, **decode_options)
+    if cache is not None:
+        cache.put(key, result)
+    return result
@@ -11,151 +11,220 @@
 #   Transcribes the entire video into one block of text using Whisper.
 #
 # Function: whisper_transcribe_video_by_minute(video_path: str) -> dict[str, str]
-#   Breaks the video into 60-second chunks and transcribes each using Whisper.
+#   Breaks the video into pause-aligned chunks, transcribes each using Whisper
+#   and buckets the text per minute.
 # --------------------------------------------------
 
 import os
-import tempfile
 import logging
-import time
 
-from moviepy.editor import VideoFileClip
-import whisper
 import speech_recognition as sr
 
+from mimesis.audio import samples_to_audio_data
+from mimesis.sidecar import load_range
+from mimesis.transcript_cache import cached_transcribe
+from mimesis.vad import SAMPLE_RATE as VAD_SAMPLE_RATE, extract_speech
+from mimesis.video import transcribe_range
+from mimesis.segments import write_srt, write_vtt, write_sentences
+
 # === Logger Setup ===
 logger = logging.getLogger(__name__)
 logger.info(f"📦 {__name__} imported into {__file__}")
 
 # === WHISPER TRANSCRIPTION FUNCTIONS ===
+# Implemented in mimesis.whisper so both modules share one model registry.
+
+from mimesis.whisper import (
+    whisper_transcribe_full_video,
+    whisper_transcribe_video_by_minute,
+    whisper_transcribe_artifacts,
+)
 
-def whisper_transcribe_full_video(video_path):
+# === GOOGLE SPEECH RECOGNITION TRANSCRIPTION ===
+
+def transcribe_full_video(video_path, backend=None):
     """
-    Transcribes an entire video using OpenAI's Whisper model.
+    Transcribes a full video with the configured speech recognition backend.
 
     Args:
         video_path (str): Path to input video.
+        backend (str | ASRBackend): Backend or backend name (e.g. "google",
+            "whisper-small"; see mimesis.asr); defaults to ``asr.backend``
+            in app_config.
 
     Returns:
-        str: Full transcription as one block of text.
+        str: Full transcription.
     """
-    model = whisper.load_model("base")  # Options: tiny, base, small, medium, large
+    return transcribe_range(video_path, backend=backend)
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        clip = VideoFileClip(video_path)
-        audio = clip.audio
-        audio.write_audiofile(temp_audio_file.name)
-        clip.close()
 
-        result = model.transcribe(temp_audio_file.name)
-        os.remove(temp_audio_file.name)
-        return result["text"]
+def _google_settings():
+    try:
+        from mimesis.video import load_app_config
 
+        asr = load_app_config().get("asr", {})
+    except Exception:
+        asr = {}
+    return {
+        "concurrency": asr.get("google_concurrency", 4),
+        "rate": asr.get("google_rate_per_sec", 5),
+        "retries": asr.get("google_retries", 3),
+        "base_delay": asr.get("google_retry_base", 1.0),
+    }
 
-def whisper_transcribe_video_by_minute(video_path):
-    """
-    Breaks a video into 60-second chunks and transcribes each using Whisper.
 
-    Args:
-        video_path (str): Path to input video.
+CHUNK_PLAN_FILE = "chunk_plan.json"
 
-    Returns:
-        dict[str, str]: Mapping of time ranges to transcribed text.
-    """
-    model = whisper.load_model("base")
-    video = VideoFileClip(video_path)
-    duration = int(video.duration)
-    transcript = {}
 
-    for start in range(0, duration, 60):
-        end = min(start + 60, duration)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-            audio_clip = video.audio.subclip(start, end)
-            audio_clip.write_audiofile(temp_audio_file.name)
+def _saved_plan(plan_path, duration):
+    import json
 
-            result = model.transcribe(temp_audio_file.name)
-            os.remove(temp_audio_file.name)
-            transcript[f"{start}-{end}s"] = result["text"]
+    if not os.path.exists(plan_path):
+        return None
+    with open(plan_path, "r") as f:
+        chunks = [tuple(chunk) for chunk in json.load(f)]
+    if not chunks or abs(chunks[-1][1] - duration) > 1.0:
+        logger.warning(f"⚠️ {plan_path} does not match this video; planning again")
+        return None
+    return chunks
 
-    video.close()
-    return transcript
 
-# === GOOGLE SPEECH RECOGNITION TRANSCRIPTION ===
+def _chunk_plan(audio, duration, output_dir):
+    """Return ``(chunks, txt_paths)`` for a per-chunk run in ``output_dir``.
 
-def transcribe_full_video(video_path):
+    A run that is already under way keeps its boundaries: the plan saved in
+    ``chunk_plan.json`` is reused even if the ``chunking`` settings changed
+    since, and a run started before pause-aligned chunking (``min_XX.txt``
+    files) finishes on fixed minutes. Result files are named by chunk index
+    plus a hash of the plan, so files from another plan are never mixed in.
     """
-    Transcribes a full video using Google Speech Recognition (fallback method).
-
-    Args:
-        video_path (str): Path to input video.
-
-    Returns:
-        str: Full transcription.
+    import glob
+    import hashlib
+    import json
+    import math
+
+    from mimesis.chunking import configured_chunk_options, plan_chunks
+
+    plan_path = os.path.join(output_dir, CHUNK_PLAN_FILE)
+    chunks = _saved_plan(plan_path, duration)
+    if chunks is None and glob.glob(os.path.join(output_dir, "min_[0-9][0-9]*.txt")):
+        logger.info("⏯️ Resuming a fixed-minute run from its min_XX.txt files")
+        last = int(math.ceil(duration))
+        chunks = [(start, min(start + 60, last)) for start in range(0, last, 60)]
+        return chunks, [os.path.join(output_dir, f"min_{start // 60:02d}.txt") for start, _ in chunks]
+    if chunks is None:
+        # Cut at pauses near the target length instead of on every minute boundary
+        chunks = [(round(start, 2), round(end, 2))
+                  for start, end in plan_chunks(audio, VAD_SAMPLE_RATE, **configured_chunk_options())]
+        with open(plan_path, "w") as f:
+            json.dump(chunks, f)
+
+    plan_id = hashlib.sha1(json.dumps(chunks).encode("utf-8")).hexdigest()[:8]
+    return chunks, [os.path.join(output_dir, f"chunk_{index:03d}_{plan_id}.txt") for index in range(len(chunks))]
+
+
+def transcribe_video_by_minute(video_path, output_dir, vad=False, concurrency=None, rate=None, backend=None):
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        audio_path = extract_audio_from_video(video_path, 0, None, temp_audio_file.name)
-        transcription = transcribe_audio(audio_path)
-        os.remove(audio_path)
-        return transcription
+    Transcribes video in pause-aligned chunks (about a minute each, see
+    mimesis.chunking) with the configured speech recognition backend.
 
-
-def transcribe_video_by_minute(video_path, output_dir):
-    """
-    Transcribes video in 1-minute chunks using Google Speech Recognition.
-    Useful as a fallback when Whisper isn't ideal.
+    Each chunk is sliced from the video's memory-mapped audio sidecar
+    (see mimesis.sidecar); only its ``chunk_<index>_<plan>.txt`` result is
+    written, and existing results (including ``min_XX.txt`` files from a
+    fixed-minute run) are reused. Chunks are recognized concurrently under
+    a rate limit, with jittered retries on request errors (see
+    mimesis.throttle and the ``google_*`` settings under ``asr``); local
+    backends recognize one chunk at a time.
 
     Args:
         video_path (str): Path to input video.
-        output_dir (str): Directory to store audio/text files.
+        output_dir (str): Directory to store the per-chunk text files.
+        vad (bool): Send only detected speech to the backend; silent chunks are
+            skipped without recognition (see mimesis.vad).
+        concurrency (int): Requests in flight (default: ``asr.google_concurrency``).
+        rate (float): Requests started per second (default: ``asr.google_rate_per_sec``).
+        backend (str | ASRBackend): Backend or backend name (see mimesis.asr);
+            defaults to ``asr.backend`` in app_config.
 
     Returns:
         str: Full stitched transcript.
     """
-    video = VideoFileClip(video_path)
-    duration = int(video.duration)
+    from mimesis.asr import SpeechRecognitionBackend, get_backend
+    from mimesis.throttle import map_throttled
+
+    if backend is None or isinstance(backend, str):
+        backend = get_backend(backend)
+    remote = isinstance(backend, SpeechRecognitionBackend)
+    settings = _google_settings()
+    if remote:
+        concurrency = concurrency or settings["concurrency"]
+        rate = rate or settings["rate"]
+    else:
+        # A local model is already busy on every core; no requests to rate-limit
+        concurrency, rate = 1, None
+
+    audio = load_range(video_path)
+    duration = len(audio) / VAD_SAMPLE_RATE
     os.makedirs(output_dir, exist_ok=True)
-    recognizer = sr.Recognizer()
-    stitched_transcript = []
-
-    for start in range(0, duration, 60):
-        end = min(start + 60, duration)
-        base_name = f"min_{start // 60:02d}"
-        wav_path = os.path.join(output_dir, f"{base_name}.wav")
-        txt_path = os.path.join(output_dir, f"{base_name}.txt")
-
-        if not os.path.exists(wav_path):
-            try:
-                logger.info(f"🎧 Exporting audio {start}-{end} sec → {wav_path}")
-                audio_clip = video.audio.subclip(start, end)
-                audio_clip.write_audiofile(wav_path)
-            except Exception as e:
-                logger.error(f"❌ Failed to export audio: {e}")
+    chunks, txt_paths = _chunk_plan(audio, duration, output_dir)
+    texts = {}
+    pending = []
+    skipped_seconds = 0.0
+
+    for index, (start, end) in enumerate(chunks):
+        if os.path.exists(txt_paths[index]):
+            with open(txt_paths[index], "r") as f:
+                texts[index] = f.read()
+            continue
+        logger.info(f"🎧 Slicing audio {start:.1f}-{end:.1f} sec")
+        samples = audio[int(start * VAD_SAMPLE_RATE):int(end * VAD_SAMPLE_RATE)]
+        if vad:
+            samples, speech_map = extract_speech(samples, VAD_SAMPLE_RATE)
+            skipped_seconds += speech_map.duration - speech_map.speech_duration
+            if not len(samples):
+                logger.info(f"🔇 No speech in {start:.1f}-{end:.1f} sec, skipping recognition")
+                with open(txt_paths[index], "w") as f:
+                    f.write("")
+                texts[index] = ""
                 continue
-
-        if not os.path.exists(txt_path):
-            logger.info(f"🗣️ Transcribing {base_name}.wav...")
-            text = None
-            for attempt in range(3):
-                try:
-                    with sr.AudioFile(wav_path) as source:
-                        audio_data = recognizer.record(source)
-                        text = recognizer.recognize_google(audio_data)
-                    break
-                except sr.UnknownValueError:
-                    text = "[Unintelligible]"
-                    break
-                except sr.RequestError as e:
-                    logger.warning(f"⚠️ Google error on attempt {attempt+1}: {e}")
-                    time.sleep(2**attempt)
-                    text = None
-
-            with open(txt_path, "w") as f:
-                f.write(text if text is not None else "[ERROR: No transcript]")
-        else:
-            with open(txt_path, "r") as f:
-                text = f.read()
-
-        stitched_transcript.append(f"[{start}-{end} sec]\n{text}\n")
+        pending.append((index, samples))
+
+    def recognize(job):
+        if remote:
+            return backend.recognize(samples_to_audio_data(job[1]), unintelligible="[Unintelligible]")
+        return backend.transcribe(job[1])["text"].strip()
+
+    def finish(position, text):
+        index = pending[position][0]
+        if isinstance(text, Exception):
+            logger.warning(f"⚠️ {backend.name} failed for chunk {index}: {text}")
+            text = "[ERROR: No transcript]"
+        # Written as soon as it arrives, so an interrupted run resumes here
+        with open(txt_paths[index], "w") as f:
+            f.write(text)
+        texts[index] = text
+
+    if pending:
+        logger.info(f"🗣️ Transcribing {len(pending)} chunks with {backend.name}, {concurrency} at a time")
+        map_throttled(
+            recognize,
+            pending,
+            concurrency=concurrency,
+            rate=rate,
+            retries=settings["retries"],
+            retry_on=(sr.RequestError,),
+            base_delay=settings["base_delay"],
+            on_result=finish,
+        )
+
+    stitched_transcript = [
+        f"[{round(start)}-{round(end)} sec]\n{texts[index]}\n"
+        for index, (start, end) in enumerate(chunks)
+        if index in texts
+    ]
+
+    if vad and duration:
+        logger.info(f"🔇 VAD skipped {100 * skipped_seconds / duration:.0f}% of newly decoded audio")
 
     final_path = os.path.join(output_dir, "full_transcript.txt")
     with open(final_path, "w") as f:
@@ -274,90 +343,10 @@ def distill_run_snapshot(output_dir, input_video, urls, config):
 
     logger.info(f"📦 Snapshot completed and saved in: {tb_dir}")
 
-import re
-
 def chunk_sentences(audio_path, model_name='base'):
-    model = whisper.load_model(model_name)
-    result = model.transcribe(audio_path, verbose=False)
-
-    segments = result['segments']  # contains timestamps and text
-    all_text = ""
-    time_cursor = 0.0
-    chunks = []
-    
-    for seg in segments:
-        all_text += seg['text'].strip() + " "
-
-    # Split by sentence
-    sentence_pattern = r'(?<=[.!?])\s+'
-    sentences = re.split(sentence_pattern, all_text.strip())
-
-    seg_idx = 0
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
-
-        start_time = None
-        end_time = None
-
-        # Get approximate start and end from segments
-        acc_text = ""
-        while seg_idx < len(segments) and len(acc_text) < len(sentence):
-            seg = segments[seg_idx]
-            if start_time is None:
-                start_time = seg['start']
-            end_time = seg['end']
-            acc_text += seg['text'].strip() + " "
-            seg_idx += 1
-
-        chunks.append({
-            "text": sentence,
-            "start": round(start_time, 2) if start_time else None,
-            "end": round(end_time, 2) if end_time else None
-        })
+    audio = load_range(audio_path)
+    result = cached_transcribe(audio, model_name, verbose=False)
 
     # Output path
     out_path = os.path.splitext(audio_path)[0] + "_sentences.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(chunks, f, indent=2)
-
-    print(f"Saved sentence chunks to {out_path}")
-    return out_path
-
-
-def write_srt(segments, output_path):
-    def format_timestamp(seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds - int(seconds)) * 1000)
-        return f"{h:02}:{m:02}:{s:02},{ms:03}"
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        for i, seg in enumerate(segments, start=1):
-            start = format_timestamp(seg['start'])
-            end = format_timestamp(seg['end'])
-            text = seg['text'].strip()
-            f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
-    print(f"🎬 SRT saved to {output_path}")
-    
-def write_vtt(segments, output_path):
-    def format_timestamp(seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds - int(seconds)) * 1000)
-        return f"{h:02}:{m:02}:{s:02}.{ms:03}"
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
-        for seg in segments:
-            start = format_timestamp(seg['start'])
-            end = format_timestamp(seg['end'])
-            text = seg['text'].strip()
-            f.write(f"{start} --> {end}\n{text}\n\n")
-    print(f"🌍 VTT saved to {output_path}")
-
-
-
+    return write_sentences(result['segments'], out_path)
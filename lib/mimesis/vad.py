@@ -0,0 +1,153 @@
+"""Energy / zero-crossing voice activity detection on 16 kHz audio.
+
+A cheap NumPy pre-pass that finds speech regions so intros, music beds and
+dead air never reach Whisper or Google Speech Recognition.  Recognizers are
+fed the concatenated speech regions; :class:`SpeechMap` maps timestamps on
+that condensed timeline back onto the original media.
+"""
+
+import bisect
+import logging
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class SpeechMap:
+    """Mapping between the concatenated speech timeline and the original one."""
+
+    def __init__(self, regions, duration):
+        self.regions = [(float(start), float(end)) for start, end in regions]
+        self.duration = float(duration)
+        self._offsets = []
+        total = 0.0
+        for start, end in self.regions:
+            self._offsets.append(total)
+            total += end - start
+        self.speech_duration = total
+
+    @property
+    def skipped_fraction(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+        return max(0.0, 1.0 - self.speech_duration / self.duration)
+
+    def to_original(self, t: float) -> float:
+        """Map a time on the condensed speech timeline back to the source."""
+        if not self.regions:
+            return t
+        index = max(0, bisect.bisect_right(self._offsets, t) - 1)
+        start, end = self.regions[index]
+        return min(start + (t - self._offsets[index]), end)
+
+    def remap_segments(self, segments) -> list:
+        return [
+            dict(seg, start=self.to_original(seg['start']), end=self.to_original(seg['end']))
+            for seg in segments
+        ]
+
+
+def frames_to_regions(flags, frame_seconds, min_speech=0.25, min_silence=0.3, pad=0.15, duration=None):
+    """Turn per-frame speech flags into padded ``(start, end)`` regions in seconds.
+
+    Silence gaps shorter than ``min_silence`` are bridged, speech runs shorter
+    than ``min_speech`` are dropped and each region is padded by ``pad``.
+    """
+    runs = []
+    run_start = None
+    for index, is_speech in enumerate(list(flags) + [False]):
+        if is_speech and run_start is None:
+            run_start = index
+        elif not is_speech and run_start is not None:
+            runs.append([run_start * frame_seconds, index * frame_seconds])
+            run_start = None
+
+    merged = []
+    for run in runs:
+        if merged and run[0] - merged[-1][1] < min_silence:
+            merged[-1][1] = run[1]
+        else:
+            merged.append(run)
+
+    if duration is None:
+        duration = len(flags) * frame_seconds
+    regions = []
+    for start, end in merged:
+        if end - start < min_speech:
+            continue
+        start, end = max(0.0, start - pad), min(duration, end + pad)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def detect_speech(
+    audio,
+    sample_rate=SAMPLE_RATE,
+    frame_ms=30,
+    energy_margin_db=10.0,
+    min_energy_db=-50.0,
+    max_zcr=0.35,
+    **region_options,
+):
+    """Return speech regions ``[(start, end), ...]`` in seconds.
+
+    A frame counts as speech when its energy is ``energy_margin_db`` above the
+    estimated noise floor and it is not dominated by high zero-crossing hiss
+    (unless it is loud enough that the crossing rate does not matter).
+    """
+    import numpy as np
+
+    audio = np.asarray(audio, dtype=np.float32)
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
+
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    noise_floor = np.percentile(energy_db, 10)
+    threshold = max(noise_floor + energy_margin_db, min_energy_db)
+    loud = energy_db > threshold
+    flags = loud & ((zcr < max_zcr) | (energy_db > threshold + energy_margin_db))
+
+    return frames_to_regions(
+        flags.tolist(), frame / sample_rate, duration=len(audio) / sample_rate, **region_options
+    )
+
+
+def extract_speech(audio, sample_rate=SAMPLE_RATE, **vad_options):
+    """Return ``(speech_audio, SpeechMap)`` with only the detected speech regions."""
+    import numpy as np
+
+    regions = detect_speech(audio, sample_rate, **vad_options)
+    speech_map = SpeechMap(regions, len(audio) / sample_rate)
+    pieces = [audio[int(start * sample_rate):int(end * sample_rate)] for start, end in regions]
+    speech = np.concatenate(pieces) if pieces else audio[:0]
+    logger.info(
+        "VAD kept %.1fs of %.1fs (%.0f%% skipped)",
+        speech_map.speech_duration,
+        speech_map.duration,
+        100 * speech_map.skipped_fraction,
+    )
+    return speech, speech_map
+
+
+def write_wav(path, samples, sample_rate=SAMPLE_RATE):
+    """Write mono float samples in [-1, 1] as a 16-bit PCM WAV file."""
+    import wave
+    import numpy as np
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return path
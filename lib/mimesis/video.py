@@ -9,16 +9,20 @@
 #    Initializes logging for the script.
 #
 # 2. extract_audio_from_video(video_path: str, start_time: float, end_time: float, temp_audio_path: str) -> str
-#    Extracts audio from a video between the specified time range.
+#    Extracts audio from a video between the specified time range (ffmpeg input seeking, see mimesis.ranges).
 #
-# 3. transcribe_audio(audio_path: str) -> str
-#    Converts an audio file to text using speech recognition.
+# 3. transcribe_audio(audio_path: str | sr.AudioData) -> str
+#    Converts an audio file (or in-memory AudioData) to text with Google speech recognition (see mimesis.asr).
 #
-# 4. process_clip(video_path: str, start_time: float, end_time: float) -> str
-#    Extracts, transcribes, and allows confirmation of the text before adding captions.
+#    transcribe_range(video_path: str, start_time: float, end_time: float, backend=None) -> str
+#    Slices a time range from the video's memory-mapped audio sidecar and transcribes it
+#    with the configured ASR backend.
 #
-# 5. process_clips_moviepy(config: dict, clips: dict, logger: logging.Logger, input_video: str, output_dir: str, captions_config)
-#    Processes video clips by adding captions and saving them.
+# 4. process_clip(video_path: str, start_time: float, end_time: float, transcription: str = None) -> str
+#    Extracts, transcribes (unless a transcription is passed in), and allows confirmation of the text before adding captions.
+#
+# 5. process_clips_moviepy(config: dict, clips: dict, logger: logging.Logger, input_video: str, output_dir: str, captions_config, renderer: str = "moviepy")
+#    Processes video clips by adding captions and saving them (renderer="ffmpeg"/"gstreamer" render them natively).
 #
 # 6. create_output_directory(base_dir: str = "clips") -> str
 #    Creates an output directory named based on a timestamp and video filename.
@@ -42,7 +46,6 @@ import logging
 import json
 import datetime
 import yaml
-import tempfile
 import time
 import platform
 import speech_recognition as sr
@@ -158,32 +161,59 @@ def load_app_config():
 # AUDIO EXTRACTION AND CAPTIONING
 # ==================================================
 def extract_audio_from_video(video_path, start_time, end_time, temp_audio_path):
-    video = VideoFileClip(video_path).subclip(start_time, end_time)
-    video.audio.write_audiofile(temp_audio_path)
-    return temp_audio_path
+    # Input seeking + exact trim: cost follows the clip length, not its offset
+    from mimesis.ranges import extract_range_to_wav
+
+    return extract_range_to_wav(video_path, start_time or 0, end_time, temp_audio_path)
+
+
+def write_video(clip, output_file, audio_codec="aac", **kwargs):
+    """``clip.write_videofile`` with moviepy's temporary audio track kept in scratch space."""
+    from moviepy.tools import find_extension
+    from mimesis.scratch import scratch_file
+
+    size_hint = int((clip.duration or 0) * 44100 * 4)
+    with scratch_file("." + find_extension(audio_codec), size_hint) as temp_audio:
+        clip.write_videofile(output_file, audio_codec=audio_codec, temp_audiofile=temp_audio, **kwargs)
+    return output_file
 
 
 def transcribe_audio(audio_path):
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_path) as source:
-        audio_data = recognizer.record(source)
-    try:
-        return recognizer.recognize_google(audio_data)
-    except (sr.UnknownValueError, sr.RequestError):
-        return ""
+    """Recognize an audio file or ``sr.AudioData`` with Google, using the ``asr`` settings.
+
+    ``sr.RequestError`` propagates; unintelligible audio yields "".
+    """
+    from mimesis.asr import get_backend
+
+    backend = get_backend("google")
+    if isinstance(audio_path, sr.AudioData):
+        audio_data = audio_path
+    else:
+        with sr.AudioFile(audio_path) as source:
+            audio_data = backend.recognizer.record(source)
+    return backend.recognize(audio_data)
+
+
+def transcribe_range(video_path, start_time=0, end_time=None, backend=None):
+    """Transcribe ``start_time``-``end_time`` of a video, sliced from its audio sidecar.
+
+    ``backend`` is an ASR backend or backend name; defaults to ``asr.backend``
+    in app_config (see mimesis.asr).
+    """
+    from mimesis.asr import get_backend
+    from mimesis.sidecar import load_range
+
+    if backend is None or isinstance(backend, str):
+        backend = get_backend(backend)
+    return backend.transcribe(load_range(video_path, start_time or 0, end_time))["text"]
 
 
 def process_clip1(video_path, start_time, end_time):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        audio_path = extract_audio_from_video(
-            video_path, start_time, end_time, temp_audio_file.name
-        )
-        transcription = transcribe_audio(audio_path)
-        os.remove(audio_path)
-        user_input = input(
-            f"Transcribed text: '{transcription}'\nPress Enter to keep or type a new caption: "
-        )
-        return user_input.strip() if user_input else transcription
+    transcription = transcribe_range(video_path, start_time, end_time)
+    user_input = input(
+        f"Transcribed text: '{transcription}'\nPress Enter to keep or type a new caption: "
+    )
+    return user_input.strip() if user_input else transcription
 
 
 def timed_input(prompt, timeout=10):
@@ -208,27 +238,34 @@ def timed_input(prompt, timeout=10):
     return result["input"]
 
 
-def process_clip(video_path, start_time, end_time):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        audio_path = extract_audio_from_video(
-            video_path, start_time, end_time, temp_audio_file.name
-        )
-        transcription = transcribe_audio(audio_path)
-        os.remove(audio_path)
+def process_clip(video_path, start_time, end_time, transcription=None):
+    if transcription is None:
+        transcription = transcribe_range(video_path, start_time, end_time)
 
-        user_input = timed_input(
-            f"Transcribed text: '{transcription}'\nPress Enter to keep or type a new caption (10s timeout): ",
-            timeout=10,
-        )
-        return user_input.strip() if user_input else transcription
+    user_input = timed_input(
+        f"Transcribed text: '{transcription}'\nPress Enter to keep or type a new caption (10s timeout): ",
+        timeout=10,
+    )
+    return user_input.strip() if user_input else transcription
 
 
 # ==================================================
 # NEW: Generate Transcripts from Clip Set
 # ==================================================
 def generate_clip_transcripts(input_video, clips, output_yaml_path, logger=None):
+    from mimesis.clip_audio import transcribe_clips
+
+    # Clips without text are transcribed together from one decode up front
+    untranscribed = {
+        (clip_name, index)
+        for clip_name, clip_list in clips.items()
+        for index, clip in enumerate(clip_list)
+        if not clip.get("text", "").strip()
+    }
+    transcripts = transcribe_clips(input_video, clips, only=untranscribed) if untranscribed else {}
+
     for clip_name, clip_list in clips.items():
-        for clip in clip_list:
+        for index, clip in enumerate(clip_list):
             start, end = clip["start"], clip["end"]
 
             if logger:
@@ -246,14 +283,9 @@ def generate_clip_transcripts(input_video, clips, output_yaml_path, logger=None)
                     continue  # keep existing text, move to next clip
 
             # Step 2: transcribe audio
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".wav"
-            ) as temp_audio_file:
-                audio_path = extract_audio_from_video(
-                    input_video, start, end, temp_audio_file.name
-                )
-                transcription = transcribe_audio(audio_path)
-                os.remove(audio_path)
+            transcription = transcripts.get((clip_name, index))
+            if transcription is None:
+                transcription = transcribe_range(input_video, start, end)
 
             # Step 3: confirm or edit transcription
             print(f'\n📝 Transcribed: "{transcription}"')
@@ -280,9 +312,14 @@ def generate_clip_transcripts(input_video, clips, output_yaml_path, logger=None)
 # PROCESS CLIPS
 # ==================================================
 def process_clips_moviepy(
-    config, clips, logger, input_video, output_dir, captions_config=None
+    config, clips, logger, input_video, output_dir, captions_config=None, renderer="moviepy"
 ):
-    video_clip = VideoFileClip(input_video)
+    """Write every clip of ``clips`` with its confirmed caption burned in.
+
+    ``renderer="ffmpeg"`` renders the same captions with ffmpeg's drawtext
+    filter (see mimesis.render) instead of compositing frames in moviepy;
+    ``renderer="gstreamer"`` uses one reused GStreamer decoder (mimesis.gstreamer).
+    """
     clips_directory = os.path.join(output_dir)
     os.makedirs(clips_directory, exist_ok=True)
 
@@ -293,10 +330,32 @@ def process_clips_moviepy(
     text_halign = (captions_config or config).get("text_halign", "center")
     text_valign = (captions_config or config).get("text_valign", "bottom")
 
+    from mimesis.clip_audio import transcribe_clips
+
+    transcripts = transcribe_clips(input_video, clips)
+
+    if renderer in ("ffmpeg", "gstreamer"):
+        from mimesis.render import caption_style, clip_jobs, render_clips, render_clips_gstreamer
+
+        texts = {}
+        for clip_name, clip_list in clips.items():
+            for index, clip in enumerate(clip_list):
+                text = process_clip(input_video, clip["start"], clip["end"], transcripts[(clip_name, index)])
+                clip["text"] = texts[(clip_name, index)] = text
+        style = caption_style(captions_config or config)
+        render = render_clips if renderer == "ffmpeg" else render_clips_gstreamer
+        for result in render(input_video, clip_jobs(clips, texts, clips_directory), style):
+            if result["ok"]:
+                logger.info(f"✅ Wrote video to: {result['output']} ({result['seconds']:.1f}s)")
+            else:
+                logger.error(f"❌ Failed to write {result['output']}: {result['error']}")
+        return
+
+    video_clip = VideoFileClip(input_video)
     for clip_name, clip_list in clips.items():
-        for clip in clip_list:
+        for index, clip in enumerate(clip_list):
             start, end = clip["start"], clip["end"]
-            text = process_clip(input_video, start, end)
+            text = process_clip(input_video, start, end, transcripts[(clip_name, index)])
             clip["text"] = text
             output_file = os.path.join(clips_directory, f"{clip_name}.mp4")
             logger.info(f"Processing Clip: {clip_name} ({start}-{end} sec)")
@@ -313,9 +372,7 @@ def process_clips_moviepy(
             else:
                 video_with_text = clip_segment
 
-            video_with_text.write_videofile(
-                output_file, codec="libx264", audio_codec="aac"
-            )
+            write_video(video_with_text, output_file, codec="libx264", audio_codec="aac")
             logger.info(f"✅ Wrote video to: {output_file}")
             logger.info(f"📂 File exists? {os.path.exists(output_file)}")
             logger.info(f"Clip {clip_name} processed successfully.")
@@ -343,7 +400,7 @@ def load_clips_from_file(file_path):
 def stitch_clips(clip_files, output_file):
     final_clips = [VideoFileClip(clip) for clip in clip_files]
     final_video = concatenate_videoclips(final_clips, method="compose")
-    final_video.write_videofile(output_file, codec="libx264", fps=24, audio_codec="aac")
+    write_video(final_video, output_file, codec="libx264", fps=24, audio_codec="aac")
     print(f"Final stitched video saved as {output_file}")
 
 
@@ -352,18 +409,15 @@ def process_clips_with_captions(app_config, clips, logger, input_video, output_d
     clips_directory = output_dir  # ✅ No extra "clips" subdir
     os.makedirs(clips_directory, exist_ok=True)
 
+    from mimesis.clip_audio import transcribe_clips
+
+    transcripts = transcribe_clips(input_video, clips)
+
     for clip_name, clip_list in clips.items():
-        for clip in clip_list:
+        for index, clip in enumerate(clip_list):
             start, end = clip["start"], clip["end"]
 
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".wav"
-            ) as temp_audio_file:
-                audio_path = extract_audio_from_video(
-                    input_video, start, end, temp_audio_file.name
-                )
-                transcription = transcribe_audio(audio_path)
-                os.remove(audio_path)
+            transcription = transcripts[(clip_name, index)]
 
             if transcription:
                 logger.info(f"Clip {clip_name}: Transcription -> {transcription}")
@@ -432,18 +486,15 @@ def process_clips_with_captions(config, clips, logger, input_video, output_dir):
     clips_directory = os.path.join(output_dir, "clips")
     os.makedirs(clips_directory, exist_ok=True)
 
+    from mimesis.clip_audio import transcribe_clips
+
+    transcripts = transcribe_clips(input_video, clips)
+
     for clip_name, clip_list in clips.items():
-        for clip in clip_list:
+        for index, clip in enumerate(clip_list):
             start, end = clip["start"], clip["end"]
 
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".wav"
-            ) as temp_audio_file:
-                audio_path = extract_audio_from_video(
-                    input_video, start, end, temp_audio_file.name
-                )
-                transcription = transcribe_audio(audio_path)
-                os.remove(audio_path)
+            transcription = transcripts[(clip_name, index)]
 
             if transcription:
                 logger.info(f"Clip {clip_name}: Transcription -> {transcription}")
@@ -454,9 +505,7 @@ def process_clips_with_captions(config, clips, logger, input_video, output_dir):
 
             # Step 1: Extract subclip and write to disk before captioning
             clip_segment = video_clip.subclip(start, end)
-            clip_segment.write_videofile(
-                output_file, codec="libx264", audio_codec="aac"
-            )
+            write_video(clip_segment, output_file, codec="libx264", audio_codec="aac")
 
             # Step 2: Feed the written clip into the captioning pipeline
             logger.info(f"Applying captions using external module...")
@@ -11,7 +11,8 @@
 #   Transcribes the entire video into one block of text using Whisper.
 #
 # Function: whisper_transcribe_video_by_minute(video_path: str) -> dict[str, str]
-#   Breaks the video into 60-second chunks and transcribes each using Whisper.
+#   Breaks the video into pause-aligned chunks, transcribes each using Whisper
+#   and buckets the text per minute.
 # --------------------------------------------------
 
 import logging
@@ -21,126 +22,363 @@ logger = logging.getLogger(__name__)
 logger.info(f"📦 {__name__} imported into {__file__}")
 
 
-def whisper_transcribe_full_video(video_path):
-    import whisper
-    from moviepy.editor import VideoFileClip
-    import tempfile
+def _daemon_available():
+    from mimesis.daemon import daemon_running
+
+    return daemon_running()
+
+
+def _submit_to_daemon(video_path, model_name):
+    from mimesis.daemon import submit_job
+
+    logger.info(f"🛰️ Routing {video_path} to the transcription daemon")
+    return submit_job(video_path, model=model_name, formats=[])
+
+
+# The daemon only takes the model; any other option set away from these
+# defaults keeps the call local so the output never depends on whether a
+# daemon happens to be running.
+_BY_MINUTE_DEFAULTS = {
+    "batch_size": None,
+    "workers": 1,
+    "vad": False,
+    "checkpoint": True,
+    "chunking": None,
+    "batched": False,
+}
+
+
+def whisper_transcribe_full_video(video_path, model_name="base", use_daemon=True):
+    """
+    Transcribes an entire video using OpenAI's Whisper model.
+
+    Args:
+        video_path (str): Path to input video.
+        model_name (str): Whisper model size (tiny, base, small, medium, large).
+        use_daemon (bool): Route to a running transcription daemon when available.
+
+    Returns:
+        str: Full transcription as one block of text.
+    """
+    if use_daemon and _daemon_available():
+        return _submit_to_daemon(video_path, model_name)["text"]
+
+    from mimesis.sidecar import load_range
+    from mimesis.transcript_cache import cached_transcribe
+
+    # Map the full audio track from its sidecar, then transcribe (or reuse a cached result)
+    audio = load_range(video_path)
+    result = cached_transcribe(audio, model_name)  # You can change to "small", "medium", "large"
+    return result["text"]
+
+
+def whisper_transcribe_video_by_minute(
+    video_path,
+    model_name="base",
+    use_daemon=True,
+    batch_size=None,
+    workers=1,
+    vad=False,
+    checkpoint=True,
+    chunking=None,
+    batched=False,
+):
+    """
+    Breaks a video into pause-aligned chunks, transcribes each using Whisper
+    and returns the text bucketed per minute.
+
+    Args:
+        video_path (str): Path to input video.
+        model_name (str): Whisper model size (tiny, base, small, medium, large).
+        use_daemon (bool): Route to a running transcription daemon when available
+            and every other option is left at its default.
+        batch_size (int): Windows decoded together when ``batched``.
+        workers (int): Worker processes; above 1 the chunks are spread over a
+            process pool (see mimesis.parallel).
+        vad (bool): Feed only the speech regions of each chunk to Whisper (see mimesis.vad).
+        checkpoint (bool | str): Save every finished chunk so a crashed or
+            interrupted run resumes from the saved chunks; the checkpoint is
+            removed once the transcript is complete. True uses a directory
+            under ``checkpoint.dir`` in app_config; a string names the
+            checkpoint directory; False disables it (see mimesis.checkpoint).
+        chunking (dict): ``min_len``/``target``/``max_len`` seconds for the
+            chunk planner; defaults to ``chunking`` in app_config (see mimesis.chunking).
+        batched (bool): Decode chunks in batches (see mimesis.batch) instead
+            of running ``model.transcribe`` per chunk. Faster on GPU; chunks
+            are then planned to fit one 30s window and carry no inner timestamps.
+
+    Returns:
+        dict[str, str]: Mapping of time ranges to transcribed text.
+    """
+    requested = {
+        "batch_size": batch_size,
+        "workers": workers,
+        "vad": vad,
+        "checkpoint": checkpoint,
+        "chunking": chunking,
+        "batched": batched,
+    }
+    if use_daemon and requested == _BY_MINUTE_DEFAULTS and _daemon_available():
+        return _submit_to_daemon(video_path, model_name)["minute"]
+
+    from mimesis.audio import SAMPLE_RATE
+    from mimesis.sidecar import load_range
+    from mimesis.batch import WINDOW_SECONDS, configured_batch_size, transcribe_batch
+    from mimesis.chunking import configured_chunk_options, fit_to_window, plan_chunks
+    from mimesis.parallel import transcribe_chunks_parallel
+    from mimesis.transcript_cache import cached_transcribe
+    from mimesis import segments as seg_utils
+
+    audio = load_range(video_path)
+    duration = len(audio) / SAMPLE_RATE
+
+    # Cut at pauses rather than every 60s so no word straddles two chunks
+    options = chunking or configured_chunk_options()
+    if batched:
+        # Batched decoding reads fixed 30s windows; keep every chunk inside one
+        options = fit_to_window(options, WINDOW_SECONDS)
+    ranges = plan_chunks(audio, SAMPLE_RATE, **options)
+    chunks = [audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] for start, end in ranges]
+    speech_maps = [None] * len(chunks)
+    if vad:
+        from mimesis.vad import extract_speech
+
+        chunks, speech_maps = map(list, zip(*(extract_speech(chunk, SAMPLE_RATE) for chunk in chunks)))
+        kept = sum(len(chunk) for chunk in chunks)
+        logger.info(f"🔇 VAD skipped {100 * (1 - kept / max(len(audio), 1)):.0f}% of the audio")
+
+    store = None
+    if checkpoint:
+        from mimesis.checkpoint import TranscriptCheckpoint, default_checkpoint_dir
+
+        directory = checkpoint if isinstance(checkpoint, str) else default_checkpoint_dir(video_path, "minute")
+        params = {"model": model_name, "chunking": options, "vad": vad, "batched": batched}
+        store = TranscriptCheckpoint(directory, video_path, params)
+    segments = {index: result["segments"] for index, _, _, result in (store.completed() if store else [])}
+
+    def finish(index, result):
+        chunk_segments = result.get("segments", [])
+        if speech_maps[index] is not None:
+            chunk_segments = speech_maps[index].remap_segments(chunk_segments)
+        offset = ranges[index][0]
+        segments[index] = [
+            {"start": seg["start"] + offset, "end": seg["end"] + offset, "text": seg["text"]}
+            for seg in chunk_segments
+        ]
+        if store:
+            store.save(index, ranges[index][0], ranges[index][1], {"segments": segments[index]})
+
+    # Chunks without speech never reach the model
+    pending = [i for i in range(len(chunks)) if i not in segments]
+    for i in pending:
+        if not len(chunks[i]):
+            finish(i, {"text": "", "segments": []})
+    voiced = [i for i in pending if len(chunks[i])]
+
+    if workers > 1:
+        transcribe_chunks_parallel(
+            [chunks[i] for i in voiced],
+            model_name,
+            workers=workers,
+            on_result=lambda position, result: finish(voiced[position], result),
+        )
+    elif batched:
+        # Decode in groups so finished chunks reach the checkpoint as we go
+        group_size = batch_size or configured_batch_size()
+        for first in range(0, len(voiced), group_size):
+            group = voiced[first:first + group_size]
+            results = transcribe_batch([chunks[i] for i in group], model_name, batch_size=batch_size)
+            for i, result in zip(group, results):
+                finish(i, result)
+    else:
+        # model.transcribe keeps its timestamps, temperature fallback and hallucination checks
+        for i in voiced:
+            finish(i, cached_transcribe(chunks[i], model_name, verbose=False))
+
+    if store:
+        store.discard()
+
+    # Re-bucket by timestamp so callers keep the per-minute keys
+    ordered = [seg for i in sorted(segments) for seg in segments[i]]
+    return seg_utils.minute_buckets(ordered, duration)
+
+
+def _transcribe_chunks(chunks, ranges, model_name, workers, store=None, **decode_options):
+    """Transcribe ``chunks`` with ``model.transcribe``, skipping and saving chunks in ``store``."""
+    from mimesis.parallel import transcribe_chunks_parallel
+    from mimesis.transcript_cache import cached_transcribe
+
+    results = [None] * len(chunks)
+    for index, _, _, result in (store.completed() if store else []):
+        if index < len(results):
+            results[index] = result
+
+    def finish(index, result):
+        results[index] = result
+        if store:
+            store.save(index, ranges[index][0], ranges[index][1], result)
+
+    pending = [i for i in range(len(chunks)) if results[i] is None]
+    if pending and store and len(pending) < len(chunks):
+        logger.info(f"⏯️ Resuming with {len(chunks) - len(pending)} of {len(chunks)} chunks done")
+    if workers > 1:
+        transcribe_chunks_parallel(
+            [chunks[i] for i in pending],
+            model_name,
+            workers=workers,
+            on_result=lambda position, result: finish(pending[position], result),
+            **decode_options,
+        )
+    else:
+        for i in pending:
+            finish(i, cached_transcribe(chunks[i], model_name, verbose=False, **decode_options))
+    return results
+
+
+ARTIFACT_FORMATS = ("txt", "minute", "srt", "vtt", "sentences")
+
+
+def whisper_transcribe_artifacts(
+    video_path,
+    output_dir=None,
+    model_name="base",
+    formats=ARTIFACT_FORMATS,
+    progress=None,
+    workers=1,
+    vad=False,
+    use_daemon=True,
+    checkpoint=False,
+    **decode_options,
+):
+    """
+    Transcribes a video once and derives every transcript artifact from the
+    timestamped Whisper segments.
+
+    Args:
+        video_path (str): Path to input video.
+        output_dir (str): Directory for the artifact files. Nothing is written when None.
+        model_name (str): Whisper model size (tiny, base, small, medium, large).
+        formats (tuple): Any of "txt", "minute", "srt", "vtt", "sentences".
+        progress (callable): Optional ``progress(stage, fraction)`` callback.
+        workers (int): Worker processes; above 1 the audio is transcribed as
+            pause-aligned chunks across a process pool and the segments are
+            stitched back (see mimesis.chunking).
+        vad (bool): Transcribe only detected speech and map the segment times
+            back onto the original timeline (see mimesis.vad).
+        use_daemon (bool): Route to a running transcription daemon when available
+            (only for single-worker, uncheckpointed runs whose decode options
+            are limited to ``task`` and ``language``).
+        checkpoint (bool | str): Opt in to transcribing pause-aligned chunks
+            and saving each one as it finishes, so a crashed or interrupted
+            run resumes after the saved chunks; the checkpoint is removed once
+            the transcript is complete. True uses a directory under
+            ``checkpoint.dir`` in app_config; a string names the directory.
+            False (the default) transcribes the whole file in one call
+            (see mimesis.checkpoint).
+        **decode_options: Passed to ``model.transcribe`` (e.g. task="translate", language).
+
+    Returns:
+        dict: ``text``, ``minute`` (same keys as whisper_transcribe_video_by_minute),
+        ``segments``, ``sentences``, ``skipped_fraction`` (audio skipped by
+        the VAD) and ``paths`` of the files written.
+    """
+    import json
     import os
-
-    model = whisper.load_model("base")  # You can change to "small", "medium", "large"
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        # Extract audio from full video
-        clip = VideoFileClip(video_path)
-        audio = clip.audio
-        audio.write_audiofile(temp_audio_file.name)
-        clip.close()
-
-        # Transcribe with Whisper
-        result = model.transcribe(temp_audio_file.name)
-        os.remove(temp_audio_file.name)
-        return result["text"]
-
-
-def whisper_transcribe_video_by_minute(video_path):
-    import whisper
-    from moviepy.editor import VideoFileClip
-    import tempfile
-    import os
-
-    model = whisper.load_model("base")
-    video = VideoFileClip(video_path)
-    duration = int(video.duration)
-    transcript = {}
-
-    for start in range(0, duration, 60):
-        end = min(start + 60, duration)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-            # Extract 60s audio chunk
-            audio_clip = video.audio.subclip(start, end)
-            audio_clip.write_audiofile(temp_audio_file.name)
-
-            # Transcribe with Whisper
-            result = model.transcribe(temp_audio_file.name)
-            os.remove(temp_audio_file.name)
-            transcript[f"{start}-{end}s"] = result["text"]
-
-    video.close()
-    return transcript
-
-
-
-
-
-
-# === FULL VIDEO TRANSCRIPTION ===
-
-def transcribe_full_video(video_path):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio_file:
-        audio_path = extract_audio_from_video(video_path, 0, None, temp_audio_file.name)
-        transcription = transcribe_audio(audio_path)
-        os.remove(audio_path)
-        return transcription
-
-
-
-def transcribe_video_by_minute(video_path, output_dir):
-    video = VideoFileClip(video_path)
-    duration = int(video.duration)
+    from mimesis.audio import SAMPLE_RATE
+    from mimesis.sidecar import load_range
+    from mimesis.transcript_cache import cached_transcribe
+    from mimesis import segments as seg_utils
+
+    progress = progress or (lambda stage, fraction: None)
+
+    local_only = workers > 1 or checkpoint or not set(decode_options) <= {"task", "language"}
+    if use_daemon and not local_only and _daemon_available():
+        from mimesis.daemon import submit_job
+
+        logger.info(f"🛰️ Routing {video_path} to the transcription daemon")
+        return submit_job(
+            video_path,
+            model=model_name,
+            formats=list(formats),
+            output_dir=os.path.abspath(output_dir) if output_dir else None,
+            vad=vad,
+            on_progress=lambda job: progress(job["stage"], job["progress"]),
+            **decode_options,
+        )
+
+    progress("decoding_audio", 0.0)
+    audio = load_range(video_path)
+    duration = len(audio) / SAMPLE_RATE
+
+    speech_map = None
+    if vad:
+        from mimesis.vad import extract_speech
+
+        progress("detecting_speech", 0.1)
+        audio, speech_map = extract_speech(audio, SAMPLE_RATE)
+
+    progress("transcribing", 0.2)
+    if not len(audio):
+        result = {"text": "", "segments": []}
+    elif workers > 1 or checkpoint:
+        from mimesis.chunking import configured_chunk_options, plan_chunks
+
+        options = configured_chunk_options()
+        ranges = plan_chunks(audio, SAMPLE_RATE, **options)
+        chunks = [audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] for start, end in ranges]
+        store = None
+        if checkpoint:
+            from mimesis.checkpoint import TranscriptCheckpoint, default_checkpoint_dir
+
+            directory = checkpoint if isinstance(checkpoint, str) else default_checkpoint_dir(video_path, "artifacts")
+            params = {"model": model_name, "chunking": options, "vad": vad, "options": decode_options}
+            store = TranscriptCheckpoint(directory, video_path, params)
+        results = _transcribe_chunks(chunks, ranges, model_name, workers, store, **decode_options)
+        result = seg_utils.merge_results(results, [start for start, _ in ranges])
+        if store:
+            store.discard()
+    else:
+        result = cached_transcribe(audio, model_name, verbose=False, **decode_options)
+    segments = result["segments"]
+    if speech_map is not None:
+        segments = speech_map.remap_segments(segments)
+    artifacts = {
+        "text": result["text"],
+        "minute": seg_utils.minute_buckets(segments, duration),
+        "segments": segments,
+        "sentences": seg_utils.sentence_chunks(segments),
+        "skipped_fraction": speech_map.skipped_fraction if speech_map else 0.0,
+        "paths": {},
+    }
+
+    if output_dir is None:
+        progress("done", 1.0)
+        return artifacts
+
+    progress("writing", 0.9)
     os.makedirs(output_dir, exist_ok=True)
-    recognizer = sr.Recognizer()
-    stitched_transcript = []
-
-    for start in range(0, duration, 60):
-        end = min(start + 60, duration)
-        base_name = f"min_{start // 60:02d}"
-        wav_path = os.path.join(output_dir, f"{base_name}.wav")
-        txt_path = os.path.join(output_dir, f"{base_name}.txt")
-
-        if not os.path.exists(wav_path):
-            try:
-                logger.info(f"🎧 Exporting audio {start}-{end} sec → {wav_path}")
-                audio_clip = video.audio.subclip(start, end)
-                audio_clip.write_audiofile(wav_path)
-            except Exception as e:
-                logger.error(f"❌ Failed to export audio: {e}")
-                continue
-
-        if not os.path.exists(txt_path):
-            logger.info(f"🗣️ Transcribing {base_name}.wav...")
-            text = None
-            for attempt in range(3):
-                try:
-                    with sr.AudioFile(wav_path) as source:
-                        audio_data = recognizer.record(source)
-                        text = recognizer.recognize_google(audio_data)
-                    break
-                except sr.UnknownValueError:
-                    text = "[Unintelligible]"
-                    break
-                except sr.RequestError as e:
-                    logger.warning(f"⚠️ Google error on attempt {attempt+1}: {e}")
-                    time.sleep(2**attempt)
-                    text = None
-
-            if text is not None:
-                with open(txt_path, "w") as f:
-                    f.write(text)
-            else:
-                with open(txt_path, "w") as f:
-                    f.write("[ERROR: No transcript]")
-        else:
-            with open(txt_path, "r") as f:
-                text = f.read()
-
-        stitched_transcript.append(f"[{start}-{end} sec]\n{text}\n")
-
-    final_path = os.path.join(output_dir, "full_transcript.txt")
-    with open(final_path, "w") as f:
-        f.write("\n".join(stitched_transcript))
-
-    logger.info(f"✅ Full transcript saved to: {final_path}")
-    return "\n".join(stitched_transcript)
+    stem = os.path.join(output_dir, os.path.splitext(os.path.basename(video_path))[0])
+    paths = artifacts["paths"]
+    if "txt" in formats:
+        paths["txt"] = f"{stem}.full.txt"
+        with open(paths["txt"], "w") as f:
+            f.write(artifacts["text"])
+    if "minute" in formats:
+        paths["minute"] = f"{stem}.minute.json"
+        with open(paths["minute"], "w") as f:
+            json.dump(artifacts["minute"], f, indent=2)
+    if "srt" in formats:
+        paths["srt"] = f"{stem}.srt"
+        seg_utils.write_srt(segments, paths["srt"])
+    if "vtt" in formats:
+        paths["vtt"] = f"{stem}.vtt"
+        seg_utils.write_vtt(segments, paths["vtt"])
+    if "sentences" in formats:
+        paths["sentences"] = seg_utils.write_sentences(segments, f"{stem}_sentences.json")
+
+    logger.info(f"📝 Wrote {', '.join(paths)} from one Whisper pass")
+    progress("done", 1.0)
+    return artifacts
 
 
 import requests
@@ -0,0 +1,75 @@
+from pathlib import Path
+import json
+import sys
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import asr
+from mimesis.asr import ASRBackend, WhisperBackend, get_backend
+from mimesis.standin import StandinSpeechServer
+
+
+def test_backend_names_select_whisper_size_and_quantization():
+    backend = get_backend("whisper-small")
+    assert isinstance(backend, WhisperBackend)
+    assert backend.model_name == "small" and backend.quantize is None
+    assert get_backend("whisper-large-v3-int8").name == "whisper-large-v3-int8"
+    assert get_backend("whisper").model_name == "base"
+
+
+def test_backend_defaults_to_config_and_base_is_abstract(monkeypatch):
+    monkeypatch.setattr(asr, "_asr_config", lambda: {"backend": "whisper-tiny-int8"})
+    backend = get_backend()
+    assert backend.model_name == "tiny" and backend.quantize == "int8"
+    with pytest.raises(TypeError):
+        ASRBackend()
+
+
+def test_google_is_the_default_backend(monkeypatch):
+    monkeypatch.setattr(asr, "_asr_config", lambda: {})
+    assert asr.configured_backend_name() == "google"
+
+
+def test_transcribe_range_goes_through_the_backend(monkeypatch):
+    for module in ("speech_recognition", "moviepy"):
+        pytest.importorskip(module)
+    from mimesis import sidecar
+    from mimesis.video import transcribe_range
+
+    class Echo(ASRBackend):
+        def transcribe(self, audio, **options):
+            return {"text": f"{len(audio)} samples", "segments": [], "language": "en"}
+
+    ranges = []
+    monkeypatch.setattr(sidecar, "load_range", lambda path, start, end: ranges.append((start, end)) or [0.0] * 8)
+    monkeypatch.setattr(asr, "_asr_config", lambda: {"backend": "echo"})
+    monkeypatch.setattr(asr, "get_backend", lambda name=None, **options: Echo())
+    assert transcribe_range("talk.mp4", 2, 4) == "8 samples"
+    assert transcribe_range("talk.mp4", backend=Echo()) == "8 samples"
+    assert ranges == [(2, 4), (0, None)]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="kaldi"):
+        get_backend("kaldi")
+
+
+def _post(url):
+    request = urllib.request.Request(url, data=b"fLaC", headers={"Content-Type": "audio/x-flac; rate=16000"})
+    return urllib.request.urlopen(request, timeout=5).read().decode("utf-8")
+
+
+def test_standin_speaks_the_google_legacy_protocol():
+    with StandinSpeechServer(transcript="hello there", fail_first=1) as server:
+        try:
+            _post(server.url)
+        except urllib.error.HTTPError as e:
+            assert e.code == 503
+        lines = [json.loads(line) for line in _post(server.url).splitlines() if line]
+    assert lines[0] == {"result": []}
+    assert lines[1]["result"][0]["alternative"][0]["transcript"] == "hello there"
+    assert len(server.requests) == 2
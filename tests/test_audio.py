@@ -0,0 +1,20 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.audio import ffmpeg_pcm_command
+
+
+def test_seek_happens_before_input_and_duration_after():
+    cmd = ffmpeg_pcm_command("talk.mp4", start=90, end=150)
+    assert cmd.index("-ss") < cmd.index("-i") < cmd.index("-t")
+    assert cmd[cmd.index("-ss") + 1] == "90.000"
+    assert cmd[cmd.index("-t") + 1] == "60.000"
+    assert cmd[cmd.index("-ar") + 1] == "16000"
+    assert cmd[-1] == "-"
+
+
+def test_full_file_has_no_seek_or_duration():
+    cmd = ffmpeg_pcm_command("talk.mp4")
+    assert "-ss" not in cmd and "-t" not in cmd
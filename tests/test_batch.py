@@ -0,0 +1,228 @@
+from pathlib import Path
+from dataclasses import dataclass
+import json
+import sys
+import types
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import batch
+from mimesis.batch import split_windows, transcribe_and_translate_batch, transcribe_batch
+
+
+def test_split_windows_counts_and_offsets():
+    windows = split_windows([list(range(25)), list(range(10))], window_samples=10)
+    assert [(index, offset, len(samples)) for index, offset, samples in windows] == [
+        (0, 0, 10), (0, 10, 10), (0, 20, 5), (1, 0, 10),
+    ]
+    assert windows[2][2] == [20, 21, 22, 23, 24]
+
+
+def test_split_windows_empty_input_yields_one_empty_window():
+    assert split_windows([[]], window_samples=10) == [(0, 0, [])]
+    assert split_windows([], window_samples=10) == []
+
+
+class StubCache:
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.puts = []
+
+    @staticmethod
+    def make_key(audio, model_name, **options):
+        return (model_name, tuple(audio), options["task"])
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, result):
+        self.puts.append(key)
+        self.entries[key] = result
+
+
+@dataclass
+class Options:
+    task: str = "transcribe"
+    language: str = None
+    without_timestamps: bool = False
+    fp16: bool = False
+    temperature: float = 0.0
+
+
+@dataclass
+class Output:
+    text: str
+    language: str = "en"
+    no_speech_prob: float = 0.0
+    avg_logprob: float = -0.2
+    compression_ratio: float = 1.0
+
+
+class Batch(list):
+    def to(self, device):
+        return self
+
+    def half(self):
+        return self
+
+    def __getitem__(self, item):
+        value = super().__getitem__(item)
+        return Batch(value) if isinstance(item, slice) else value
+
+
+class StubModel:
+    device = types.SimpleNamespace(type="cpu")
+    dims = types.SimpleNamespace(n_mels=80)
+
+    def __init__(self):
+        self.embedded = []
+        self.decoded = []
+
+    def embed_audio(self, mel):
+        self.embedded.append(list(mel))
+        return Batch(("features", tuple(window)) for window in mel)
+
+
+def install_stubs(monkeypatch, model, decode):
+    whisper = types.ModuleType("whisper")
+    whisper.DecodingOptions = Options
+    whisper.pad_or_trim = lambda samples: samples
+    whisper.log_mel_spectrogram = lambda samples, *args: tuple(samples)
+    whisper.decode = decode
+    torch = types.ModuleType("torch")
+    torch.stack = lambda items: Batch(items)
+
+    class NoGrad:
+        def __enter__(self):
+            return None
+
+        def __exit__(self, *exc):
+            return False
+
+    torch.no_grad = NoGrad
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(batch, "get_whisper_model", lambda *a, **k: model)
+    monkeypatch.setattr(batch, "resolve_quantize", lambda quantize: None)
+    monkeypatch.setattr(batch, "SAMPLE_RATE", 1)
+    monkeypatch.setattr(batch, "split_windows", lambda audios: split_windows(audios, window_samples=2))
+
+
+def test_transcribe_batch_maps_cached_and_decoded_results_to_inputs(monkeypatch):
+    model = StubModel()
+
+    def decode(model_, mel, options):
+        model_.decoded.append(list(mel))
+        return [Output(text="w" + "".join(str(s) for s in window)) for window in mel]
+
+    install_stubs(monkeypatch, model, decode)
+    cached = {"text": "from cache", "segments": [], "language": "en"}
+    cache = StubCache({("base", (5, 5), "transcribe"): cached})
+
+    results = transcribe_batch([[1, 2, 3], [5, 5], [7]], batch_size=2, cache=cache)
+
+    assert results[1] is cached
+    assert results[0]["text"] == "w12 w3"
+    assert [(seg["start"], seg["end"]) for seg in results[0]["segments"]] == [(0, 2), (2, 3)]
+    assert results[2]["text"] == "w7"
+    # Only the two uncached inputs were decoded, and each was cached afterwards
+    assert model.decoded == [[(1, 2), (3,)], [(7,)]]
+    assert cache.puts == [("base", (1, 2, 3), "transcribe"), ("base", (7,), "transcribe")]
+
+
+def test_transcribe_batch_needs_no_model_when_everything_is_cached(monkeypatch):
+    def no_model(*args, **kwargs):
+        raise AssertionError("model loaded although every input was cached")
+
+    monkeypatch.setattr(batch, "get_whisper_model", no_model)
+    monkeypatch.setattr(batch, "resolve_quantize", lambda quantize: None)
+    cache = StubCache({("base", (1,), "transcribe"): {"text": "a"}, ("base", (2,), "transcribe"): {"text": "b"}})
+    assert [r["text"] for r in transcribe_batch([[1], [2]], cache=cache)] == ["a", "b"]
+
+
+def test_repetitive_windows_are_redecoded_at_higher_temperature(monkeypatch):
+    model = StubModel()
+    temperatures = []
+
+    def decode(model_, mel, options):
+        temperatures.append(options.temperature)
+        if options.temperature < 0.4:
+            return [Output(text="la la la", compression_ratio=3.0) for _ in mel]
+        return [Output(text="hello") for _ in mel]
+
+    install_stubs(monkeypatch, model, decode)
+    results = transcribe_batch([[1]], cache=StubCache())
+    assert results[0]["text"] == "hello"
+    assert temperatures == [0.0, 0.2, 0.4]
+
+
+def test_silent_windows_are_dropped_without_fallback(monkeypatch):
+    model = StubModel()
+    calls = []
+
+    def decode(model_, mel, options):
+        calls.append(options.temperature)
+        return [Output(text="thanks for watching", no_speech_prob=0.9, avg_logprob=-1.5) for _ in mel]
+
+    install_stubs(monkeypatch, model, decode)
+    results = transcribe_batch([[1]], cache=StubCache())
+    assert results[0]["text"] == ""
+    assert results[0]["segments"] == []
+    assert calls == [0.0]
+
+
+def test_transcribe_and_translate_share_one_encoder_pass(monkeypatch):
+    model = StubModel()
+    decodes = []
+
+    def decode(model_, features, options):
+        decodes.append((options.task, features))
+        outputs = []
+        for _, window in features:
+            if window == (0,):
+                outputs.append(Output(text="", no_speech_prob=0.9, avg_logprob=-1.5))
+            else:
+                text = "".join(str(s) for s in window)
+                outputs.append(Output(text=f"t{text}" if options.task == "transcribe" else f"e{text}", language="de"))
+        return outputs
+
+    install_stubs(monkeypatch, model, decode)
+    results = transcribe_and_translate_batch([[1, 2, 3], [0]], batch_size=8, cache=StubCache())
+
+    # One encoder pass over all three windows, and both decodes read the same features
+    assert model.embedded == [[(1, 2), (3,), (0,)]]
+    assert [task for task, _ in decodes] == ["transcribe", "translate"]
+    assert decodes[0][1] is decodes[1][1]
+
+    first = results[0]
+    assert first["language"] == "de"
+    assert first["transcript"]["text"] == "t12 t3" and first["translation"]["text"] == "e12 e3"
+    spans = [[(seg["start"], seg["end"]) for seg in first[key]["segments"]] for key in ("transcript", "translation")]
+    assert spans[0] == spans[1] == [(0, 2), (2, 3)]
+    # A window silent in the transcript is dropped from both sides
+    assert results[1]["transcript"]["segments"] == results[1]["translation"]["segments"] == []
+
+
+@pytest.mark.parametrize("keep_original", [False, True])
+def test_drive_pipeline_output_shape(tmp_path, monkeypatch, keep_original):
+    for module in ("requests", "speech_recognition", "moviepy"):
+        pytest.importorskip(module)
+    import codex_pipeline
+
+    paths = [str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]
+    paired = {"language": "de", "transcript": {"text": "hallo", "segments": []},
+              "translation": {"text": "hello", "segments": []}}
+    monkeypatch.setattr(codex_pipeline, "whisper", object())
+    monkeypatch.setattr(codex_pipeline, "load_app_config", lambda: {})
+    monkeypatch.setattr(codex_pipeline, "handle_gdrive_tar", lambda params: {"extracted": paths})
+    monkeypatch.setattr(codex_pipeline, "load_audio", lambda path: [1])
+    monkeypatch.setattr(codex_pipeline, "transcribe_and_translate_batch", lambda audios, **kw: [paired] * len(audios))
+    monkeypatch.setattr(codex_pipeline, "transcribe_batch", lambda audios, **kw: [{"text": "hello"}] * len(audios))
+
+    transcripts = codex_pipeline.process_drive_tar_and_transcribe("url", str(tmp_path), keep_original=keep_original)
+
+    expected = {path: paired if keep_original else "hello" for path in paths}
+    assert transcripts == expected
+    assert json.loads((tmp_path / "transcripts.json").read_text()) == expected
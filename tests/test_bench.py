@@ -0,0 +1,18 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.bench import real_time_factor, word_error_rate
+
+
+def test_word_error_rate_counts_edits_per_reference_word():
+    reference = "The quick brown fox jumps"
+    assert word_error_rate(reference, "the quick, brown fox jumps!") == 0.0
+    assert word_error_rate(reference, "the quick brown box jumps over") == 0.4
+    assert word_error_rate(reference, "") == 1.0
+    assert word_error_rate("", "") == 0.0
+
+
+def test_real_time_factor():
+    assert real_time_factor(15.0, 60.0) == 0.25
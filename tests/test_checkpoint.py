@@ -0,0 +1,85 @@
+from pathlib import Path
+import os
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.checkpoint import TranscriptCheckpoint, default_checkpoint_dir
+
+
+def test_completed_windows_survive_a_restart(tmp_path):
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"fake video")
+    ckpt_dir = str(tmp_path / "talk.whisper_ckpt")
+    params = {"model": "base", "window": 60}
+
+    store = TranscriptCheckpoint(ckpt_dir, str(video), params)
+    store.save(0, 0, 60, {"text": "first"})
+    store.save(1, 60, 120, {"text": "second"})
+    store.save(3, 180, 240, {"text": "fourth"})
+
+    resumed = TranscriptCheckpoint(ckpt_dir, str(video), params)
+    assert resumed.done(1) and not resumed.done(2)
+    assert [item[3]["text"] for item in resumed.completed()] == ["first", "second", "fourth"]
+    assert resumed.resume_time() == 120  # window 2 is missing
+    assert not [name for name in os.listdir(ckpt_dir) if name.endswith(".tmp")]
+
+
+def test_checkpoint_for_other_params_is_discarded(tmp_path):
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"fake video")
+    ckpt_dir = str(tmp_path / "ckpt")
+
+    TranscriptCheckpoint(ckpt_dir, str(video), {"model": "base"}).save(0, 0, 60, {"text": "old"})
+    store = TranscriptCheckpoint(ckpt_dir, str(video), {"model": "small"})
+    assert store.completed() == []
+    assert store.resume_time() == 0.0
+    assert os.listdir(ckpt_dir) == []
+
+
+def test_default_dirs_per_mode_and_discard(tmp_path):
+    video = tmp_path / "media" / "talk.mp4"
+    video.parent.mkdir()
+    video.write_bytes(b"fake video")
+    root = tmp_path / "ckpts"
+    plain = Path(default_checkpoint_dir(str(video), root=str(root)))
+    minute = Path(default_checkpoint_dir(str(video), "minute", root=str(root)))
+    assert plain.parent == minute.parent == root
+    assert plain.name.startswith("talk-") and plain.name.endswith(".whisper_ckpt")
+    assert minute.name == plain.name.replace(".whisper_ckpt", ".minute.whisper_ckpt")
+    # Same name in another folder gets its own checkpoint
+    assert default_checkpoint_dir(str(tmp_path / "talk.mp4"), root=str(root)) != str(plain)
+
+    store = TranscriptCheckpoint(str(minute), str(video))
+    store.save(0, 0, 60, {"text": "done"})
+    store.discard()
+    assert not os.path.exists(store.directory)
+    assert os.listdir(video.parent) == ["talk.mp4"]
+
+
+def test_chunked_transcription_resumes_after_saved_chunks(tmp_path, monkeypatch):
+    pytest.importorskip("requests")
+    pytest.importorskip("bs4")
+    from mimesis import transcript_cache
+    from mimesis.whisper import _transcribe_chunks
+
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"fake video")
+    ranges = [(0, 30), (30, 60), (60, 90)]
+    store = TranscriptCheckpoint(str(tmp_path / "ckpt"), str(video), {"model": "tiny"})
+    store.save(0, 0, 30, {"text": "saved", "segments": []})
+
+    decoded = []
+
+    def fake_transcribe(audio, model_name, **options):
+        decoded.append(audio)
+        return {"text": audio, "segments": []}
+
+    monkeypatch.setattr(transcript_cache, "cached_transcribe", fake_transcribe)
+    results = _transcribe_chunks(["a", "b", "c"], ranges, "tiny", 1, store)
+
+    assert decoded == ["b", "c"]
+    assert [r["text"] for r in results] == ["saved", "b", "c"]
+    assert TranscriptCheckpoint(str(tmp_path / "ckpt"), str(video), {"model": "tiny"}).done(2)
@@ -0,0 +1,99 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.chunking import fit_to_window, plan_from_energy
+from mimesis.segments import minute_buckets
+
+FRAME = 0.1
+
+
+def _energy(duration, pauses):
+    """-20 dB speech with -70 dB pauses at the given seconds."""
+    energy = [-20.0] * int(duration / FRAME)
+    for pause in pauses:
+        for i in range(int((pause - 0.3) / FRAME), int((pause + 0.3) / FRAME)):
+            energy[i] = -70.0
+    return energy
+
+
+def test_cuts_land_in_pauses_within_bounds():
+    chunks = plan_from_energy(_energy(250, [52.0, 118.0, 171.0]), FRAME, 250, target=60, min_len=30, max_len=90)
+    cuts = [end for _, end in chunks[:-1]]
+    assert [round(cut) for cut in cuts] == [52, 118, 171]
+    assert chunks[0][0] == 0 and chunks[-1][1] == 250
+    assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+
+
+def test_without_pauses_cuts_near_target_and_never_past_max():
+    chunks = plan_from_energy([-20.0] * 3000, FRAME, 300, target=60, min_len=30, max_len=90)
+    for start, end in chunks[:-1]:
+        assert abs((end - start) - 60) < 1
+    assert all(end - start <= 90 for start, end in chunks)
+
+
+def test_rejects_inconsistent_lengths():
+    with pytest.raises(ValueError):
+        plan_from_energy([], FRAME, 10, target=20, min_len=30, max_len=90)
+
+
+def test_chunk_segments_rebucket_into_minute_keys():
+    segments = [{"start": 10.0, "end": 50.0, "text": " one"}, {"start": 52.5, "end": 70.0, "text": " two"},
+                {"start": 75.0, "end": 100.0, "text": " three"}]
+    assert minute_buckets(segments, 100) == {"0-60s": "one two", "60-100s": "three"}
+
+
+def test_fit_to_window_keeps_batched_chunks_inside_one_window():
+    options = fit_to_window({"min_len": 30, "target": 60, "max_len": 90}, 30)
+    assert options == {"min_len": 10, "target": 20, "max_len": 30}
+    chunks = plan_from_energy(_energy(250, [52.0, 118.0, 171.0]), FRAME, 250, **options)
+    assert all(end - start <= 30 for start, end in chunks)
+    assert fit_to_window({"min_len": 5, "target": 10, "max_len": 20}, 30) == {"min_len": 5, "target": 10, "max_len": 20}
+
+
+def _by_minute_run(monkeypatch, tmp_path, seconds, plan):
+    for module in ("numpy", "speech_recognition", "moviepy", "requests", "bs4"):
+        pytest.importorskip(module)
+    import numpy as np
+    from mimesis import chunking, transcription
+    from mimesis.asr import ASRBackend
+
+    class Counter(ASRBackend):
+        name = "counter"
+
+        def __init__(self):
+            self.calls = []
+
+        def transcribe(self, audio, **options):
+            self.calls.append(len(audio) / 16000)
+            return {"text": f"{len(audio) / 16000:g}s"}
+
+    monkeypatch.setattr(transcription, "load_range", lambda path: np.zeros(seconds * 16000, dtype=np.float32))
+    monkeypatch.setattr(chunking, "plan_chunks", lambda audio, sample_rate, **options: plan)
+    backend = Counter()
+    return transcription.transcribe_video_by_minute("talk.mp4", str(tmp_path), backend=backend), backend
+
+
+def test_by_minute_resumes_on_its_saved_plan(tmp_path, monkeypatch):
+    first, _ = _by_minute_run(monkeypatch, tmp_path, 100, [(0.0, 42.5), (42.5, 100.0)])
+    assert first.startswith("[0-42 sec]\n42.5s\n")
+    names = sorted(path.name for path in tmp_path.glob("chunk_*.txt"))
+    assert [name[:10] for name in names] == ["chunk_000_", "chunk_001_"]
+
+    # Drop one result and change the chunking: the saved plan still decides
+    (tmp_path / names[1]).unlink()
+    second, backend = _by_minute_run(monkeypatch, tmp_path, 100, [(0.0, 50.0), (50.0, 100.0)])
+    assert backend.calls == [57.5]
+    assert second == first
+    assert sorted(path.name for path in tmp_path.glob("chunk_*.txt")) == names
+
+
+def test_by_minute_finishes_a_fixed_minute_run(tmp_path, monkeypatch):
+    (tmp_path / "min_00.txt").write_text("from the old run")
+    transcript, backend = _by_minute_run(monkeypatch, tmp_path, 100, [(0.0, 42.5), (42.5, 100.0)])
+    assert transcript.split("\n\n") == ["[0-60 sec]\nfrom the old run", "[60-100 sec]\n40s\n"]
+    assert backend.calls == [40.0]
+    assert (tmp_path / "min_01.txt").read_text() == "40s"
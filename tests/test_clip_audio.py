@@ -0,0 +1,63 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import clip_audio
+from mimesis.asr import ASRBackend
+
+CLIPS = {
+    "outro": [{"start": 90, "end": 95}],
+    "intro": [{"start": 0, "end": 4}, {"start": 30, "end": 33}],
+}
+
+
+def test_clip_ranges_come_back_in_source_order():
+    assert clip_audio.iter_clip_ranges(CLIPS) == [
+        ("intro", 0, 0, 4),
+        ("intro", 1, 30, 33),
+        ("outro", 0, 90, 95),
+    ]
+
+
+def test_all_clips_are_transcribed_from_one_slice_pass(monkeypatch):
+    decodes = []
+
+    def fake_slice(video_path, clips):
+        decodes.append(video_path)
+        return {(name, index): [start] for name, index, start, _ in clip_audio.iter_clip_ranges(clips)}
+
+    class EchoBackend(ASRBackend):
+        name = "echo"
+
+        def transcribe(self, audio, **options):
+            if audio == [30]:
+                raise RuntimeError("request failed")
+            return {"text": f"at {audio[0]}"}
+
+    monkeypatch.setattr(clip_audio, "slice_clip_audio", fake_slice)
+    texts = clip_audio.transcribe_clips("talk.mp4", CLIPS, backend=EchoBackend())
+    assert decodes == ["talk.mp4"]
+    assert texts == {("intro", 0): "at 0", ("intro", 1): "", ("outro", 0): "at 90"}
+
+
+def test_whisper_batches_only_clips_that_fit_one_window(monkeypatch):
+    from mimesis import batch
+    from mimesis.asr import WhisperBackend
+
+    short, long = [0.0] * (clip_audio.SAMPLE_RATE * 5), [0.0] * (clip_audio.SAMPLE_RATE * 45)
+    monkeypatch.setattr(clip_audio, "slice_clip_audio",
+                        lambda video_path, clips: {("intro", 0): short, ("talk", 0): long, ("outro", 0): short})
+    batched, single = [], []
+
+    def fake_batch(audios, model_name, quantize=None):
+        batched.append(len(audios))
+        return [{"text": " short "} for _ in audios]
+
+    monkeypatch.setattr(batch, "transcribe_batch", fake_batch)
+    monkeypatch.setattr(WhisperBackend, "transcribe", lambda self, audio: single.append(len(audio)) or {"text": " long"})
+
+    texts = clip_audio.transcribe_clips("talk.mp4", {}, backend=WhisperBackend("tiny"))
+    assert texts == {("intro", 0): "short", ("talk", 0): "long", ("outro", 0): "short"}
+    assert list(texts) == [("intro", 0), ("talk", 0), ("outro", 0)]
+    assert batched == [2] and single == [len(long)]
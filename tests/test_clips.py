@@ -0,0 +1,65 @@
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import clips, keyframes, smartcut
+from mimesis.clips import ffmpeg_clip_command, process_clips_ffmpeg, render_parallel, thread_budget
+
+
+def test_thread_budget_splits_cores_between_jobs():
+    assert thread_budget(10, total_threads=16, min_threads=4) == (4, 4)
+    assert thread_budget(2, total_threads=16, min_threads=2) == (2, 8)
+    assert thread_budget(10, total_threads=16, max_jobs=3) == (3, 5)
+    assert thread_budget(5, total_threads=1) == (1, 1)
+
+
+def test_render_parallel_keeps_order_and_reports_failures():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+    seen = []
+
+    def runner(argv, check, capture_output):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            seen.append(argv)
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        if argv[-1] == "b.mp4":
+            raise subprocess.CalledProcessError(1, argv, stderr=b"header\nInvalid argument")
+
+    codecs = {"video_codec": "libx264", "audio_codec": "aac"}
+    commands = [(ffmpeg_clip_command("in.mp4", i, i + 1, out, codecs), out) for i, out in enumerate(["a.mp4", "b.mp4", "c.mp4", "d.mp4"])]
+    results = render_parallel(commands, total_threads=4, min_threads=2, runner=runner)
+
+    assert [r["output"] for r in results] == ["a.mp4", "b.mp4", "c.mp4", "d.mp4"]
+    assert [r["ok"] for r in results] == [True, False, True, True]
+    assert results[1]["error"] == "Invalid argument"
+    assert peak[0] == 2
+    assert all(argv[argv.index("-threads") + 1] == "2" for argv in seen)
+
+
+def test_text_free_clips_are_reencoded_without_a_keyframe_index(tmp_path, monkeypatch):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"x")
+    monkeypatch.setattr(smartcut, "can_smart_cut", lambda path: True)
+    monkeypatch.setattr(keyframes, "get_index", lambda path: None)
+    queued = []
+
+    def fake_render(commands, total_threads=None, max_jobs=None):
+        queued.extend(commands)
+        return [{"output": output, "ok": True, "error": None, "seconds": 0.0} for _, output in commands]
+
+    monkeypatch.setattr(clips, "render_parallel", fake_render)
+    result = process_clips_ffmpeg(
+        {"input_video_path": str(source), "download_path": str(tmp_path), "filtergraph": False}, [(1.0, 3.0, "")]
+    )
+
+    assert result["failures"] == {}
+    argv, output = queued[0]
+    assert isinstance(argv, list) and argv[0] == "ffmpeg" and output == str(tmp_path / "clip_1.mp4")
@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import smartcut
+from mimesis.filtergraph import build_command, extract_clips, outputs_for_memory, plan_groups
+
+CODECS = {"video_codec": "libx264", "audio_codec": "aac"}
+
+
+def test_plan_groups_splits_on_count_and_gap():
+    clips = [(500, 510), (0, 5), (10, 20), (30, 40), (45, 50)]
+    assert plan_groups(clips, max_outputs=3, max_gap=60) == [[1, 2, 3], [4], [0]]
+    assert plan_groups(clips, max_outputs=8, max_gap=1000) == [[1, 2, 3, 4, 0]]
+
+
+def test_outputs_for_memory_scales_with_frame_size():
+    assert outputs_for_memory(1920, 1080, memory_mb=1024) == 5
+    assert outputs_for_memory(1920, 1080, memory_mb=1) == 1
+
+
+def test_build_command_splits_one_decode_into_trimmed_outputs():
+    argv = build_command("in.mp4", [(12.0, 15.0, "", "a.mp4"), (20.0, 22.0, "Hi: there", "b.mp4")], CODECS,
+                         seek_to=10.0, threads=2)
+    graph = argv[argv.index("-filter_complex") + 1]
+    assert argv[argv.index("-ss") + 1] == "10.000000" and argv[argv.index("-t") + 1] == "12.000000"
+    assert "[0:v]split=2[v0][v1]" in graph and "[0:a]asplit=2[a0][a1]" in graph
+    assert "[v0]trim=start=2.000000:end=5.000000,setpts=PTS-STARTPTS[vo0]" in graph
+    assert "drawtext=text='Hi\\: there'" in graph
+    assert argv.count("-i") == 1 and argv[-1] == "b.mp4" and "a.mp4" in argv
+
+
+def test_extract_clips_runs_one_command_per_group():
+    calls = []
+    clips = [(0, 5, "", "a.mp4"), (600, 610, "x", "c.mp4"), (8, 12, "", "b.mp4")]
+    results = extract_clips("missing.mp4", clips, CODECS, max_gap=60, total_threads=4,
+                            runner=lambda argv, **kw: calls.append(argv))
+    assert len(calls) == 2
+    assert [r["output"] for r in results] == ["a.mp4", "c.mp4", "b.mp4"]
+    assert all(r["ok"] for r in results)
+
+
+def test_extract_clips_caps_group_size_by_probed_frame_memory(monkeypatch):
+    monkeypatch.setattr(smartcut, "probe_video_stream", lambda path: {"width": 1920, "height": 1080})
+    calls = []
+    clips = [(i, i + 1, "", f"{i}.mp4") for i in range(8)]
+    extract_clips("in.mp4", clips, CODECS, max_outputs=8, memory_mb=1024, total_threads=4,
+                  runner=lambda argv, **kw: calls.append(argv))
+    # 1080p encoders fit five to a 1 GB budget
+    assert sorted(argv.count("-map") // 2 for argv in calls) == [3, 5]
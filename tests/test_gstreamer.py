@@ -0,0 +1,82 @@
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import gstreamer
+from mimesis.clips import process_clips_gstreamer
+from mimesis.gstreamer import GstClipRenderer, overlay_color
+
+
+def test_overlay_color_accepts_names_and_hex():
+    assert overlay_color("white") == 0xFFFFFFFF
+    assert overlay_color("#ff8800") == 0xFFFF8800
+    assert overlay_color("#80ff8800") == 0x80FF8800
+    with pytest.raises(ValueError):
+        overlay_color("not-a-color")
+
+
+def test_missing_pygobject_raises_runtime_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(gstreamer, "Gst", None)
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"")
+    with pytest.raises(RuntimeError, match="PyGObject"):
+        process_clips_gstreamer({"input_video_path": str(video), "download_path": str(tmp_path)}, [(0, 1, "")])
+
+
+class FakeBus:
+    def __init__(self, message=None):
+        self.message = message
+        self.timeouts = []
+
+    def pop_filtered(self, types):
+        return None
+
+    def timed_pop_filtered(self, timeout, types):
+        self.timeouts.append(timeout)
+        return self.message
+
+
+class FakeSource:
+    def __init__(self, levels):
+        self.levels = list(levels)
+        self.pushed = []
+
+    def get_property(self, name):
+        if name == "max-bytes":
+            return 100
+        return self.levels.pop(0) if len(self.levels) > 1 else self.levels[0]
+
+    def emit(self, signal, buffer):
+        self.pushed.append(buffer)
+
+
+def _renderer(monkeypatch, timeout):
+    fake_gst = types.SimpleNamespace(SECOND=10 ** 9, MessageType=types.SimpleNamespace(EOS=1, ERROR=2))
+    monkeypatch.setattr(gstreamer, "Gst", fake_gst)
+    renderer = GstClipRenderer.__new__(GstClipRenderer)
+    renderer.encode_timeout = timeout
+    return renderer
+
+
+def test_push_waits_for_room_in_the_encoder_queue(monkeypatch):
+    renderer = _renderer(monkeypatch, 5)
+    source = FakeSource([150, 120, 40])
+    encoder = types.SimpleNamespace(get_bus=lambda: FakeBus())
+    renderer._push(source, "frame", encoder)
+    assert source.pushed == ["frame"] and source.levels == [40]
+
+
+def test_stalled_encoder_fails_the_clip(monkeypatch):
+    renderer = _renderer(monkeypatch, 0.05)
+    encoder = types.SimpleNamespace(get_bus=lambda: FakeBus())
+    with pytest.raises(RuntimeError, match="no progress"):
+        renderer._push(FakeSource([150]), "frame", encoder)
+
+    bus = FakeBus(message=None)
+    with pytest.raises(RuntimeError, match="did not finish"):
+        renderer._wait_for_eos(types.SimpleNamespace(get_bus=lambda: bus), "out.mp4")
+    assert bus.timeouts == [int(0.05 * 10 ** 9)]
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import keyframes
+from mimesis.keyframes import KeyframeIndex, KeyframeIndexStore, parse_packets
+
+PACKETS = """0.000000,48,K__
+0.040000,9120,___
+2.002000,88211,K__
+4.004000,171003,K_
+N/A,N/A,___
+"""
+
+
+def test_parse_packets_keeps_keyframes_only():
+    times, offsets = parse_packets(PACKETS)
+    assert times == [0.0, 2.002, 4.004]
+    assert offsets == [48, 88211, 171003]
+
+
+def test_seek_args_jump_to_previous_keyframe_then_trim():
+    index = KeyframeIndex([0.0, 2.002, 4.004], [48, 88211, 171003])
+    assert index.previous(3.5) == (2.002, 88211)
+    assert index.previous(4.004) == (4.004, 171003)
+    assert index.next(2.5) == (4.004, 171003)
+    assert index.seek_args("in.mp4", 3.5, 5.0) == ["-ss", "2.002000", "-i", "in.mp4", "-ss", "1.498000", "-t", "1.500000"]
+    assert index.seek_args("in.mp4", 1.0) == ["-i", "in.mp4", "-ss", "1.000000"]
+
+
+def test_store_probes_each_video_once(tmp_path, monkeypatch):
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"not really a video")
+    calls = []
+    monkeypatch.setattr(keyframes, "probe_keyframes", lambda path: calls.append(path) or parse_packets(PACKETS))
+
+    first = KeyframeIndexStore(str(tmp_path / "index")).get(str(video))
+    second = KeyframeIndexStore(str(tmp_path / "index")).get(str(video))
+    assert calls == [str(video)]
+    assert first.times == second.times == [0.0, 2.002, 4.004]
+
+
+def test_times_are_relative_to_the_container_start():
+    times, _ = parse_packets("1.400000,564,K__\n3.400000,90000,K__\n", start_time=1.4)
+    assert times == [0.0, 2.0]
+
+
+def test_stale_index_versions_are_reprobed(tmp_path, monkeypatch):
+    video = tmp_path / "talk.ts"
+    video.write_bytes(b"not really a video")
+    store = KeyframeIndexStore(str(tmp_path / "index"))
+    path = Path(store.path_for(str(video)))
+    path.parent.mkdir()
+    path.write_text('{"times": [1.4, 3.4], "offsets": [564, 90000]}')
+    monkeypatch.setattr(keyframes, "probe_keyframes", lambda path: ([0.0, 2.0], [564, 90000]))
+
+    assert store.get(str(video)).times == [0.0, 2.0]
+    assert '"version": 2' in path.read_text()
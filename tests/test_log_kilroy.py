@@ -5,13 +5,20 @@ import types
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
 
-# Stub heavy dependencies so mimesis.video imports cleanly
-sys.modules.setdefault("yaml", types.SimpleNamespace())
-sys.modules.setdefault(
+# Stub heavy dependencies that are not installed so mimesis.video imports cleanly
+def _stub_missing(name, stub):
+    try:
+        __import__(name)
+    except ImportError:
+        sys.modules.setdefault(name, stub)
+
+
+_stub_missing("yaml", types.SimpleNamespace())
+_stub_missing(
     "speech_recognition",
     types.SimpleNamespace(Recognizer=object, AudioFile=object),
 )
-sys.modules.setdefault(
+_stub_missing(
     "moviepy.editor",
     types.SimpleNamespace(
         VideoFileClip=object,
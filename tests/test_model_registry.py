@@ -0,0 +1,99 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.model_registry import ModelRegistry, _estimate_nbytes
+
+MB = 1024 * 1024
+
+
+def _registry(budget_mb, sizes):
+    loads = []
+
+    def loader(name, device=None, **options):
+        loads.append((name, device, options))
+        return f"model-{name}"
+
+    registry = ModelRegistry(
+        memory_budget_mb=budget_mb,
+        loader=loader,
+        sizer=lambda model, name: sizes[name] * MB,
+    )
+    return registry, loads
+
+
+def test_models_are_loaded_once_per_key():
+    registry, loads = _registry(1000, {"base": 300})
+    assert registry.get("base") == "model-base"
+    assert registry.get("base") == "model-base"
+    registry.get("base", device="cpu")
+    assert len(loads) == 2
+
+
+def test_least_recently_used_model_is_evicted_over_budget():
+    registry, loads = _registry(1000, {"tiny": 200, "base": 300, "small": 600})
+    registry.get("tiny")
+    registry.get("base")
+    registry.get("tiny")
+    registry.get("small")
+    names = [key[0] for key in registry.keys()]
+    assert names == ["tiny", "small"]
+    assert registry.memory_in_use == 800 * MB
+
+
+def test_quantized_models_are_cached_separately():
+    from mimesis import model_registry
+
+    registry, loads = _registry(1000, {"base": 300})
+    model_registry._registry = registry
+    try:
+        model_registry.get_whisper_model("base", quantize="int8")
+        model_registry.get_whisper_model("base", quantize="int8")
+        model_registry.get_whisper_model("base", quantize=False)
+    finally:
+        model_registry._registry = None
+    assert [options for _, _, options in loads] == [{"quantize": "int8"}, {}]
+
+
+class FakeTensor:
+    def __init__(self, ptr, numel, element_size):
+        self.ptr, self._numel, self._element_size = ptr, numel, element_size
+
+    def data_ptr(self):
+        return self.ptr
+
+    def numel(self):
+        return self._numel
+
+    def element_size(self):
+        return self._element_size
+
+
+class FakeQuantizedModel:
+    """A dynamically quantized model: int8 weights are packed, only float biases/norms are parameters."""
+
+    def __init__(self):
+        self.norm = FakeTensor(1, 1000, 4)
+        self.weight = FakeTensor(2, 1_000_000, 1)
+        self.bias = FakeTensor(3, 1000, 4)
+        self.positions = FakeTensor(4, 5000, 4)
+
+    def parameters(self):
+        return [self.norm]
+
+    def buffers(self):
+        return [self.positions]
+
+    def state_dict(self):
+        return {
+            "ln.weight": self.norm,
+            "fc._packed_params.dtype": "qint8",
+            "fc._packed_params._packed_params": (self.weight, self.bias),
+            "fc.scale": 0.1,
+            "positions": self.positions,
+        }
+
+
+def test_size_estimate_counts_packed_quantized_weights():
+    assert _estimate_nbytes(FakeQuantizedModel(), "base") == 4000 + 1_000_000 + 4000 + 20000
@@ -0,0 +1,52 @@
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import audio, ranges
+from mimesis.ranges import RangeExtractor, extract_range_to_wav
+
+
+def test_fallback_command_seeks_before_input(monkeypatch):
+    calls = []
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kwargs: calls.append(cmd))
+
+    assert extract_range_to_wav("talk.mp4", 5400.0, 5412.5, "out.wav") == "out.wav"
+    cmd = calls[0]
+    assert cmd.index("-ss") < cmd.index("-i")
+    assert cmd[cmd.index("-ss") + 1] == "5400.000" and cmd[cmd.index("-t") + 1] == "12.500"
+    assert cmd[-7:] == ["-ac", "1", "-ar", "16000", "-acodec", "pcm_s16le", "out.wav"]
+
+    extract_range_to_wav("talk.mp4", 0, None, "all.wav")
+    assert "-ss" not in calls[1] and "-t" not in calls[1]
+
+
+def test_fallback_command_failure_is_a_runtime_error(monkeypatch):
+    def fail(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr=b"No such file")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    with pytest.raises(RuntimeError, match="No such file"):
+        extract_range_to_wav("missing.mp4", 1.0, 2.0, "out.wav")
+
+
+def test_ranges_are_extracted_in_file_order_and_returned_in_input_order(monkeypatch):
+    seen = []
+    monkeypatch.setattr(audio, "load_audio", lambda path, start, end, sample_rate: seen.append(start) or (start, end))
+
+    with RangeExtractor("talk.mp4", use_pyav=False) as extractor:
+        assert extractor.backend == "ffmpeg"
+        results = extractor.extract_many([(60.0, 61.0), (5.0, 6.0), (30.0, 31.0)])
+
+    assert seen == [5.0, 30.0, 60.0]
+    assert results == [(60.0, 61.0), (5.0, 6.0), (30.0, 31.0)]
+
+
+def test_requesting_pyav_without_it_installed_fails(monkeypatch):
+    monkeypatch.setattr(ranges, "av", None)
+    with pytest.raises(RuntimeError, match="PyAV"):
+        RangeExtractor("talk.mp4", use_pyav=True)
+    assert RangeExtractor("talk.mp4").backend == "ffmpeg"
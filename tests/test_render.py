@@ -0,0 +1,33 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import render
+from mimesis.render import caption_style, clip_jobs, drawtext_for, render_clips
+
+
+def test_caption_style_prefers_earlier_configs_then_defaults():
+    style = caption_style({"font_size": 64, "text_halign": "left"}, {"font_size": 12, "text_color": "red"})
+    assert style == {"font": "Arial", "font_size": 64, "text_color": "red", "text_halign": "left",
+                     "text_valign": "bottom"}
+
+
+def test_drawtext_matches_textclip_position(monkeypatch):
+    monkeypatch.setattr(render, "resolve_font_file", lambda font: "/fonts/arial.ttf")
+    options = drawtext_for(caption_style({"text_halign": "left", "text_valign": "center"}))
+    assert options == "fontfile='/fonts/arial.ttf':fontsize=48:fontcolor=white:x=10:y=(h-text_h)/2"
+
+
+def test_render_clips_captions_each_clip_from_the_clip_dict(monkeypatch):
+    monkeypatch.setattr(render, "resolve_font_file", lambda font: None)
+    clips = {"intro": [{"start": 1, "end": 4}], "quote": [{"start": 30, "end": 35}]}
+    jobs = clip_jobs(clips, {("intro", 0): " Hello ", ("quote", 0): ""}, "out")
+    assert jobs == [(1, 4, "Hello", "out/intro.mp4"), (30, 35, "", "out/quote.mp4")]
+
+    calls = []
+    results = render_clips("missing.mp4", jobs, caption_style(), filtergraph=False, total_threads=2,
+                           runner=lambda argv, **kw: calls.append(argv))
+    assert [r["ok"] for r in results] == [True, True]
+    assert any("drawtext=text='Hello':font='Arial'" in arg for arg in calls[0])
+    assert "-vf" not in calls[1]
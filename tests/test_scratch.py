@@ -0,0 +1,76 @@
+from pathlib import Path
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.scratch import ScratchSpace
+
+
+def test_files_go_to_ram_until_the_quota_then_to_disk(tmp_path):
+    ram, disk = tmp_path / "shm", tmp_path / "disk"
+    ram.mkdir()
+    scratch = ScratchSpace(str(ram), quota_mb=1, disk_dir=str(disk))
+
+    with scratch.file(".wav", size_hint=700 * 1024) as first:
+        with scratch.file(".wav", size_hint=700 * 1024) as second:
+            assert first.startswith(str(ram)) and first.endswith(".wav")
+            assert second.startswith(str(disk))
+    assert not os.path.exists(first) and not os.path.exists(second)
+
+    with scratch.file(size_hint=700 * 1024) as again:
+        assert again.startswith(str(ram))
+
+
+def test_requests_without_a_size_hint_go_to_disk(tmp_path):
+    ram, disk = tmp_path / "shm", tmp_path / "disk"
+    ram.mkdir()
+    scratch = ScratchSpace(str(ram), quota_mb=1, disk_dir=str(disk))
+    with scratch.file(".wav") as path, scratch.directory() as directory:
+        assert path.startswith(str(disk)) and directory.startswith(str(disk))
+
+
+def test_files_are_removed_when_the_body_raises(tmp_path):
+    scratch = ScratchSpace(str(tmp_path), quota_mb=1)
+    try:
+        with scratch.directory() as path:
+            Path(path, "clip.mp4").write_bytes(b"partial")
+            raise RuntimeError("encoder crashed")
+    except RuntimeError:
+        pass
+    assert not os.path.exists(path)
+
+
+def test_sweep_removes_sessions_of_dead_processes_only(tmp_path):
+    scratch = ScratchSpace(str(tmp_path), quota_mb=1, disk_dir=str(tmp_path / "disk"))
+    root = Path(scratch.ram_root)
+    dead = root / "999999999-deadbeef"
+    alive = root / f"{os.getppid()}-cafe0000"
+    for path in (dead, alive):
+        path.mkdir(parents=True)
+        (path / "orphan.wav").write_bytes(b"x")
+
+    assert scratch.sweep_orphans() == [str(dead)]
+    assert alive.exists() and not dead.exists()
+
+
+def test_roots_are_private_per_user(tmp_path):
+    ram = tmp_path / "shm"
+    ram.mkdir()
+    scratch = ScratchSpace(str(ram), quota_mb=1, disk_dir=str(tmp_path / "disk"))
+    with scratch.file(size_hint=1024) as path:
+        root = Path(scratch.ram_root)
+        assert root.name == f"mimesis-scratch-{os.getuid()}"
+        assert Path(path).parent.parent == root
+        assert root.stat().st_mode & 0o777 == 0o700
+
+
+def test_unusable_ram_root_falls_back_to_disk(tmp_path):
+    ram, disk = tmp_path / "shm", tmp_path / "disk"
+    ram.mkdir()
+    scratch = ScratchSpace(str(ram), quota_mb=1, disk_dir=str(disk))
+    # Something that is not our directory already sits where the root goes
+    Path(scratch.ram_root).write_bytes(b"")
+    with scratch.file(".wav", size_hint=1024) as path, scratch.directory(size_hint=1024) as directory:
+        assert path.startswith(str(disk)) and directory.startswith(str(disk))
+    assert scratch._reserved == 0
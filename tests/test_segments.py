@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.segments import merge_results, minute_buckets, sentence_chunks, write_srt, write_vtt
+
+SEGMENTS = [
+    {"start": 0.0, "end": 4.5, "text": " Hello there."},
+    {"start": 58.0, "end": 62.25, "text": " This spans the minute."},
+    {"start": 121.0, "end": 124.0, "text": " Last words!"},
+]
+
+
+def test_minute_buckets_match_legacy_keys():
+    buckets = minute_buckets(SEGMENTS, 125.4)
+    assert buckets == {
+        "0-60s": "Hello there. This spans the minute.",
+        "60-120s": "",
+        "120-125s": "Last words!",
+    }
+
+
+def test_sentence_chunks_carry_segment_times():
+    chunks = sentence_chunks(SEGMENTS)
+    assert [c["text"] for c in chunks] == [
+        "Hello there.",
+        "This spans the minute.",
+        "Last words!",
+    ]
+    assert chunks[1]["start"] == 58.0
+    assert chunks[1]["end"] == 62.25
+
+
+def test_srt_and_vtt_timestamps(tmp_path):
+    srt = tmp_path / "out.srt"
+    vtt = tmp_path / "out.vtt"
+    write_srt(SEGMENTS, srt)
+    write_vtt(SEGMENTS, vtt)
+    assert "2\n00:00:58,000 --> 00:01:02,250\nThis spans the minute.\n" in srt.read_text()
+    assert vtt.read_text().startswith("WEBVTT\n\n00:00:00.000 --> 00:00:04.500\n")
+
+
+def test_merge_results_moves_chunk_segments_onto_source_timeline():
+    chunks = [
+        {"text": " One.", "segments": [{"id": 0, "start": 1.0, "end": 2.0, "text": " One."}], "language": "en"},
+        {"text": " Two.", "segments": [{"id": 0, "start": 0.5, "end": 3.0, "text": " Two."}], "language": "en"},
+    ]
+    merged = merge_results(chunks, [0.0, 60.0])
+    assert merged["text"] == " One. Two."
+    assert [(s["id"], s["start"], s["end"]) for s in merged["segments"]] == [(0, 1.0, 2.0), (1, 60.5, 63.0)]
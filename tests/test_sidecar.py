@@ -0,0 +1,48 @@
+from pathlib import Path
+import os
+import sys
+import types
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import sidecar
+from mimesis.sidecar import DEFAULT_DIR, AudioSidecarStore, SIDECAR_DIRNAME, content_key
+
+
+def test_sidecars_are_named_by_content_next_to_the_video(tmp_path):
+    first = tmp_path / "a.mp4"
+    copy = tmp_path / "copy.mp4"
+    first.write_bytes(b"same bytes")
+    copy.write_bytes(b"same bytes")
+    assert content_key(str(first)) == content_key(str(copy))
+
+    first.write_bytes(b"edited bytes")
+    assert content_key(str(first)) != content_key(str(copy))
+
+    store = AudioSidecarStore()
+    assert store.path_for(str(copy)) == str(tmp_path / SIDECAR_DIRNAME / f"{content_key(str(copy))}.npy")
+
+
+def test_least_recently_used_sidecars_are_evicted(tmp_path):
+    store = AudioSidecarStore(str(tmp_path), max_mb=0.01)
+    for age, name in enumerate(["old", "mid", "new"]):
+        path = tmp_path / f"{name}.npy"
+        path.write_bytes(b"x" * 4000)
+        os.utime(path, (age, age))
+
+    store.evict(str(tmp_path), keep=str(tmp_path / "old.npy"))
+    assert sorted(os.listdir(tmp_path)) == ["new.npy", "old.npy"]
+
+
+def test_configured_store_shares_one_capped_directory(tmp_path, monkeypatch):
+    config = types.ModuleType("mimesis.video")
+    config.load_app_config = lambda: {"audio_sidecar": {"dir": None, "max_mb": 1}}
+    monkeypatch.setitem(sys.modules, "mimesis.video", config)
+    monkeypatch.setattr(sidecar, "_store", None)
+    store = sidecar.get_store()
+    assert store.directory == os.path.expanduser(DEFAULT_DIR)
+    first, second = tmp_path / "a" / "talk.mp4", tmp_path / "b" / "talk.mp4"
+    for video, content in ((first, b"one"), (second, b"two")):
+        video.parent.mkdir()
+        video.write_bytes(content)
+    assert os.path.dirname(store.path_for(str(first))) == os.path.dirname(store.path_for(str(second)))
@@ -0,0 +1,78 @@
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import smartcut
+from mimesis.keyframes import KeyframeIndex
+from mimesis.smartcut import SCRATCH_MARGIN_BYTES, plan_smart_cut, scratch_bytes, smart_cut
+
+KEYFRAMES = [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def test_only_partial_gops_are_encoded():
+    assert plan_smart_cut(KEYFRAMES, 1.5, 7.25) == [("encode", 1.5, 2.0), ("copy", 2.0, 6.0), ("encode", 6.0, 7.25)]
+    assert plan_smart_cut(KEYFRAMES, 2.0, 6.0) == [("copy", 2.0, 6.0)]
+    assert plan_smart_cut(KEYFRAMES, 2.5, 5.0) == [("encode", 2.5, 5.0)]
+
+
+def test_smart_cut_copies_middle_and_joins_with_concat(tmp_path, monkeypatch):
+    monkeypatch.setattr(smartcut, "probe_video_stream",
+                        lambda path: {"codec_name": "h264", "profile": "Main", "level": 31, "pix_fmt": "yuv420p",
+                                      "width": 640, "height": 360, "time_base": "1/15360"})
+    calls = []
+
+    def runner(argv, check=False, capture_output=False):
+        calls.append(argv)
+        Path(argv[-1]).write_bytes(b"x")
+        return subprocess.CompletedProcess(argv, 0)
+
+    output = tmp_path / "clip.mp4"
+    smart_cut("in.mp4", 1.5, 7.25, str(output), index=KeyframeIndex(KEYFRAMES), runner=runner)
+
+    head, middle, tail, audio, join = calls
+    assert head[head.index("-c:v") + 1] == "libx264" and head[head.index("-pix_fmt") + 1] == "yuv420p"
+    assert middle[middle.index("-c:v") + 1] == "copy" and middle[middle.index("-ss") + 1] == "2.000000"
+    # Edges match the copied GOPs and carry their parameter sets in-band
+    for edge in (head, tail):
+        assert edge[edge.index("-c:v") + 1] == "libx264"
+        assert edge[edge.index("-profile:v") + 1] == "main" and edge[edge.index("-level:v") + 1] == "3.1"
+        assert edge[edge.index("-x264-params") + 1] == "repeat-headers=1"
+    assert "-vn" in audio
+    assert join[join.index("-f") + 1] == "concat" and join[-1] == str(output)
+    assert join[join.index("-c") + 1] == "copy" and join[join.index("-video_track_timescale") + 1] == "15360"
+
+
+def test_scratch_hint_covers_the_copied_gops(tmp_path):
+    index = KeyframeIndex(KEYFRAMES, [0, 1000, 5000, 9000, 12000])
+    pieces = plan_smart_cut(KEYFRAMES, 1.5, 7.25)
+    assert scratch_bytes(index, pieces) == 8000 + SCRATCH_MARGIN_BYTES
+
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"x" * 800)
+    assert scratch_bytes(KeyframeIndex(KEYFRAMES), pieces, str(source)) == 400 + SCRATCH_MARGIN_BYTES
+
+
+@pytest.mark.skipif(not (shutil.which("ffmpeg") and shutil.which("ffprobe")), reason="needs ffmpeg and ffprobe")
+def test_smart_cut_output_decodes_as_one_stream(tmp_path):
+    source, output = tmp_path / "in.mp4", tmp_path / "clip.mp4"
+    # Main profile with a keyframe every 2s, so libx264 defaults (High) would not match
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-f", "lavfi", "-i", "testsrc=size=320x240:rate=25:duration=10",
+         "-c:v", "libx264", "-profile:v", "main", "-pix_fmt", "yuv420p", "-g", "50", "-sc_threshold", "0",
+         "-video_track_timescale", "15360", str(source)],
+        check=True, capture_output=True,
+    )
+    pieces = smart_cut(str(source), 1.3, 7.5, str(output), index=KeyframeIndex(KEYFRAMES))
+    assert [kind for kind, _, _ in pieces] == ["encode", "copy", "encode"]
+
+    decoded = subprocess.run(["ffmpeg", "-nostdin", "-v", "error", "-i", str(output), "-f", "framemd5", "-"],
+                             check=True, capture_output=True, text=True)
+    assert decoded.stderr == ""
+    assert len([line for line in decoded.stdout.splitlines() if not line.startswith("#")]) == 155
+    probed = smartcut.probe_video_stream(str(output))
+    assert probed["profile"] == "Main" and probed["time_base"] == "1/15360"
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis import audio
+from mimesis.streaming import StreamingTranscriptWriter, iter_pcm_blocks
+
+
+def test_segments_are_on_disk_before_close(tmp_path):
+    stem = str(tmp_path / "live")
+    writer = StreamingTranscriptWriter(stem)
+    writer.add({"start": 0.0, "end": 2.5, "text": " First."})
+    writer.add({"start": 2.5, "end": 61.0, "text": " Second."})
+
+    srt = Path(f"{stem}.srt").read_text()
+    assert srt == (
+        "1\n00:00:00,000 --> 00:00:02,500\nFirst.\n\n"
+        "2\n00:00:02,500 --> 00:01:01,000\nSecond.\n\n"
+    )
+    assert Path(f"{stem}.vtt").read_text().startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\n")
+    lines = Path(f"{stem}.segments.jsonl").read_text().splitlines()
+    assert [json.loads(line)["text"] for line in lines] == [" First.", " Second."]
+
+    writer.close()
+    assert len(json.loads(Path(f"{stem}.json").read_text())) == 2
+
+
+def _fake_ffmpeg(monkeypatch, script):
+    monkeypatch.setattr(audio, "ffmpeg_pcm_command", lambda path, start, sample_rate: [sys.executable, "-c", script])
+
+
+def test_pcm_blocks_raise_when_ffmpeg_fails(monkeypatch):
+    pytest.importorskip("numpy")
+    script = "import sys; sys.stdout.buffer.write(bytes(8)); sys.stderr.write('x' * 200000 + '\\nNo such file'); sys.exit(1)"
+    _fake_ffmpeg(monkeypatch, script)
+    with pytest.raises(RuntimeError, match="No such file"):
+        list(iter_pcm_blocks("missing.mp4", 1, sample_rate=2))
+
+
+def test_pcm_blocks_stop_early_without_error(monkeypatch):
+    pytest.importorskip("numpy")
+    _fake_ffmpeg(monkeypatch, "import sys, time; sys.stdout.buffer.write(bytes(64)); sys.stdout.flush(); time.sleep(30)")
+    blocks = iter_pcm_blocks("talk.mp4", 1, sample_rate=2)
+    assert len(next(blocks)) == 2
+    blocks.close()
@@ -0,0 +1,100 @@
+from pathlib import Path
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.standin import StandinSpeechServer
+from mimesis.throttle import TokenBucket, map_throttled
+
+
+def test_token_bucket_spaces_out_requests_beyond_the_burst():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=lambda s: now.__setitem__(0, now[0] + s))
+    for _ in range(6):
+        bucket.acquire()
+    assert abs(now[0] - 2.0) < 1e-9  # 2 free, then 4 more at 2/s
+
+
+def test_map_throttled_rate_limit_and_backoff_use_the_injected_clock():
+    now, lock = [0.0], threading.Lock()
+    started, failed = [], set()
+
+    def sleep(seconds):
+        with lock:
+            now[0] += seconds
+
+    def fn(item):
+        started.append((item, now[0]))
+        if item == 2 and item not in failed:
+            failed.add(item)
+            raise ConnectionError("503")
+        return item * 10
+
+    results = map_throttled(fn, range(5), concurrency=1, rate=2, base_delay=0.0,
+                            clock=lambda: now[0], sleep=sleep)
+    assert results == [0, 10, 20, 30, 40]
+    # Two requests from the burst, then one every half second, the retry included
+    assert started == [(0, 0.0), (1, 0.0), (2, 0.5), (2, 1.0), (3, 1.5), (4, 2.0)]
+
+
+def test_concurrent_requests_retry_against_the_standin():
+    in_flight, peak, calls = [0], [0], [0]
+    lock = threading.Lock()
+    # The first four calls only return once all four are in flight together
+    all_in_flight = threading.Barrier(4, timeout=5)
+
+    def post(item):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            calls[0] += 1
+            first_wave = calls[0] <= 4
+        try:
+            if first_wave:
+                all_in_flight.wait()
+            request = urllib.request.Request(server.url, data=str(item).encode(), headers={"Content-Type": "audio/x-flac"})
+            return urllib.request.urlopen(request, timeout=5).read().decode()
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    finished = []
+    with StandinSpeechServer(transcript="ok", fail_first=2) as server:
+        results = map_throttled(post, range(8), concurrency=4, retries=3,
+                                retry_on=(urllib.error.HTTPError,), sleep=lambda seconds: None,
+                                on_result=lambda index, result: finished.append(index))
+
+    assert all('"transcript": "ok"' in result for result in results)
+    assert sorted(finished) == list(range(8))
+    assert len(server.requests) == 10  # two 503s were retried
+    assert peak[0] == 4
+
+
+def test_transcribe_by_minute_retries_and_rate_limits_against_the_standin(tmp_path, monkeypatch):
+    for module in ("numpy", "speech_recognition", "moviepy", "requests", "bs4"):
+        pytest.importorskip(module)
+    import numpy as np
+    from mimesis import chunking, transcription
+    from mimesis.asr import SpeechRecognitionBackend
+
+    ranges = [(0.0, 1.0), (1.0, 2.0), (2.0, 3.0), (3.0, 4.0)]
+    monkeypatch.setattr(transcription, "load_range", lambda path: np.zeros(4 * 16000, dtype=np.float32))
+    monkeypatch.setattr(chunking, "plan_chunks", lambda audio, sample_rate, **options: ranges)
+    monkeypatch.setattr(transcription, "_google_settings",
+                        lambda: {"concurrency": 4, "rate": 2, "retries": 2, "base_delay": 0.01})
+
+    with StandinSpeechServer(transcript="hello", fail_first=1) as server:
+        backend = SpeechRecognitionBackend(endpoint=server.url)
+        transcript = transcription.transcribe_video_by_minute("talk.mp4", str(tmp_path), backend=backend)
+
+    assert transcript.count("hello") == len(ranges)
+    assert "ERROR" not in transcript
+    assert len(server.requests) == len(ranges) + 1  # the 503 was retried
+    # A bucket of 2 at 2/s lets two requests through at once, then one per half second
+    times = [request["time"] for request in server.requests]
+    assert times[-1] - times[0] >= (len(times) - 2) / 2 - 0.05
@@ -0,0 +1,35 @@
+from array import array
+from pathlib import Path
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.transcript_cache import TranscriptCache
+
+
+def test_key_follows_audio_content_and_decode_options(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    samples = [0.0, 0.25, -0.5, 1.0]
+    key = cache.make_key(array("f", samples), "base", task="transcribe", verbose=False)
+    assert key == cache.make_key(array("f", samples), "base", task="transcribe")
+    assert key != cache.make_key(array("f", samples), "base", task="translate")
+    assert key != cache.make_key(array("f", samples), "small", task="transcribe")
+    assert key != cache.make_key(array("f", samples[:3]), "base", task="transcribe")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TranscriptCache(str(tmp_path), max_mb=0.01)
+    payload = {"text": "x" * 4000}
+    keys = [cache.make_key(array("f", [float(i)]), "base") for i in range(3)]
+
+    cache.put(keys[0], payload)
+    cache.put(keys[1], payload)
+    os.utime(cache._path(keys[0]), (1, 1))
+    os.utime(cache._path(keys[1]), (2, 2))
+    assert cache.get(keys[0]) == payload  # touch: keys[1] is now the oldest
+    cache.put(keys[2], payload)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == payload
+    assert cache.get(keys[2]) == payload
@@ -0,0 +1,113 @@
+from pathlib import Path
+import sys
+import threading
+import time
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.daemon import TranscriptionDaemon, daemon_running, job_status, submit_job
+
+
+def test_jobs_run_by_priority_and_report_progress(tmp_path):
+    socket_path = str(tmp_path / "whisper.sock")
+    release = threading.Event()
+    order = []
+
+    def runner(job, progress):
+        if job["path"].endswith("blocker.mp4"):
+            release.wait(5)
+        progress("transcribing", 0.5)
+        order.append(Path(job["path"]).name)
+        return {"text": f"{job.get('task')}:{Path(job['path']).name}"}
+
+    daemon = TranscriptionDaemon(socket_path, runner=runner).start()
+    try:
+        assert daemon_running(socket_path)
+        submit_job("blocker.mp4", socket_path=socket_path, wait=False)
+        low = submit_job("low.mp4", socket_path=socket_path, wait=False, priority=5)
+        submit_job("high.mp4", socket_path=socket_path, wait=False, priority=1)
+        assert job_status(low, socket_path)["state"] == "queued"
+        release.set()
+
+        events = []
+        result = submit_job(
+            "last.mp4", socket_path=socket_path, task="translate", priority=9, on_progress=events.append
+        )
+        assert result == {"text": "translate:last.mp4"}
+        assert order == ["blocker.mp4", "high.mp4", "low.mp4", "last.mp4"]
+        assert events[-1]["state"] == "done"
+        assert events[-1]["progress"] == 1.0
+    finally:
+        daemon.stop()
+    assert not daemon_running(socket_path)
+
+
+def test_artifacts_route_to_a_running_daemon(tmp_path, monkeypatch):
+    import pytest
+
+    pytest.importorskip("requests")
+    pytest.importorskip("bs4")
+    from mimesis.whisper import whisper_transcribe_artifacts
+
+    socket_path = str(tmp_path / "whisper.sock")
+    monkeypatch.setenv("MIMESIS_WHISPER_SOCKET", socket_path)
+    jobs = []
+
+    def runner(job, progress):
+        jobs.append(job)
+        return {"text": "hello", "minute": {"0-60s": "hello"}, "paths": {}}
+
+    daemon = TranscriptionDaemon(socket_path, runner=runner).start()
+    try:
+        artifacts = whisper_transcribe_artifacts("talk.mp4", model_name="tiny", formats=("txt", "srt"),
+                                                 task="translate")
+    finally:
+        daemon.stop()
+    assert artifacts["text"] == "hello"
+    assert jobs[0]["model"] == "tiny" and jobs[0]["formats"] == ["txt", "srt"] and jobs[0]["task"] == "translate"
+
+
+def test_by_minute_stays_local_when_options_need_it(monkeypatch):
+    import pytest
+
+    pytest.importorskip("requests")
+    pytest.importorskip("bs4")
+    from mimesis import sidecar, whisper
+
+    class Local(Exception):
+        pass
+
+    def load_range(*args, **kwargs):
+        raise Local()
+
+    submitted = []
+    monkeypatch.setattr(whisper, "_daemon_available", lambda: True)
+    monkeypatch.setattr(whisper, "_submit_to_daemon", lambda path, model: submitted.append(path) or {"minute": {}})
+    monkeypatch.setattr(sidecar, "load_range", load_range)
+
+    assert whisper.whisper_transcribe_video_by_minute("talk.mp4") == {}
+    for option in ({"vad": True}, {"workers": 2}, {"batched": True}, {"chunking": {"target": 20}}):
+        with pytest.raises(Local):
+            whisper.whisper_transcribe_video_by_minute("talk.mp4", **option)
+    assert submitted == ["talk.mp4"]
+
+
+def test_finished_jobs_are_dropped_after_delivery_or_ttl(tmp_path):
+    import pytest
+
+    socket_path = str(tmp_path / "whisper.sock")
+    daemon = TranscriptionDaemon(socket_path, runner=lambda job, progress: {"text": "x" * 1000}, finished_ttl=0).start()
+    try:
+        assert submit_job("waited.mp4", socket_path=socket_path) == {"text": "x" * 1000}
+        assert daemon.jobs == {}
+
+        unwaited = submit_job("unwaited.mp4", socket_path=socket_path, wait=False)
+        for _ in range(100):
+            if daemon.jobs[unwaited].finished is not None:
+                break
+            time.sleep(0.01)
+        with pytest.raises(RuntimeError, match="unknown job"):
+            job_status(unwaited, socket_path)
+        assert daemon.jobs == {}
+    finally:
+        daemon.stop()
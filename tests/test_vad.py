@@ -0,0 +1,25 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "lib"))
+
+from mimesis.vad import SpeechMap, frames_to_regions
+
+
+def test_frames_to_regions_bridges_gaps_and_drops_blips():
+    # 0.1s frames: speech 1.0-2.0, short gap, speech 2.2-3.0, lone blip at 5.0
+    flags = [False] * 60
+    for i in list(range(10, 20)) + list(range(22, 30)) + [50]:
+        flags[i] = True
+    regions = frames_to_regions(flags, 0.1, min_speech=0.25, min_silence=0.3, pad=0.1)
+    assert [(round(s, 2), round(e, 2)) for s, e in regions] == [(0.9, 3.1)]
+
+
+def test_speech_map_restores_original_timestamps():
+    speech_map = SpeechMap([(10.0, 20.0), (50.0, 55.0)], duration=60.0)
+    assert speech_map.skipped_fraction == 0.75
+    segments = speech_map.remap_segments([
+        {"start": 0.0, "end": 4.0, "text": "a"},
+        {"start": 11.0, "end": 14.0, "text": "b"},
+    ])
+    assert [(s["start"], s["end"]) for s in segments] == [(10.0, 14.0), (51.0, 54.0)]